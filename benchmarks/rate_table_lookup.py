@@ -0,0 +1,49 @@
+# Run with: PYTHONPATH=src python benchmarks/rate_table_lookup.py
+import random
+import timeit
+from datetime import datetime, UTC, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from salary_tracker.domain.sheet.models import RateTable, Rate
+
+_LOOKUPS = 100_000
+
+
+def _linear_scan(rate_table: RateTable, group_size: int, duration: timedelta) -> Decimal:
+    for rate in rate_table.rates:
+        if rate.group_size == group_size and rate.duration == duration:
+            return rate.rate
+
+    raise LookupError(group_size, duration)
+
+
+def _benchmark(group_sizes_count: int, durations_count: int) -> None:
+    group_sizes = list(range(1, group_sizes_count + 1))
+    durations = [timedelta(minutes=30 * i) for i in range(1, durations_count + 1)]
+    rate_table = RateTable(
+        uuid=uuid4(),
+        valid_from=datetime.min.replace(tzinfo=UTC),
+        valid_to=datetime.max.replace(tzinfo=UTC),
+        rates=[
+            Rate(rate=Decimal(group_size * 10 + index), group_size=group_size, duration=duration)
+            for group_size in group_sizes
+            for index, duration in enumerate(durations)
+        ]
+    )
+
+    random.seed(0)
+    keys = [(random.choice(group_sizes), random.choice(durations)) for _ in range(_LOOKUPS)]
+
+    linear = min(timeit.repeat(lambda: [_linear_scan(rate_table, *key) for key in keys], number=1, repeat=5))
+    lookup = min(timeit.repeat(lambda: [rate_table.get_salary(*key) for key in keys], number=1, repeat=5))
+
+    print(f"{group_sizes_count:>3} group sizes x {durations_count:>3} durations: "
+          f"linear scan {linear * 1e9 / _LOOKUPS:8.0f} ns/lookup, "
+          f"get_salary {lookup * 1e9 / _LOOKUPS:8.0f} ns/lookup, "
+          f"speedup {linear / lookup:5.1f}x")
+
+
+if __name__ == '__main__':
+    for grid in [(2, 2), (5, 4), (20, 10), (50, 20)]:
+        _benchmark(*grid)
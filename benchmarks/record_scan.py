@@ -0,0 +1,116 @@
+# Run with: DATABASE_URL=postgresql+asyncpg://... PYTHONPATH=src python benchmarks/record_scan.py
+# Seeds and removes its own sheet.
+import asyncio
+import random
+import time
+import tracemalloc
+from datetime import datetime, UTC, timedelta
+from os import environ
+from typing import AsyncIterator
+from uuid import uuid4
+
+from sqlalchemy import select, insert, delete, tuple_, text
+
+from salary_tracker.data.database import Database
+from salary_tracker.data.model import Base, DatabaseUser, DatabaseSheet, DatabaseSheetRecord
+from salary_tracker.data.repositories.sheet.sheet_record_repository import SheetRecordRepository
+from salary_tracker.domain.sheet.models import Record, SheetRecordFilters
+
+_RECORDS = 10_000
+_BATCH_SIZE = 1000
+_REPEAT = 5
+
+
+async def _orm_records(session, filters: SheetRecordFilters) -> AsyncIterator[Record]:
+    # the previous read path, ORM instances validated into domain models
+    query = (
+        select(DatabaseSheetRecord)
+        .filter_by(sheet_uuid=filters.sheet_uuid)
+        .order_by(DatabaseSheetRecord.happened_at, DatabaseSheetRecord.uuid)
+        .limit(_BATCH_SIZE)
+    )
+
+    batch_query = query
+    while True:
+        records = (await session.execute(batch_query)).scalars().all()
+        for record in records:
+            yield Record.model_validate(record, from_attributes=True)
+
+        if len(records) < _BATCH_SIZE:
+            return
+
+        batch_query = query.where(
+            tuple_(DatabaseSheetRecord.happened_at, DatabaseSheetRecord.uuid)
+            > tuple_(records[-1].happened_at, records[-1].uuid)
+        )
+
+
+def _core_records(session, filters: SheetRecordFilters) -> AsyncIterator[Record]:
+    return SheetRecordRepository(session=session).iter_records(filters, batch_size=_BATCH_SIZE)
+
+
+async def _scan(database: Database, scan, filters: SheetRecordFilters) -> float:
+    async with database.session() as session:
+        started_at = time.perf_counter()
+        records = [record async for record in scan(session, filters)]
+        scan_time = time.perf_counter() - started_at
+
+    assert len(records) == _RECORDS
+    return scan_time
+
+
+async def _measure(database: Database, scan, filters: SheetRecordFilters) -> tuple[float, int]:
+    scan_time = min([await _scan(database, scan, filters) for _ in range(_REPEAT)])
+
+    # traced separately, tracing slows the scan down several times
+    tracemalloc.start()
+    await _scan(database, scan, filters)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return scan_time, peak_memory
+
+
+async def _benchmark() -> None:
+    database = Database(environ["DATABASE_URL"])
+    async with database.connect() as connection:
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+        await connection.run_sync(Base.metadata.create_all)
+
+    random.seed(0)
+    user_uuid, sheet_uuid = uuid4(), uuid4()
+    async with database.session() as session:
+        session.add(DatabaseUser(uuid=user_uuid, email=f"{user_uuid}@benchmark", name="Benchmark"))
+        await session.commit()
+
+        session.add(DatabaseSheet(uuid=sheet_uuid, owner_user_uuid=user_uuid, title="Benchmark", description=""))
+        await session.commit()
+
+        await session.execute(insert(DatabaseSheetRecord), [
+            dict(uuid=uuid4(), sheet_uuid=sheet_uuid,
+                 happened_at=datetime(2015, 1, 1, tzinfo=UTC) + timedelta(minutes=random.randrange(5_000_000)),
+                 group_size=random.randrange(1, 11), duration=timedelta(minutes=30 * random.randrange(1, 9)),
+                 group_name="Benchmark", additional_info=None)
+            for _ in range(_RECORDS)
+        ])
+        await session.commit()
+
+    filters = SheetRecordFilters(sheet_uuid=sheet_uuid, datetime_from=None, datetime_to=None)
+    try:
+        for name, scan in (("orm", _orm_records), ("core", _core_records)):
+            # warms up connections and statement caches
+            await _scan(database, scan, filters)
+            scan_time, peak_memory = await _measure(database, scan, filters)
+            print(f"{name:>4}: {_RECORDS / scan_time:9.0f} records/s, {scan_time * 1e3:7.1f} ms, "
+                  f"peak {peak_memory / 2 ** 20:6.1f} MiB")
+    finally:
+        async with database.session() as session:
+            await session.execute(delete(DatabaseSheetRecord).filter_by(sheet_uuid=sheet_uuid))
+            await session.execute(delete(DatabaseSheet).filter_by(uuid=sheet_uuid))
+            await session.execute(delete(DatabaseUser).filter_by(uuid=user_uuid))
+            await session.commit()
+        await database.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(_benchmark())
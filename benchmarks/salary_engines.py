@@ -0,0 +1,159 @@
+# Run with: PYTHONPATH=src python benchmarks/salary_engines.py, needs requirements-vectorized.txt
+# Set DATABASE_URL (postgresql+asyncpg://...) to include the SQL path, it seeds and removes its own sheet.
+import asyncio
+import random
+import time
+from datetime import datetime, UTC, timedelta
+from decimal import Decimal
+from os import environ
+from uuid import uuid4
+
+from salary_tracker.domain.sheet.impl.service.vectorized_salary_service import price_record_columns
+from salary_tracker.domain.sheet.models import RateTable, Rate, RecordColumns
+from salary_tracker.domain.sheet.timeline import RateTableTimeline
+
+_SIZES = [10_000, 100_000, 1_000_000]
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_START = datetime(2015, 1, 1, tzinfo=UTC)
+_GROUP_SIZES = list(range(1, 11))
+_DURATIONS = [timedelta(minutes=30 * i) for i in range(1, 9)]
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _rate_tables() -> list[RateTable]:
+    # one rate table per year of history
+    borders = [datetime.min.replace(tzinfo=UTC)] + [datetime(year, 1, 1, tzinfo=UTC) for year in range(2016, 2025)]
+    return [
+        RateTable(
+            uuid=uuid4(),
+            valid_from=valid_from if index == 0 else valid_from + _ONE_MICROSECOND,
+            valid_to=borders[index + 1] if index + 1 < len(borders) else datetime.max.replace(tzinfo=UTC),
+            rates=[
+                Rate(rate=Decimal(group_size * 10 + duration_index + index).scaleb(-1), group_size=group_size,
+                     duration=duration)
+                for group_size in _GROUP_SIZES
+                for duration_index, duration in enumerate(_DURATIONS)
+            ]
+        ) for index, valid_from in enumerate(borders)
+    ]
+
+
+def _records(count: int) -> list[tuple[datetime, int, timedelta]]:
+    random.seed(0)
+    return [
+        (_START + timedelta(minutes=random.randrange(60 * 24 * 365 * 10)), random.choice(_GROUP_SIZES),
+         random.choice(_DURATIONS))
+        for _ in range(count)
+    ]
+
+
+def _loop(timeline: RateTableTimeline, records: list[tuple[datetime, int, timedelta]]) -> Decimal:
+    rate_tables = timeline.resolve_many([happened_at for happened_at, _, _ in records])
+    return sum(
+        (rate_table.get_salary(group_size, duration)
+         for rate_table, (_, group_size, duration) in zip(rate_tables, records)),
+        Decimal(0)
+    )
+
+
+def _timed(function, repeat: int = 3) -> tuple[float, object]:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started_at)
+
+    return min(timings), result
+
+
+async def _sql(rate_tables: list[RateTable], records: list[tuple[datetime, int, timedelta]]) -> tuple[float, Decimal]:
+    from sqlalchemy import insert, delete, text
+
+    from salary_tracker.data.database import Database
+    from salary_tracker.data.model import Base, DatabaseUser, DatabaseSheet, DatabaseSheetRateTable, \
+        DatabaseSheetRate, DatabaseSheetRecord
+    from salary_tracker.data.repositories.sheet.salary_repository import SalaryRepository
+
+    database = Database(environ["DATABASE_URL"])
+    async with database.connect() as connection:
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+        await connection.run_sync(Base.metadata.create_all)
+
+    user_uuid, sheet_uuid = uuid4(), uuid4()
+    async with database.session() as session:
+        session.add(DatabaseUser(uuid=user_uuid, email=f"{user_uuid}@benchmark", name="Benchmark"))
+        await session.commit()
+
+        session.add(DatabaseSheet(
+            uuid=sheet_uuid,
+            owner_user_uuid=user_uuid,
+            title="Benchmark",
+            description="",
+            rate_tables=[
+                DatabaseSheetRateTable(
+                    uuid=rate_table.uuid,
+                    valid_from=rate_table.valid_from,
+                    valid_to=rate_table.valid_to,
+                    rates=[
+                        DatabaseSheetRate(rate=rate.rate, group_size=rate.group_size, duration=rate.duration)
+                        for rate in rate_table.rates
+                    ]
+                ) for rate_table in rate_tables
+            ]
+        ))
+        await session.commit()
+
+        for offset in range(0, len(records), 10_000):
+            await session.execute(insert(DatabaseSheetRecord), [
+                dict(uuid=uuid4(), sheet_uuid=sheet_uuid, happened_at=happened_at, group_size=group_size,
+                     duration=duration, group_name="Benchmark", additional_info=None)
+                for happened_at, group_size, duration in records[offset:offset + 10_000]
+            ])
+        await session.execute(text("ANALYZE sheet_records"))
+        await session.commit()
+
+        try:
+            salary_repository = SalaryRepository(session=session)
+            started_at = time.perf_counter()
+            calculation = await salary_repository.get_salary(sheet_uuid, datetime.min.replace(tzinfo=UTC),
+                                                             datetime.max.replace(tzinfo=UTC))
+            return time.perf_counter() - started_at, calculation.salary
+        finally:
+            await session.execute(delete(DatabaseSheetRecord).filter_by(sheet_uuid=sheet_uuid))
+            await session.execute(delete(DatabaseSheetRate).where(
+                DatabaseSheetRate.rate_table_uuid.in_([rate_table.uuid for rate_table in rate_tables])))
+            await session.execute(delete(DatabaseSheetRateTable).filter_by(sheet_uuid=sheet_uuid))
+            await session.execute(delete(DatabaseSheet).filter_by(uuid=sheet_uuid))
+            await session.execute(delete(DatabaseUser).filter_by(uuid=user_uuid))
+            await session.commit()
+            await database.close()
+
+
+def _benchmark(count: int) -> None:
+    rate_tables = _rate_tables()
+    records = _records(count)
+    record_columns = RecordColumns(
+        happened_at=[(happened_at - _EPOCH) // _ONE_MICROSECOND for happened_at, _, _ in records],
+        group_sizes=[group_size for _, group_size, _ in records],
+        durations=[duration // _ONE_MICROSECOND for _, _, duration in records]
+    )
+
+    timeline = RateTableTimeline(rate_tables)
+    loop_time, loop_salary = _timed(lambda: _loop(timeline, records))
+    vectorized_time, summary = _timed(lambda: price_record_columns(timeline, record_columns))
+    assert summary.salary == loop_salary and summary.unpriced_records_count == 0
+
+    line = (f"{count:>9} records: loop {loop_time * 1e3:9.1f} ms, "
+            f"vectorized {vectorized_time * 1e3:7.1f} ms ({loop_time / vectorized_time:5.1f}x)")
+
+    if environ.get("DATABASE_URL"):
+        sql_time, sql_salary = asyncio.run(_sql(rate_tables, records))
+        assert sql_salary == loop_salary
+        line += f", sql {sql_time * 1e3:8.1f} ms"
+
+    print(line)
+
+
+if __name__ == '__main__':
+    for size in _SIZES:
+        _benchmark(size)
@@ -0,0 +1,68 @@
+# Run with: PYTHONPATH=src python benchmarks/token_signing.py
+import time
+from datetime import datetime, UTC, timedelta
+from uuid import uuid4
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import jwt
+
+from salary_tracker.domain.auth.impl.token.token_key_ring import TokenKeyRing
+
+_DURATION = 1.0
+_REPEAT = 3
+
+_KEYS = {
+    "RS256 (RSA 2048)": lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048),
+    "RS256 (RSA 3072)": lambda: rsa.generate_private_key(public_exponent=65537, key_size=3072),
+    "ES256 (P-256)": lambda: ec.generate_private_key(ec.SECP256R1()),
+}
+
+
+def _throughput(operation) -> float:
+    # best of a few fixed-length runs
+    best = 0.0
+    for _ in range(_REPEAT):
+        count = 0
+        started_at = time.perf_counter()
+        while (elapsed := time.perf_counter() - started_at) < _DURATION:
+            operation()
+            count += 1
+        best = max(best, count / elapsed)
+    return best
+
+
+def _benchmark() -> None:
+    claims = {
+        'sub': str(uuid4()),
+        'exp': datetime.now(tz=UTC) + timedelta(hours=1),
+        'aud': 'benchmark',
+        'iss': 'benchmark'
+    }
+
+    for name, generate in _KEYS.items():
+        private_key = generate().private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        ).decode('utf-8')
+        token_key_ring = TokenKeyRing(private_key=private_key)
+        signing_key = token_key_ring.signing_key()
+        verification_key = token_key_ring.verification_key(signing_key.key_id)
+
+        def sign() -> str:
+            return jwt.encode(claims, signing_key.key, algorithm=signing_key.algorithm,
+                              headers={'kid': signing_key.key_id})
+
+        token = sign()
+
+        def verify() -> dict:
+            return jwt.decode(token, verification_key.key, algorithms=[verification_key.algorithm],
+                              audience='benchmark', issuer='benchmark')
+
+        print(f"{name:>16}: sign {_throughput(sign):8.0f}/s, verify {_throughput(verify):8.0f}/s, "
+              f"token {len(token)} bytes")
+
+
+if __name__ == '__main__':
+    _benchmark()
@@ -4,4 +4,5 @@ docker run --rm \
   -v "$(pwd)/requirements.in:/app/requirements.in" \
   -v "$(pwd):/app" \
   python:3.12.6 \
-  sh -c "cd /app && pip install pip-tools && pip-compile requirements.in > requirements.txt"
\ No newline at end of file
+  sh -c "cd /app && pip install pip-tools && pip-compile requirements.in > requirements.txt \
+    && pip-compile requirements-vectorized.in > requirements-vectorized.txt"
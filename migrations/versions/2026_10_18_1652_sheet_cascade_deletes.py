@@ -0,0 +1,42 @@
+"""sheet cascade deletes
+
+Revision ID: 7804b93503ad
+Revises: 5f1a8d2c6e93
+Create Date: 2026-10-18 16:52:08.214376
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import src.salary_tracker.data.model
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7804b93503ad'
+down_revision: Union[str, None] = '5f1a8d2c6e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_FOREIGN_KEYS = (
+    ('sheet_durations', 'sheet_uuid', 'sheets'),
+    ('sheet_group_sizes', 'sheet_uuid', 'sheets'),
+    ('sheet_rate_tables', 'sheet_uuid', 'sheets'),
+    ('sheet_records', 'sheet_uuid', 'sheets'),
+    ('sheet_rates', 'rate_table_uuid', 'sheet_rate_tables'),
+)
+
+
+def _recreate_foreign_keys(ondelete: str | None) -> None:
+    for table, column, referred_table in _FOREIGN_KEYS:
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referred_table, [column], ['uuid'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    _recreate_foreign_keys('CASCADE')
+
+
+def downgrade() -> None:
+    _recreate_foreign_keys(None)
@@ -0,0 +1,20 @@
+from typing import TypeVar, Any
+
+from pydantic import BaseModel
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+def construct(model: type[ModelType], **values: Any) -> ModelType:
+    # for rows read back from the database, they were validated when they were written. Every field has to be given,
+    # model_construct would fill in defaults but walks all fields and aliases on each call, which costs more than
+    # validating the row
+    if model.__private_attributes__:
+        return model.model_construct(**values)
+
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
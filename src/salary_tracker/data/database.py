@@ -1,27 +1,64 @@
 import json
 import logging
-from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from contextlib import asynccontextmanager, AbstractAsyncContextManager
+from datetime import timedelta
+from itertools import cycle
+from typing import AsyncIterator, Sequence
 
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession, AsyncConnection
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession, AsyncConnection, \
+    AsyncEngine
+
+from salary_tracker.data.pool import InstrumentedAsyncAdaptedQueuePool, DatabasePoolStats
 
 logger = logging.getLogger(__name__)
 
 
+def _session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=engine,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+
 class Database:
 
-    def __init__(self, database_url: str) -> None:
-        self._engine = create_async_engine(
-            database_url,
-            echo=False,
-            json_serializer=lambda obj: json.dumps(obj, default=str),
-        )
-        self._session_factory = async_sessionmaker(
-            bind=self._engine,
-            autocommit=False,
-            autoflush=False,
-            expire_on_commit=False
-        )
+    def __init__(self, database_url: str, replica_urls: Sequence[str] = (), pool_size: int = 5,
+                 max_overflow: int = 10, pool_timeout: timedelta = timedelta(seconds=30),
+                 pool_recycle: timedelta | None = None, pool_pre_ping: bool = False,
+                 prepared_statement_cache_size: int = 100, command_timeout: timedelta | None = None) -> None:
+        def create_engine(url: str) -> AsyncEngine:
+            return create_async_engine(
+                url,
+                echo=False,
+                json_serializer=lambda obj: json.dumps(obj, default=str),
+                poolclass=InstrumentedAsyncAdaptedQueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout.total_seconds(),
+                pool_recycle=int(pool_recycle.total_seconds()) if pool_recycle else -1,
+                pool_pre_ping=pool_pre_ping,
+                connect_args={
+                    # the statements sqlalchemy prepares per connection, 0 disables it for transaction poolers
+                    "prepared_statement_cache_size": prepared_statement_cache_size,
+                    "command_timeout": command_timeout.total_seconds() if command_timeout else None
+                }
+            )
+
+        self._engine = create_engine(database_url)
+        self._replica_engines = [create_engine(url) for url in replica_urls]
+        self._session_factory = _session_factory(self._engine)
+
+        # reads run in read only transactions, so a write slipping into the read path fails on the primary as well
+        self._primary_read_session_factory = _session_factory(self._engine.execution_options(postgresql_readonly=True))
+        self._read_session_factories = cycle([
+            _session_factory(engine.execution_options(postgresql_readonly=True)) for engine in self._replica_engines
+        ] or [self._primary_read_session_factory])
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self._replica_engines)
 
     @asynccontextmanager
     async def connect(self) -> AsyncIterator[AsyncConnection]:
@@ -34,8 +71,8 @@ class Database:
                 raise
 
     @asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
-        session = self._session_factory()
+    async def _session(self, session_factory: async_sessionmaker[AsyncSession]) -> AsyncIterator[AsyncSession]:
+        session = session_factory()
         try:
             yield session
         except Exception as e:
@@ -44,5 +81,23 @@ class Database:
         finally:
             await session.close()
 
+    def session(self) -> AbstractAsyncContextManager[AsyncSession]:
+        return self._session(self._session_factory)
+
+    def read_session(self, use_primary: bool = False) -> AbstractAsyncContextManager[AsyncSession]:
+        # replicas take turns, the primary serves reads when there are none or when asked to
+        if use_primary:
+            return self._session(self._primary_read_session_factory)
+
+        return self._session(next(self._read_session_factories))
+
+    def pool_stats(self) -> DatabasePoolStats:
+        return DatabasePoolStats(
+            primary=self._engine.pool.stats(),
+            replicas=[engine.pool.stats() for engine in self._replica_engines]
+        )
+
     async def close(self) -> None:
         await self._engine.dispose()
+        for engine in self._replica_engines:
+            await engine.dispose()
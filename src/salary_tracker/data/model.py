@@ -3,7 +3,8 @@ from decimal import Decimal
 from typing import List
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, func, TypeDecorator
+from sqlalchemy import DateTime, ForeignKey, func, TypeDecorator, Computed, Index
+from sqlalchemy.dialects.postgresql import ExcludeConstraint, TSTZRANGE, Range
 from sqlalchemy.orm import DeclarativeBase, mapped_column, Mapped, relationship
 
 from salary_tracker.domain.auth.models import AuthProvider
@@ -13,6 +14,10 @@ class TZDateTime(TypeDecorator):
     impl = DateTime(timezone=True)
     cache_ok = True
 
+    @property
+    def python_type(self):
+        return datetime
+
     def process_bind_param(self, value, dialect):
         if value == datetime.max:
             return 'infinity'
@@ -63,14 +68,14 @@ class DatabaseUserExternalAccount(Base):
 class DatabaseSheetDuration(Base):
     __tablename__ = 'sheet_durations'
 
-    sheet_uuid: Mapped[UUID] = mapped_column(ForeignKey('sheets.uuid'), primary_key=True)
+    sheet_uuid: Mapped[UUID] = mapped_column(ForeignKey('sheets.uuid', ondelete='CASCADE'), primary_key=True)
     duration: Mapped[timedelta] = mapped_column(primary_key=True)
 
 
 class DatabaseSheetGroupSize(Base):
     __tablename__ = 'sheet_group_sizes'
 
-    sheet_uuid: Mapped[UUID] = mapped_column(ForeignKey('sheets.uuid'), primary_key=True)
+    sheet_uuid: Mapped[UUID] = mapped_column(ForeignKey('sheets.uuid', ondelete='CASCADE'), primary_key=True)
     group_size: Mapped[int] = mapped_column(primary_key=True)
 
 
@@ -78,18 +83,28 @@ class DatabaseSheetRecord(Base):
     __tablename__ = 'sheet_records'
 
     uuid: Mapped[UUID] = mapped_column(primary_key=True)
-    sheet_uuid: Mapped[UUID] = mapped_column(ForeignKey('sheets.uuid'))
+    sheet_uuid: Mapped[UUID] = mapped_column(ForeignKey('sheets.uuid', ondelete='CASCADE'))
     duration: Mapped[timedelta]
     group_size: Mapped[int]
     group_name: Mapped[str]
     happened_at: Mapped[datetime] = mapped_column(TZDateTime)
     additional_info: Mapped[str | None]
 
+    __table_args__ = (
+        # matches the record order, the included columns let salary scans run index only
+        Index(
+            'ix_sheet_records_sheet_uuid_happened_at_uuid',
+            'sheet_uuid', 'happened_at', 'uuid',
+            postgresql_include=['group_size', 'duration']
+        ),
+    )
+
 
 class DatabaseSheetRate(Base):
     __tablename__ = 'sheet_rates'
 
-    rate_table_uuid: Mapped[UUID] = mapped_column(ForeignKey('sheet_rate_tables.uuid'), primary_key=True)
+    rate_table_uuid: Mapped[UUID] = mapped_column(ForeignKey('sheet_rate_tables.uuid', ondelete='CASCADE'),
+                                                 primary_key=True)
     group_size: Mapped[int] = mapped_column(primary_key=True)
     duration: Mapped[timedelta] = mapped_column(primary_key=True)
     rate: Mapped[Decimal]
@@ -99,11 +114,39 @@ class DatabaseSheetRateTable(Base):
     __tablename__ = 'sheet_rate_tables'
 
     uuid: Mapped[UUID] = mapped_column(primary_key=True)
-    sheet_uuid: Mapped[UUID] = mapped_column(ForeignKey('sheets.uuid'))
+    sheet_uuid: Mapped[UUID] = mapped_column(ForeignKey('sheets.uuid', ondelete='CASCADE'))
     valid_from: Mapped[datetime] = mapped_column(TZDateTime)
     valid_to: Mapped[datetime] = mapped_column(TZDateTime)
-
-    rates: Mapped[List[DatabaseSheetRate]] = relationship(lazy="selectin", cascade="all, delete-orphan")
+    # both bounds inclusive like valid_from and valid_to, infinite bounds stay infinite
+    validity: Mapped[Range[datetime]] = mapped_column(TSTZRANGE, Computed(
+        "tstzrange(valid_from, valid_to, '[]')", persisted=True
+    ), deferred=True)
+
+    rates: Mapped[List[DatabaseSheetRate]] = relationship(lazy="selectin", cascade="all, delete-orphan",
+                                                          passive_deletes=True)
+
+    __table_args__ = (
+        # the uuid equality needs the btree_gist extension, deferred so an upsert can move boundaries between rate
+        # tables within one transaction
+        ExcludeConstraint(
+            (sheet_uuid, '='), (validity, '&&'),
+            name='sheet_rate_tables_validity_excl',
+            using='gist',
+            deferrable=True,
+            initially='DEFERRED'
+        ),
+    )
+
+
+class DatabaseSheetSalaryMonth(Base):
+    __tablename__ = 'sheet_salary_months'
+
+    sheet_uuid: Mapped[UUID] = mapped_column(ForeignKey('sheets.uuid', ondelete='CASCADE'), primary_key=True)
+    month: Mapped[datetime] = mapped_column(TZDateTime, primary_key=True)
+    salary: Mapped[Decimal]
+    records_count: Mapped[int]
+    unpriced_records_count: Mapped[int]
+    total_duration: Mapped[timedelta]
 
 
 class DatabaseSheet(Base):
@@ -113,8 +156,15 @@ class DatabaseSheet(Base):
     owner_user_uuid: Mapped[UUID] = mapped_column(ForeignKey('users.uuid'))
     title: Mapped[str]
     description: Mapped[str]
-
-    durations: Mapped[List[DatabaseSheetDuration]] = relationship(lazy="selectin", cascade="all, delete-orphan")
-    group_sizes: Mapped[List[DatabaseSheetGroupSize]] = relationship(lazy="selectin", cascade="all, delete-orphan")
-    rate_tables: Mapped[List[DatabaseSheetRateTable]] = relationship(lazy="selectin", cascade="all, delete-orphan")
-    records: Mapped[List[DatabaseSheetRecord]] = relationship(lazy="selectin", cascade="all, delete-orphan")
+    # bumped by every change that can change the salary of the sheet
+    data_version: Mapped[int] = mapped_column(default=0, server_default='0')
+
+    # nothing is loaded implicitly, queries opt in through the profiles in data/repositories/sheet/loading.py
+    durations: Mapped[List[DatabaseSheetDuration]] = relationship(lazy="raise", cascade="all, delete-orphan",
+                                                                  passive_deletes=True)
+    group_sizes: Mapped[List[DatabaseSheetGroupSize]] = relationship(lazy="raise", cascade="all, delete-orphan",
+                                                                     passive_deletes=True)
+    rate_tables: Mapped[List[DatabaseSheetRateTable]] = relationship(lazy="raise", cascade="all, delete-orphan",
+                                                                     passive_deletes=True)
+    records: Mapped[List[DatabaseSheetRecord]] = relationship(lazy="raise", cascade="all, delete-orphan",
+                                                              passive_deletes=True)
@@ -0,0 +1,57 @@
+import time
+from datetime import timedelta
+
+from pydantic import BaseModel, NonNegativeInt
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+class PoolStats(BaseModel):
+    size: NonNegativeInt
+    checked_in: NonNegativeInt
+    checked_out: NonNegativeInt
+    overflow: NonNegativeInt
+    waiting: NonNegativeInt
+    checkouts: NonNegativeInt
+    checkout_wait_total: timedelta
+    checkout_wait_max: timedelta
+
+
+class DatabasePoolStats(BaseModel):
+    primary: PoolStats
+    # in the order of the replica urls
+    replicas: list[PoolStats]
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._waiting = 0
+        self._checkouts = 0
+        self._checkout_wait_total = 0.0
+        self._checkout_wait_max = 0.0
+
+    def connect(self) -> PoolProxiedConnection:
+        # covers queueing for a free connection as well as opening or pre-pinging one
+        started_at = time.perf_counter()
+        self._waiting += 1
+        try:
+            return super().connect()
+        finally:
+            wait = time.perf_counter() - started_at
+            self._waiting -= 1
+            self._checkouts += 1
+            self._checkout_wait_total += wait
+            self._checkout_wait_max = max(self._checkout_wait_max, wait)
+
+    def stats(self) -> PoolStats:
+        return PoolStats(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            # negative while the pool has not opened all of its connections yet
+            overflow=max(self.overflow(), 0),
+            waiting=self._waiting,
+            checkouts=self._checkouts,
+            checkout_wait_total=timedelta(seconds=self._checkout_wait_total),
+            checkout_wait_max=timedelta(seconds=self._checkout_wait_max)
+        )
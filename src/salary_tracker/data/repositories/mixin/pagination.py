@@ -1,13 +1,19 @@
+import json
 from abc import ABC, abstractmethod
-from typing import TypeVar, Type
+from typing import TypeVar, Type, Sequence
 
-from pydantic import BaseModel, validate_call, ConfigDict
-from sqlalchemy import select, Select, func
+from pydantic import BaseModel, validate_call, ConfigDict, TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
+from sqlalchemy import select, Select, func, tuple_, ColumnElement
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.interfaces import ORMOption
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import Generic
 
+from salary_tracker.data.exceptions import DataException
 from salary_tracker.data.model import Base
-from salary_tracker.domain.pagination import PaginatedRequest, PaginatedResult
+from salary_tracker.domain.pagination import PaginatedRequest, PaginatedResult, PageCursor, TotalMode
 
 DatabaseModelType = TypeVar("DatabaseModelType", bound=Base)
 DataType = TypeVar("DataType", bound=BaseModel)
@@ -16,6 +22,11 @@ FiltersType = TypeVar("FiltersType")
 
 class GetPaginatedMixin(Generic[DatabaseModelType, DataType, FiltersType], ABC):
     _model: Type[DatabaseModelType]
+    _loading_options: Sequence[ORMOption] = ()
+    # when set, pages select these columns instead of ORM instances and _map_to_domain receives the row
+    _columns: Sequence[ColumnElement] | None = None
+    # unique together, pages are ordered by these columns and cursors hold their values
+    _sort_columns: Sequence[InstrumentedAttribute]
 
     @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
     def __init__(self, session: AsyncSession):
@@ -26,26 +37,119 @@ class GetPaginatedMixin(Generic[DatabaseModelType, DataType, FiltersType], ABC):
         pass
 
     @abstractmethod
-    def _map_to_domain(self, db_result: DatabaseModelType) -> DataType:
+    def _map_to_domain(self, db_result: DatabaseModelType | Row) -> DataType:
         pass
 
+    def _select(self) -> Select:
+        if self._columns is None:
+            return select(self._model)
+
+        return select(*self._columns)
+
+    def _cursor_for(self, db_result: DatabaseModelType, before: bool) -> PageCursor:
+        return PageCursor(
+            sort_key=[to_jsonable_python(getattr(db_result, column.key)) for column in self._sort_columns],
+            before=before
+        )
+
+    def _seek(self, query: Select, cursor: PageCursor) -> Select:
+        if len(cursor.sort_key) != len(self._sort_columns):
+            raise DataException("Invalid cursor")
+
+        try:
+            sort_key = [
+                TypeAdapter(column.type.python_type).validate_python(value)
+                for column, value in zip(self._sort_columns, cursor.sort_key)
+            ]
+        except ValidationError:
+            raise DataException("Invalid cursor")
+
+        if cursor.before:
+            # walks backwards from the cursor, the page is reversed once fetched
+            return (
+                query
+                .where(tuple_(*self._sort_columns) < tuple_(*sort_key))
+                .order_by(*[column.desc() for column in self._sort_columns])
+            )
+
+        return query.where(tuple_(*self._sort_columns) > tuple_(*sort_key)).order_by(*self._sort_columns)
+
+    async def _count(self, query: Select) -> int:
+        result = await self._session.execute(select(func.count()).select_from(query.subquery()))
+        return result.scalar()
+
+    async def _estimate_count(self, query: Select) -> int:
+        connection = await self._session.connection()
+        compiled = query.compile(dialect=connection.dialect)
+        parameters = tuple(compiled.params[name] for name in compiled.positiontup)
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", parameters)
+
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]["Plan"]["Plan Rows"])
+
     async def _get_paginated(self, request: PaginatedRequest[FiltersType]) -> PaginatedResult[DataType]:
         session = self._session
-        query = self._apply_pagination_filters(select(self._model), request.filters)
+        query = self._apply_pagination_filters(self._select(), request.filters)
 
         page_params = request.page_params
+        cursor = request.cursor
+        if cursor is None:
+            items_query = query.order_by(*self._sort_columns).offset(page_params.page * page_params.per_page)
+        else:
+            items_query = self._seek(query, cursor)
+
+        if page_params.total == TotalMode.EXACT:
+            # counted within the page statement, a seek narrows the window so it gets its own subquery
+            if cursor is None:
+                total_column = func.count().over()
+            else:
+                total_column = select(func.count()).select_from(query.subquery()).scalar_subquery()
+            items_query = items_query.add_columns(total_column)
+
+        # one extra row tells whether there is anything past this page
         items = await session.execute(
-            query.offset(page_params.page * page_params.per_page).limit(page_params.per_page)
+            items_query
+            .options(*self._loading_options)
+            .limit(page_params.per_page + 1)
         )
+        rows = items.all()
+        has_more = len(rows) > page_params.per_page
+        rows = rows[:page_params.per_page]
+        db_results = rows if self._columns is not None else [row[0] for row in rows]
+
+        if cursor is None:
+            has_previous, has_next = page_params.page > 0, has_more
+        elif cursor.before:
+            db_results.reverse()
+            has_previous, has_next = has_more, True
+        else:
+            has_previous, has_next = True, has_more
 
-        total_count_query = select(func.count()).select_from(query.subquery())
-        total_count_result = await session.execute(total_count_query)
-        total = total_count_result.scalar()
+        # the least the total can be given what this page has seen
+        seen = (page_params.page * page_params.per_page if cursor is None else 0) + len(rows) + has_more
+        if page_params.total == TotalMode.EXACT:
+            if rows:
+                total = rows[0][-1]
+            elif seen == 0 and cursor is None:
+                total = 0
+            else:
+                # past the last page there is no row to carry the count
+                total = await self._count(query)
+        elif page_params.total == TotalMode.ESTIMATE:
+            total = max(await self._estimate_count(query), seen)
+        else:
+            total = None
 
         return PaginatedResult(
-            items=[self._map_to_domain(db_result=x) for x in items.scalars()],
+            items=[self._map_to_domain(db_result=x) for x in db_results],
             total=total,
-            page=page_params.page,
+            page=page_params.page if cursor is None else None,
             per_page=page_params.per_page,
-            total_pages=(total // page_params.per_page) + (1 if total % page_params.per_page else 0)
+            total_pages=-(-total // page_params.per_page) if total is not None else None,
+            has_more=has_next,
+            next_cursor=self._cursor_for(db_results[-1], before=False) if db_results and has_next else None,
+            prev_cursor=self._cursor_for(db_results[0], before=True) if db_results and has_previous else None
         )
@@ -0,0 +1,17 @@
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from salary_tracker.data.model import DatabaseSheet
+
+
+async def bump_data_version(session: AsyncSession, sheet_uuid: UUID) -> None:
+    # locks the sheet row until the transaction ends. Writers of the salary months call it before touching them, so
+    # they run one at a time per sheet and a refresh never races an insert of the same month
+    await session.execute(
+        update(DatabaseSheet)
+        .where(DatabaseSheet.uuid == sheet_uuid)
+        .values(data_version=DatabaseSheet.data_version + 1)
+        .execution_options(synchronize_session=False)
+    )
@@ -0,0 +1,15 @@
+from sqlalchemy.orm import selectinload
+
+from salary_tracker.data.model import DatabaseSheet, DatabaseSheetRateTable
+
+# loader options for DatabaseSheet queries, relationships left out of a profile raise when accessed
+
+SHEET_METADATA = (
+    selectinload(DatabaseSheet.durations),
+    selectinload(DatabaseSheet.group_sizes),
+)
+
+SHEET_WITH_RATE_TABLES = (
+    *SHEET_METADATA,
+    selectinload(DatabaseSheet.rate_tables).selectinload(DatabaseSheetRateTable.rates),
+)
@@ -0,0 +1,33 @@
+from sqlalchemy import select, Select, and_
+
+from salary_tracker.data.model import DatabaseSheetRecord, DatabaseSheetRateTable, DatabaseSheetRate
+
+
+# records joined with their rate, records without a matching rate table or rate get NULL rate
+def select_priced_records() -> Select:
+    return (
+        select(
+            DatabaseSheetRecord.uuid,
+            DatabaseSheetRecord.sheet_uuid,
+            DatabaseSheetRecord.happened_at,
+            DatabaseSheetRecord.group_size,
+            DatabaseSheetRecord.duration,
+            DatabaseSheetRate.rate
+        )
+        .select_from(DatabaseSheetRecord)
+        .outerjoin(
+            DatabaseSheetRateTable,
+            and_(
+                DatabaseSheetRateTable.sheet_uuid == DatabaseSheetRecord.sheet_uuid,
+                DatabaseSheetRateTable.validity.contains(DatabaseSheetRecord.happened_at)
+            )
+        )
+        .outerjoin(
+            DatabaseSheetRate,
+            and_(
+                DatabaseSheetRate.rate_table_uuid == DatabaseSheetRateTable.uuid,
+                DatabaseSheetRate.group_size == DatabaseSheetRecord.group_size,
+                DatabaseSheetRate.duration == DatabaseSheetRecord.duration
+            )
+        )
+    )
@@ -1,73 +1,165 @@
 from datetime import datetime
-from uuid import UUID, uuid4
+from itertools import groupby
+from uuid import UUID
 
 from pydantic import validate_call, ConfigDict
-from sqlalchemy import select
+from sqlalchemy import select, ColumnElement
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from salary_tracker.data.construct import construct
 from salary_tracker.data.exceptions import DataException
 from salary_tracker.data.model import DatabaseSheetRateTable, DatabaseSheet, DatabaseSheetRate
-from salary_tracker.domain.sheet.models import RateTable
+from salary_tracker.data.repositories.sheet.data_version import bump_data_version
+from salary_tracker.data.repositories.sheet.loading import SHEET_WITH_RATE_TABLES
+from salary_tracker.data.repositories.sheet.salary_months import refresh_salary_months
+from salary_tracker.domain.exceptions import RateTablesOverlapDomainException
+from salary_tracker.domain.sheet.models import RateTable, Rate
 from salary_tracker.domain.sheet.repositories import IRateTableRepository
 
 
+def _rate_table_key(rate_table: DatabaseSheetRateTable | RateTable) -> tuple:
+    return (
+        rate_table.uuid,
+        rate_table.valid_from,
+        rate_table.valid_to,
+        frozenset((rate.group_size, rate.duration, rate.rate) for rate in rate_table.rates)
+    )
+
+
+def _changed_periods(old_rate_tables: list[DatabaseSheetRateTable],
+                     new_rate_tables: list[RateTable]) -> list[tuple[datetime, datetime]]:
+    old_keys = {_rate_table_key(rate_table) for rate_table in old_rate_tables}
+    new_keys = {_rate_table_key(rate_table) for rate_table in new_rate_tables}
+
+    periods = []
+    for _, valid_from, valid_to, _ in sorted(old_keys ^ new_keys, key=lambda key: key[1]):
+        if periods and valid_from <= periods[-1][1]:
+            periods[-1] = (periods[-1][0], max(periods[-1][1], valid_to))
+        else:
+            periods.append((valid_from, valid_to))
+
+    return periods
+
+
+def _new_rate(rate: Rate) -> DatabaseSheetRate:
+    return DatabaseSheetRate(rate=rate.rate, group_size=rate.group_size, duration=rate.duration)
+
+
+def _apply_rates(rate_table_db: DatabaseSheetRateTable, rates: list[Rate]) -> None:
+    # reversed, so the first of duplicated rates wins like in RateTable.get_salary
+    new_rates = {(rate.group_size, rate.duration): rate for rate in reversed(rates)}
+
+    for rate_db in list(rate_table_db.rates):
+        rate = new_rates.pop((rate_db.group_size, rate_db.duration), None)
+        if rate is None:
+            rate_table_db.rates.remove(rate_db)
+        elif rate_db.rate != rate.rate:
+            rate_db.rate = rate.rate
+
+    rate_table_db.rates.extend(_new_rate(rate) for rate in new_rates.values())
+
+
+def _apply_rate_tables(sheet: DatabaseSheet, rate_tables: list[RateTable]) -> None:
+    # only what differs from the stored rate tables is written, delete-orphan removes the dropped ones
+    new_rate_tables = {rate_table.uuid: rate_table for rate_table in rate_tables}
+
+    for rate_table_db in list(sheet.rate_tables):
+        rate_table = new_rate_tables.pop(rate_table_db.uuid, None)
+        if rate_table is None:
+            sheet.rate_tables.remove(rate_table_db)
+            continue
+
+        if rate_table_db.valid_from != rate_table.valid_from:
+            rate_table_db.valid_from = rate_table.valid_from
+        if rate_table_db.valid_to != rate_table.valid_to:
+            rate_table_db.valid_to = rate_table.valid_to
+        _apply_rates(rate_table_db, rate_table.rates)
+
+    sheet.rate_tables.extend(
+        DatabaseSheetRateTable(
+            uuid=rate_table.uuid,
+            valid_from=rate_table.valid_from,
+            valid_to=rate_table.valid_to,
+            rates=[_new_rate(rate) for rate in rate_table.rates]
+        ) for rate_table in new_rate_tables.values()
+    )
+
+
+async def _select_rate_tables(session: AsyncSession, *where: ColumnElement[bool]) -> list[RateTable]:
+    # one row per rate
+    result = await session.execute(
+        select(
+            DatabaseSheetRateTable.uuid,
+            DatabaseSheetRateTable.valid_from,
+            DatabaseSheetRateTable.valid_to,
+            DatabaseSheetRate.rate,
+            DatabaseSheetRate.group_size,
+            DatabaseSheetRate.duration
+        )
+        .join(DatabaseSheetRateTable.rates)
+        .where(*where)
+        .order_by(DatabaseSheetRateTable.valid_from, DatabaseSheetRateTable.uuid)
+    )
+
+    return [
+        construct(
+            RateTable,
+            uuid=uuid,
+            valid_from=valid_from,
+            valid_to=valid_to,
+            rates=tuple(construct(Rate, rate=row.rate, group_size=row.group_size, duration=row.duration) for row in rows)
+        ) for (uuid, valid_from, valid_to), rows in groupby(result, key=lambda row: row[:3])
+    ]
+
+
 class RateTableRepository(IRateTableRepository):
     @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
     def __init__(self, session: AsyncSession):
         self._session = session
 
     async def get_for_datetime(self, sheet_uuid: UUID, datetime_point: datetime) -> RateTable:
-        result = await self._session.execute(
-            select(DatabaseSheetRateTable)
-            .where(
-                (DatabaseSheetRateTable.sheet_uuid == sheet_uuid),
-                (DatabaseSheetRateTable.valid_from <= datetime_point),
-                (DatabaseSheetRateTable.valid_to >= datetime_point)
-            )
+        rate_tables = await _select_rate_tables(
+            self._session,
+            (DatabaseSheetRateTable.sheet_uuid == sheet_uuid),
+            (DatabaseSheetRateTable.validity.contains(datetime_point))
         )
 
-        scalar = result.scalar_one_or_none()
-        if scalar is None:
+        if not rate_tables:
             raise DataException("Rate table not found")
 
-        return RateTable.model_validate(scalar, from_attributes=True)
+        return rate_tables[0]
 
     async def get_for_sheet(self, sheet_uuid: UUID) -> list[RateTable]:
-        result = await self._session.execute(
-            select(DatabaseSheetRateTable)
-            .filter_by(sheet_uuid=sheet_uuid)
-        )
-
-        scalars = result.scalars().all()
-        return [RateTable.model_validate(scalar, from_attributes=True) for scalar in scalars]
+        return await _select_rate_tables(self._session, DatabaseSheetRateTable.sheet_uuid == sheet_uuid)
 
     async def upsert(self, sheet_uuid: UUID, rate_tables: list[RateTable]) -> list[RateTable]:
+        await bump_data_version(self._session, sheet_uuid)
         result = await self._session.execute(
             select(DatabaseSheet)
             .filter_by(uuid=sheet_uuid)
+            .options(*SHEET_WITH_RATE_TABLES)
         )
 
         sheet = result.scalar_one_or_none()
         if sheet is None:
             raise DataException("Sheet not found")
 
-        rate_tables_db = [
-            DatabaseSheetRateTable(
-                uuid=rate_table.uuid,
-                valid_from=rate_table.valid_from,
-                valid_to=rate_table.valid_to,
-                rates=[
-                    DatabaseSheetRate(
-                        rate=rate.rate,
-                        group_size=rate.group_size,
-                        duration=rate.duration
-                    ) for rate in rate_table.rates
-                ]
-            ) for rate_table in rate_tables
-        ]
+        changed_periods = _changed_periods(sheet.rate_tables, rate_tables)
+        _apply_rate_tables(sheet, rate_tables)
+        await self._session.flush()
 
-        sheet.rate_tables = rate_tables_db
+        for valid_from, valid_to in changed_periods:
+            await refresh_salary_months(self._session, sheet_uuid, valid_from, valid_to)
 
-        await self._session.commit()
+        try:
+            await self._session.commit()
+        except IntegrityError:
+            await self._session.rollback()
+            raise RateTablesOverlapDomainException(sheet_uuid)
 
-        return [RateTable.model_validate(rate_table, from_attributes=True) for rate_table in sheet.rate_tables]
+        rate_tables_db = {rate_table_db.uuid: rate_table_db for rate_table_db in sheet.rate_tables}
+        return [
+            RateTable.model_validate(rate_tables_db[rate_table.uuid], from_attributes=True)
+            for rate_table in rate_tables
+        ]
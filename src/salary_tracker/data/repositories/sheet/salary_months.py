@@ -0,0 +1,95 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import select, func, delete, Select, ColumnElement
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from salary_tracker.data.model import DatabaseSheetRecord, DatabaseSheetSalaryMonth, TZDateTime
+from salary_tracker.data.repositories.sheet.priced_records import select_priced_records
+from salary_tracker.domain.sheet.months import month_start
+
+
+def _select_salary_months(*where: ColumnElement[bool], sign: int = 1) -> Select:
+    priced_records = select_priced_records().where(*where).subquery()
+    monthly_records = select(
+        priced_records,
+        func.date_trunc("month", priced_records.c.happened_at, "UTC", type_=TZDateTime).label("month")
+    ).subquery()
+
+    return (
+        select(
+            monthly_records.c.sheet_uuid,
+            monthly_records.c.month,
+            func.coalesce(func.sum(monthly_records.c.rate), 0) * sign,
+            func.count() * sign,
+            func.count().filter(monthly_records.c.rate.is_(None)) * sign,
+            func.sum(monthly_records.c.duration) * sign
+        )
+        .group_by(monthly_records.c.sheet_uuid, monthly_records.c.month)
+    )
+
+
+def _insert_salary_months(salary_months: Select):
+    return insert(DatabaseSheetSalaryMonth).from_select(
+        [
+            DatabaseSheetSalaryMonth.sheet_uuid,
+            DatabaseSheetSalaryMonth.month,
+            DatabaseSheetSalaryMonth.salary,
+            DatabaseSheetSalaryMonth.records_count,
+            DatabaseSheetSalaryMonth.unpriced_records_count,
+            DatabaseSheetSalaryMonth.total_duration
+        ],
+        salary_months
+    )
+
+
+async def _apply_records(session: AsyncSession, record_uuids: list[UUID], sign: int) -> None:
+    statement = _insert_salary_months(
+        _select_salary_months(DatabaseSheetRecord.uuid.in_(record_uuids), sign=sign)
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[DatabaseSheetSalaryMonth.sheet_uuid, DatabaseSheetSalaryMonth.month],
+        set_={
+            "salary": DatabaseSheetSalaryMonth.salary + statement.excluded.salary,
+            "records_count": DatabaseSheetSalaryMonth.records_count + statement.excluded.records_count,
+            "unpriced_records_count": (DatabaseSheetSalaryMonth.unpriced_records_count
+                                       + statement.excluded.unpriced_records_count),
+            "total_duration": DatabaseSheetSalaryMonth.total_duration + statement.excluded.total_duration,
+            "updated_at": func.now()
+        }
+    )
+
+    await session.execute(statement)
+
+
+async def add_records_to_salary_months(session: AsyncSession, record_uuids: list[UUID]) -> None:
+    # the records have to be flushed already, their rates are looked up in the database
+    await _apply_records(session, record_uuids, 1)
+
+
+async def remove_records_from_salary_months(session: AsyncSession, record_uuids: list[UUID]) -> None:
+    # has to run while the records are still in the database
+    await _apply_records(session, record_uuids, -1)
+
+
+async def refresh_salary_months(session: AsyncSession, sheet_uuid: UUID, datetime_from: datetime,
+                                datetime_to: datetime) -> None:
+    month_from = month_start(datetime_from)
+    month_to = month_start(datetime_to)
+
+    await session.execute(
+        delete(DatabaseSheetSalaryMonth)
+        .where(
+            (DatabaseSheetSalaryMonth.sheet_uuid == sheet_uuid),
+            (DatabaseSheetSalaryMonth.month >= month_from),
+            (DatabaseSheetSalaryMonth.month <= month_to)
+        )
+    )
+
+    salary_months = _select_salary_months(
+        (DatabaseSheetRecord.sheet_uuid == sheet_uuid),
+        (DatabaseSheetRecord.happened_at >= month_from),
+        (func.date_trunc("month", DatabaseSheetRecord.happened_at, "UTC", type_=TZDateTime) <= month_to)
+    )
+    await session.execute(_insert_salary_months(salary_months))
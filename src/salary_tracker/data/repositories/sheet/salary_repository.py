@@ -0,0 +1,223 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import validate_call, ConfigDict
+from sqlalchemy import select, func, Subquery, values, column, Integer, and_, cast, BigInteger, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from salary_tracker.data.model import DatabaseSheetRecord, TZDateTime, DatabaseSheetSalaryMonth, DatabaseSheet
+from salary_tracker.data.repositories.sheet.priced_records import select_priced_records
+from salary_tracker.domain.sheet.models import SalaryCalculation, SalaryGranularity, SalaryBreakdownCalculation, \
+    SalaryBucket, SalarySummary, SalaryPeriod, RecordColumns, \
+    SheetSalaryCalculation
+from salary_tracker.domain.sheet.repositories import ISalaryRepository
+
+
+def _sheet_priced_records(sheet_uuid: UUID, *ranges: tuple[datetime, datetime]) -> Subquery:
+    return (
+        select_priced_records()
+        .where(
+            (DatabaseSheetRecord.sheet_uuid == sheet_uuid),
+            or_(*[
+                and_(
+                    (DatabaseSheetRecord.happened_at >= datetime_from),
+                    (DatabaseSheetRecord.happened_at <= datetime_to)
+                ) for datetime_from, datetime_to in ranges
+            ])
+        )
+        .subquery()
+    )
+
+
+def _union(periods: list[SalaryPeriod]) -> list[tuple[datetime, datetime]]:
+    # overlapping periods merged, so every record is scanned once and nothing between far apart periods is read
+    ranges = []
+    for period in sorted(periods, key=lambda period: period.datetime_from):
+        if ranges and period.datetime_from <= ranges[-1][1]:
+            ranges[-1] = (ranges[-1][0], max(ranges[-1][1], period.datetime_to))
+        else:
+            ranges.append((period.datetime_from, period.datetime_to))
+
+    return ranges
+
+
+class SalaryRepository(ISalaryRepository):
+    @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_salary(self, sheet_uuid: UUID, datetime_from: datetime,
+                         datetime_to: datetime) -> SalaryCalculation:
+        priced_records = _sheet_priced_records(sheet_uuid, (datetime_from, datetime_to))
+
+        result = await self._session.execute(
+            select(
+                func.coalesce(func.sum(priced_records.c.rate), 0),
+                func.array_agg(priced_records.c.uuid).filter(priced_records.c.rate.is_(None))
+            )
+        )
+
+        salary, unpriced_record_uuids = result.one()
+
+        return SalaryCalculation(
+            salary=salary,
+            unpriced_record_uuids=unpriced_record_uuids or []
+        )
+
+    async def get_salaries(self, sheet_uuid: UUID, periods: list[SalaryPeriod]) -> list[SalaryCalculation]:
+        periods_values = values(
+            column("index", Integer),
+            column("datetime_from", TZDateTime),
+            column("datetime_to", TZDateTime),
+            name="periods"
+        ).data([(index, period.datetime_from, period.datetime_to) for index, period in enumerate(periods)])
+
+        # records of all periods are scanned once, overlapping periods share them through the join
+        priced_records = _sheet_priced_records(sheet_uuid, *_union(periods))
+
+        result = await self._session.execute(
+            select(
+                periods_values.c.index,
+                func.coalesce(func.sum(priced_records.c.rate), 0),
+                func.array_agg(priced_records.c.uuid).filter(
+                    priced_records.c.uuid.is_not(None),
+                    priced_records.c.rate.is_(None)
+                )
+            )
+            .select_from(periods_values)
+            .outerjoin(priced_records, and_(
+                (priced_records.c.happened_at >= periods_values.c.datetime_from),
+                (priced_records.c.happened_at <= periods_values.c.datetime_to)
+            ))
+            .group_by(periods_values.c.index)
+            .order_by(periods_values.c.index)
+        )
+
+        return [
+            SalaryCalculation(
+                salary=salary,
+                unpriced_record_uuids=unpriced_record_uuids or []
+            ) for _, salary, unpriced_record_uuids in result
+        ]
+
+    async def get_salaries_by_owner(self, owner_user_uuid: UUID, datetime_from: datetime,
+                                    datetime_to: datetime) -> list[SheetSalaryCalculation]:
+        priced_records = (
+            select_priced_records()
+            .where(
+                DatabaseSheetRecord.sheet_uuid.in_(
+                    select(DatabaseSheet.uuid).filter_by(owner_user_uuid=owner_user_uuid)
+                ),
+                (DatabaseSheetRecord.happened_at >= datetime_from),
+                (DatabaseSheetRecord.happened_at <= datetime_to)
+            )
+            .subquery()
+        )
+
+        result = await self._session.execute(
+            select(
+                DatabaseSheet.uuid,
+                DatabaseSheet.title,
+                func.coalesce(func.sum(priced_records.c.rate), 0),
+                func.array_agg(priced_records.c.uuid).filter(
+                    priced_records.c.uuid.is_not(None),
+                    priced_records.c.rate.is_(None)
+                )
+            )
+            .outerjoin(priced_records, priced_records.c.sheet_uuid == DatabaseSheet.uuid)
+            .where(DatabaseSheet.owner_user_uuid == owner_user_uuid)
+            .group_by(DatabaseSheet.uuid)
+            .order_by(DatabaseSheet.title, DatabaseSheet.uuid)
+        )
+
+        return [
+            SheetSalaryCalculation(
+                sheet_uuid=sheet_uuid,
+                title=title,
+                salary=salary,
+                unpriced_record_uuids=unpriced_record_uuids or []
+            ) for sheet_uuid, title, salary, unpriced_record_uuids in result
+        ]
+
+    async def get_salary_breakdown(self, sheet_uuid: UUID, datetime_from: datetime, datetime_to: datetime,
+                                   granularity: SalaryGranularity, timezone: str) -> SalaryBreakdownCalculation:
+        priced_records = _sheet_priced_records(sheet_uuid, (datetime_from, datetime_to))
+
+        # date_trunc with a time zone truncates in local time, so buckets follow DST and local midnight
+        bucketed_records = select(
+            priced_records,
+            func.date_trunc(granularity.value, priced_records.c.happened_at, timezone,
+                            type_=TZDateTime).label("bucket_start")
+        ).subquery()
+
+        result = await self._session.execute(
+            select(
+                bucketed_records.c.bucket_start,
+                func.coalesce(func.sum(bucketed_records.c.rate), 0),
+                func.count(),
+                func.sum(bucketed_records.c.duration),
+                func.array_agg(bucketed_records.c.uuid).filter(bucketed_records.c.rate.is_(None))
+            )
+            .group_by(bucketed_records.c.bucket_start)
+            .order_by(bucketed_records.c.bucket_start)
+        )
+
+        buckets = []
+        unpriced_record_uuids = []
+        for bucket_start, salary, records_count, total_duration, bucket_unpriced_record_uuids in result:
+            buckets.append(SalaryBucket(
+                bucket_start=bucket_start,
+                salary=salary,
+                records_count=records_count,
+                total_duration=total_duration
+            ))
+            unpriced_record_uuids.extend(bucket_unpriced_record_uuids or [])
+
+        return SalaryBreakdownCalculation(
+            buckets=buckets,
+            unpriced_record_uuids=unpriced_record_uuids
+        )
+
+    async def get_salary_summary(self, sheet_uuid: UUID, month_from: datetime, month_to: datetime) -> SalarySummary:
+        result = await self._session.execute(
+            select(
+                func.coalesce(func.sum(DatabaseSheetSalaryMonth.salary), 0),
+                func.coalesce(func.sum(DatabaseSheetSalaryMonth.unpriced_records_count), 0)
+            )
+            .where(
+                (DatabaseSheetSalaryMonth.sheet_uuid == sheet_uuid),
+                (DatabaseSheetSalaryMonth.month >= month_from),
+                (DatabaseSheetSalaryMonth.month < month_to)
+            )
+        )
+
+        salary, unpriced_records_count = result.one()
+
+        return SalarySummary(
+            salary=salary,
+            unpriced_records_count=unpriced_records_count
+        )
+
+    async def get_record_columns(self, sheet_uuid: UUID, datetime_from: datetime,
+                                 datetime_to: datetime) -> RecordColumns:
+        result = await self._session.execute(
+            select(
+                cast(func.extract("epoch", DatabaseSheetRecord.happened_at) * 1_000_000, BigInteger),
+                DatabaseSheetRecord.group_size,
+                cast(func.extract("epoch", DatabaseSheetRecord.duration) * 1_000_000, BigInteger)
+            )
+            .where(
+                (DatabaseSheetRecord.sheet_uuid == sheet_uuid),
+                (DatabaseSheetRecord.happened_at >= datetime_from),
+                (DatabaseSheetRecord.happened_at <= datetime_to)
+            )
+        )
+
+        happened_at, group_sizes, durations = list(zip(*result.all())) or [(), (), ()]
+
+        # skips validating every element, the database already guarantees the types
+        return RecordColumns.model_construct(
+            happened_at=list(happened_at),
+            group_sizes=list(group_sizes),
+            durations=list(durations)
+        )
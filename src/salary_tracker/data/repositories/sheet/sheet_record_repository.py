@@ -1,18 +1,52 @@
+from collections.abc import AsyncIterator
 from uuid import UUID
 
-from sqlalchemy import Select, select
+from sqlalchemy import Select, select, tuple_, insert
+from sqlalchemy.engine import Row
 
+from salary_tracker.data.construct import construct
 from salary_tracker.data.exceptions import DataException
 from salary_tracker.data.model import DatabaseSheetRecord
-from salary_tracker.data.repositories.mixin.pagination import GetPaginatedMixin, DatabaseModelType, DataType
+from salary_tracker.data.repositories.mixin.pagination import GetPaginatedMixin
+from salary_tracker.data.repositories.sheet.data_version import bump_data_version
+from salary_tracker.data.repositories.sheet.salary_months import add_records_to_salary_months, \
+    remove_records_from_salary_months
 from salary_tracker.domain.pagination import PaginatedRequest, PaginatedResult
 from salary_tracker.domain.sheet.models import Record, SheetRecordFilters
 from salary_tracker.domain.sheet.repositories import ISheetRecordRepository
 
 
+# rows per INSERT, keeps the bound parameters well below the protocol limit of 32767
+_ADD_MANY_BATCH_SIZE = 1000
+
+_RECORD_COLUMNS = (
+    DatabaseSheetRecord.uuid,
+    DatabaseSheetRecord.duration,
+    DatabaseSheetRecord.group_size,
+    DatabaseSheetRecord.group_name,
+    DatabaseSheetRecord.happened_at,
+    DatabaseSheetRecord.additional_info
+)
+
+
+def _map_row(row: Row) -> Record:
+    return construct(
+        Record,
+        uuid=row.uuid,
+        duration=row.duration,
+        group_size=row.group_size,
+        group_name=row.group_name,
+        happened_at=row.happened_at,
+        additional_info=row.additional_info
+    )
+
+
 class SheetRecordRepository(GetPaginatedMixin[DatabaseSheetRecord, Record, SheetRecordFilters],
                             ISheetRecordRepository):
     _model = DatabaseSheetRecord
+    _columns = _RECORD_COLUMNS
+    # the records index serves this order
+    _sort_columns = (DatabaseSheetRecord.happened_at, DatabaseSheetRecord.uuid)
 
     def _apply_pagination_filters(self, query: Select, filters: SheetRecordFilters) -> Select:
         query = query.filter_by(sheet_uuid=filters.sheet_uuid)
@@ -25,24 +59,46 @@ class SheetRecordRepository(GetPaginatedMixin[DatabaseSheetRecord, Record, Sheet
 
         return query
 
-    def _map_to_domain(self, db_result: DatabaseModelType) -> DataType:
-        return Record.model_validate(db_result, from_attributes=True)
+    def _map_to_domain(self, db_result: Row) -> Record:
+        return _map_row(db_result)
 
     async def get_by_uuid(self, sheet_uuid: UUID, record_uuid: UUID) -> Record | None:
         result = await self._session.execute(
-            select(DatabaseSheetRecord)
+            select(*_RECORD_COLUMNS)
             .filter_by(sheet_uuid=sheet_uuid, uuid=record_uuid)
         )
 
-        record = result.scalar_one_or_none()
-        if not record:
+        row = result.one_or_none()
+        if row is None:
             return None
 
-        return Record.model_validate(record, from_attributes=True)
+        return _map_row(row)
 
     async def get_paginated(self, request: PaginatedRequest[SheetRecordFilters]) -> PaginatedResult[Record]:
         return await self._get_paginated(request)
 
+    async def iter_records(self, filters: SheetRecordFilters, batch_size: int = 1000) -> AsyncIterator[Record]:
+        query = (
+            self._apply_pagination_filters(select(*_RECORD_COLUMNS), filters)
+            .order_by(*self._sort_columns)
+            .limit(batch_size)
+        )
+
+        # keyset seeks from the last yielded record, every batch costs the same regardless of its position
+        batch_query = query
+        while True:
+            rows = (await self._session.execute(batch_query)).all()
+            for row in rows:
+                yield _map_row(row)
+
+            if len(rows) < batch_size:
+                return
+
+            batch_query = query.where(
+                tuple_(DatabaseSheetRecord.happened_at, DatabaseSheetRecord.uuid)
+                > tuple_(rows[-1].happened_at, rows[-1].uuid)
+            )
+
     async def add(self, sheet_uuid: UUID, record: Record) -> Record:
         record_db = DatabaseSheetRecord(
             uuid=record.uuid,
@@ -54,12 +110,41 @@ class SheetRecordRepository(GetPaginatedMixin[DatabaseSheetRecord, Record, Sheet
             additional_info=record.additional_info
         )
 
+        await bump_data_version(self._session, sheet_uuid)
         self._session.add(record_db)
+        await self._session.flush()
+        await add_records_to_salary_months(self._session, [record_db.uuid])
         await self._session.commit()
 
         return Record.model_validate(record_db, from_attributes=True)
 
+    async def add_many(self, sheet_uuid: UUID, records: list[Record]) -> list[Record]:
+        # multi-row inserts without ORM instances, the whole batch commits or fails together
+        await bump_data_version(self._session, sheet_uuid)
+        for offset in range(0, len(records), _ADD_MANY_BATCH_SIZE):
+            batch = records[offset:offset + _ADD_MANY_BATCH_SIZE]
+            await self._session.execute(
+                insert(DatabaseSheetRecord)
+                .values([
+                    dict(
+                        uuid=record.uuid,
+                        sheet_uuid=sheet_uuid,
+                        group_size=record.group_size,
+                        duration=record.duration,
+                        group_name=record.group_name,
+                        happened_at=record.happened_at,
+                        additional_info=record.additional_info
+                    ) for record in batch
+                ])
+            )
+            await add_records_to_salary_months(self._session, [record.uuid for record in batch])
+
+        await self._session.commit()
+
+        return records
+
     async def delete(self, sheet_uuid: UUID, record_uuid: UUID) -> None:
+        await bump_data_version(self._session, sheet_uuid)
         record = await self._session.execute(
             select(DatabaseSheetRecord)
             .filter_by(sheet_uuid=sheet_uuid, uuid=record_uuid)
@@ -67,7 +152,9 @@ class SheetRecordRepository(GetPaginatedMixin[DatabaseSheetRecord, Record, Sheet
 
         record = record.scalar_one_or_none()
         if not record:
+            await self._session.rollback()
             raise DataException(f"Record with uuid {record_uuid} not found")
 
+        await remove_records_from_salary_months(self._session, [record.uuid])
         await self._session.delete(record)
         await self._session.commit()
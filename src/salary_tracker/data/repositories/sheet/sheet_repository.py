@@ -1,11 +1,14 @@
 from uuid import UUID
 
-from sqlalchemy import select, Select
+from sqlalchemy import select, Select, func, delete
+from sqlalchemy.engine import Row
 
+from salary_tracker.data.construct import construct
 from salary_tracker.data.exceptions import DataException
 from salary_tracker.data.model import DatabaseSheet, DatabaseSheetDuration, \
     DatabaseSheetGroupSize
 from salary_tracker.data.repositories.mixin.pagination import GetPaginatedMixin
+from salary_tracker.data.repositories.sheet.loading import SHEET_METADATA
 from salary_tracker.domain.pagination import PaginatedRequest, PaginatedResult
 from salary_tracker.domain.sheet.models import Sheet
 from salary_tracker.domain.sheet.repositories import ISheetRepository
@@ -22,32 +25,69 @@ def _map(sheet: DatabaseSheet) -> Sheet:
     )
 
 
+_SHEET_COLUMNS = (
+    DatabaseSheet.uuid,
+    DatabaseSheet.owner_user_uuid,
+    DatabaseSheet.title,
+    DatabaseSheet.description,
+    select(func.array_agg(DatabaseSheetGroupSize.group_size))
+    .where(DatabaseSheetGroupSize.sheet_uuid == DatabaseSheet.uuid)
+    .scalar_subquery()
+    .label("group_sizes"),
+    select(func.array_agg(DatabaseSheetDuration.duration))
+    .where(DatabaseSheetDuration.sheet_uuid == DatabaseSheet.uuid)
+    .scalar_subquery()
+    .label("durations")
+)
+
+
+def _map_row(row: Row) -> Sheet:
+    return construct(
+        Sheet,
+        uuid=row.uuid,
+        owner_user_uuid=row.owner_user_uuid,
+        title=row.title,
+        description=row.description,
+        group_sizes=set(row.group_sizes or ()),
+        durations=set(row.durations or ())
+    )
+
+
 class SheetRepository(GetPaginatedMixin[DatabaseSheet, Sheet, UUID], ISheetRepository):
     _model = DatabaseSheet
+    _columns = _SHEET_COLUMNS
+    _sort_columns = (DatabaseSheet.title, DatabaseSheet.uuid)
 
     def _apply_pagination_filters(self, query: Select, filters: UUID) -> Select:
         return query.filter_by(owner_user_uuid=filters)
 
-    def _map_to_domain(self, db_result: DatabaseSheet) -> Sheet:
-        return _map(db_result)
+    def _map_to_domain(self, db_result: Row) -> Sheet:
+        return _map_row(db_result)
 
     async def get_by_uuid(self, sheet_uuid: UUID) -> Sheet | None:
         result = await self._session.execute(
-            select(DatabaseSheet).filter_by(uuid=sheet_uuid)
+            select(*_SHEET_COLUMNS).filter_by(uuid=sheet_uuid)
         )
 
-        sheet = result.scalar_one_or_none()
-        if sheet is None:
+        row = result.one_or_none()
+        if row is None:
             return None
 
-        return _map(sheet)
+        return _map_row(row)
+
+    async def get_data_version(self, sheet_uuid: UUID) -> int | None:
+        result = await self._session.execute(
+            select(DatabaseSheet.data_version).filter_by(uuid=sheet_uuid)
+        )
+
+        return result.scalar_one_or_none()
 
     async def get_by_owner_paginated(self, request: PaginatedRequest[UUID]) -> PaginatedResult[Sheet]:
         return await self._get_paginated(request)
 
     async def upsert(self, sheet: Sheet) -> Sheet:
         result = await self._session.execute(
-            select(DatabaseSheet).filter_by(uuid=sheet.uuid)
+            select(DatabaseSheet).filter_by(uuid=sheet.uuid).options(*SHEET_METADATA)
         )
 
         sheet_db = result.scalar_one_or_none()
@@ -87,13 +127,10 @@ class SheetRepository(GetPaginatedMixin[DatabaseSheet, Sheet, UUID], ISheetRepos
         return _map(sheet_db)
 
     async def delete(self, sheet_uuid: UUID) -> None:
-        result = await self._session.execute(
-            select(DatabaseSheet).filter_by(uuid=sheet_uuid)
-        )
-
-        sheet_db = result.scalar_one_or_none()
-        if sheet_db is None:
+        # the child rows go with the ON DELETE CASCADE foreign keys, nothing is loaded
+        result = await self._session.execute(delete(DatabaseSheet).where(DatabaseSheet.uuid == sheet_uuid))
+        if result.rowcount == 0:
+            await self._session.rollback()
             raise DataException(f"Sheet with uuid {sheet_uuid} not found")
 
-        await self._session.delete(sheet_db)
         await self._session.commit()
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+
+from salary_tracker.domain.auth.models import AccessToken, AccessTokenCacheStats
+
+
+class IAccessTokenCache(ABC):
+
+    @abstractmethod
+    async def get(self, token: str) -> AccessToken | None:
+        pass
+
+    @abstractmethod
+    async def set(self, access_token: AccessToken) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> AccessTokenCacheStats:
+        pass
+
+
+class ICertificateCache(ABC):
+
+    @abstractmethod
+    async def get(self) -> dict[str, str]:
+        pass
@@ -0,0 +1,65 @@
+import asyncio
+import logging
+import re
+import time
+from datetime import timedelta
+from typing import Callable
+
+import httpx
+from pydantic import validate_call
+
+from salary_tracker.domain.auth.caches import ICertificateCache
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+def _max_age(cache_control: str | None) -> float:
+    match = _MAX_AGE.search(cache_control or "")
+    return float(match.group(1)) if match else 0.0
+
+
+class HttpCertificateCache(ICertificateCache):
+    @validate_call
+    def __init__(self, url: str, refresh_margin: timedelta = timedelta(minutes=5),
+                 timeout: timedelta = timedelta(seconds=10), clock: Callable[[], float] = time.monotonic):
+        self._url = url
+        self._refresh_margin = refresh_margin.total_seconds()
+        self._timeout = timeout.total_seconds()
+        self._clock = clock
+        self._certificates: dict[str, str] | None = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+
+    async def get(self) -> dict[str, str]:
+        now = self._clock()
+        if self._certificates is None or self._expires_at <= now:
+            # concurrent logins wait for a single fetch
+            async with self._lock:
+                if self._certificates is None or self._expires_at <= self._clock():
+                    await self._fetch()
+        elif self._expires_at - now <= self._refresh_margin and self._refresh_task is None:
+            # served from the cache while the next certificates are fetched, logins never wait for a refresh
+            self._refresh_task = asyncio.create_task(self._refresh())
+
+        return self._certificates
+
+    async def _fetch(self) -> None:
+        async with httpx.AsyncClient(timeout=self._timeout) as client:
+            response = await client.get(self._url)
+            response.raise_for_status()
+
+        self._certificates = response.json()
+        self._expires_at = self._clock() + _max_age(response.headers.get("Cache-Control"))
+
+    async def _refresh(self) -> None:
+        try:
+            async with self._lock:
+                await self._fetch()
+        except (httpx.HTTPError, ValueError):
+            # the cached certificates stay until they expire, the next login tries again
+            logger.warning("Failed to refresh certificates from %s", self._url, exc_info=True)
+        finally:
+            self._refresh_task = None
@@ -0,0 +1,51 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from pydantic import validate_call, PositiveInt
+
+from salary_tracker.domain.auth.caches import IAccessTokenCache
+from salary_tracker.domain.auth.models import AccessToken, AccessTokenCacheStats
+
+
+def _digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode('utf-8')).digest()
+
+
+class InMemoryAccessTokenCache(IAccessTokenCache):
+    @validate_call
+    def __init__(self, max_size: PositiveInt, clock: Callable[[], float] = time.time):
+        self._max_size = max_size
+        # wall clock, entries expire together with the token they hold
+        self._clock = clock
+        self._entries: OrderedDict[bytes, tuple[float, AccessToken]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    async def get(self, token: str) -> AccessToken | None:
+        key = _digest(token)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            self._entries.pop(key, None)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry[1]
+
+    async def set(self, access_token: AccessToken) -> None:
+        key = _digest(access_token.token)
+        self._entries[key] = (access_token.expires_at.timestamp(), access_token)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> AccessTokenCacheStats:
+        return AccessTokenCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._entries)
+        )
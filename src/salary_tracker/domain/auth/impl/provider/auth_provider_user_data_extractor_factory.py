@@ -1,5 +1,6 @@
-from pydantic import validate_call
+from pydantic import validate_call, ConfigDict
 
+from salary_tracker.domain.auth.caches import ICertificateCache
 from salary_tracker.domain.auth.factories import IAuthProviderUserDataExtractorFactory
 from salary_tracker.domain.auth.models import AuthProvider
 from salary_tracker.domain.auth.services import IAuthProviderUserDataExtractor
@@ -7,13 +8,17 @@ from salary_tracker.domain.exceptions import DomainException
 
 
 class AuthProviderUserDataExtractorFactory(IAuthProviderUserDataExtractorFactory):
-    @validate_call
-    def __init__(self, google_app_client_id: str):
+    @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+    def __init__(self, google_app_client_id: str, google_certificate_cache: ICertificateCache):
         self._google_app_client_id = google_app_client_id
+        self._google_certificate_cache = google_certificate_cache
 
     def create(self, provider: AuthProvider) -> IAuthProviderUserDataExtractor:
         if provider == AuthProvider.GOOGLE:
             from salary_tracker.domain.auth.impl.provider.google_auth_provider_user_data_extractor import \
                 GoogleAuthProviderUserDataExtractor
-            return GoogleAuthProviderUserDataExtractor(app_client_id=self._google_app_client_id)
+            return GoogleAuthProviderUserDataExtractor(
+                app_client_id=self._google_app_client_id,
+                certificate_cache=self._google_certificate_cache
+            )
         raise DomainException(f"Unsupported provider: {provider}")
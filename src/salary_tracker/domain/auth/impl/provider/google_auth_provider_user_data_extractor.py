@@ -1,28 +1,37 @@
-from google.auth.transport import requests
-from google.oauth2 import id_token
-from pydantic import BaseModel
+import asyncio
 
+from google.auth import jwt
+from pydantic import BaseModel, ConfigDict
+
+from salary_tracker.domain.auth.caches import ICertificateCache
 from salary_tracker.domain.auth.models import AuthProviderUserData, AuthProvider
 from salary_tracker.domain.auth.services import IAuthProviderUserDataExtractor
 
+_GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
 
 class GoogleAuthProviderUserDataExtractor(IAuthProviderUserDataExtractor, BaseModel):
     app_client_id: str
+    certificate_cache: ICertificateCache
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     async def extract_from_token(self, token: str) -> AuthProviderUserData | None:
+        certificates = await self.certificate_cache.get()
+
         try:
-            id_info = id_token.verify_oauth2_token(
-                id_token=token,
-                request=requests.Request(),
-                audience=self.app_client_id
-            )
-
-            return AuthProviderUserData(
-                provider=AuthProvider.GOOGLE,
-                email=id_info["email"],
-                external_id=id_info["sub"],
-                name=id_info["name"],
-                avatar=id_info.get("picture", None)
-            )
+            # the signature check parses the certificate and verifies RSA, kept off the event loop
+            id_info = await asyncio.to_thread(jwt.decode, token, certs=certificates, audience=self.app_client_id)
         except ValueError:
             return None
+
+        if id_info.get("iss") not in _GOOGLE_ISSUERS:
+            return None
+
+        return AuthProviderUserData(
+            provider=AuthProvider.GOOGLE,
+            email=id_info["email"],
+            external_id=id_info["sub"],
+            name=id_info["name"],
+            avatar=id_info.get("picture", None)
+        )
@@ -0,0 +1,34 @@
+from uuid import UUID
+
+from pydantic import ConfigDict, validate_call
+
+from salary_tracker.domain.auth.caches import IAccessTokenCache
+from salary_tracker.domain.auth.models import AccessToken, TokenPair
+from salary_tracker.domain.auth.services import ITokenService
+
+
+class CachedTokenService(ITokenService):
+    @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+    def __init__(self, token_service: ITokenService, access_token_cache: IAccessTokenCache):
+        self._token_service = token_service
+        self._access_token_cache = access_token_cache
+
+    async def validate_access_token(self, access_token: str) -> AccessToken:
+        # only tokens that passed verification are cached, and only until they expire
+        cached_access_token = await self._access_token_cache.get(access_token)
+        if cached_access_token is not None:
+            return cached_access_token
+
+        validated_access_token = await self._token_service.validate_access_token(access_token)
+        await self._access_token_cache.set(validated_access_token)
+
+        return validated_access_token
+
+    async def create_token_pair(self, user_uuid: UUID) -> TokenPair:
+        return await self._token_service.create_token_pair(user_uuid)
+
+    async def rotate_refresh_token(self, refresh_token: str) -> TokenPair:
+        return await self._token_service.rotate_refresh_token(refresh_token)
+
+    async def delete_refresh_token(self, refresh_token: str) -> None:
+        await self._token_service.delete_refresh_token(refresh_token)
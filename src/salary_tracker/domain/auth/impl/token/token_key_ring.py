@@ -0,0 +1,72 @@
+import base64
+import hashlib
+import json
+
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
+from jose import jwk
+from jose.constants import ALGORITHMS
+from pydantic import validate_call
+
+from salary_tracker.domain.auth.keys import ITokenKeyRing, TokenKey
+from salary_tracker.domain.auth.models import JsonWebKeySet, JsonWebKey
+
+# RFC 7638, the members a key thumbprint is computed over
+_THUMBPRINT_MEMBERS = {
+    "RSA": ("e", "kty", "n"),
+    "EC": ("crv", "kty", "x", "y"),
+}
+
+
+def _algorithm_for(key) -> str:
+    if isinstance(key, (rsa.RSAPrivateKey, rsa.RSAPublicKey)):
+        return ALGORITHMS.RS256
+
+    if isinstance(key, (ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey)) and isinstance(key.curve, ec.SECP256R1):
+        return ALGORITHMS.ES256
+
+    raise ValueError(f"Unsupported token key {type(key).__name__}, expected an RSA or a P-256 key")
+
+
+def _thumbprint(public_jwk: dict) -> str:
+    members = {name: public_jwk[name] for name in _THUMBPRINT_MEMBERS[public_jwk["kty"]]}
+    digest = hashlib.sha256(json.dumps(members, sort_keys=True, separators=(",", ":")).encode("utf-8")).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+def _token_key(pem: str, key) -> TokenKey:
+    algorithm = _algorithm_for(key)
+    # parsed once, jose uses Key instances as they are instead of loading a PEM on every sign and verify. jose takes
+    # RSA private keys only as PEM, the loaded key just tells the algorithm
+    jose_key = jwk.construct(pem, algorithm)
+    return TokenKey(key_id=_thumbprint(jose_key.public_key().to_dict()), algorithm=algorithm, key=jose_key)
+
+
+class TokenKeyRing(ITokenKeyRing):
+    @validate_call
+    def __init__(self, private_key: str, verification_keys: tuple[str, ...] = ()):
+        # tokens are signed with the private key, the public verification keys are still accepted so tokens signed
+        # before a rotation stay valid until they expire
+        self._signing_key = _token_key(private_key, load_pem_private_key(private_key.encode("utf-8"), password=None))
+
+        public_keys = [_token_key(key, load_pem_public_key(key.encode("utf-8"))) for key in verification_keys]
+        self._public_keys = {
+            key.key_id: key
+            for key in [
+                TokenKey(key_id=self._signing_key.key_id, algorithm=self._signing_key.algorithm,
+                         key=self._signing_key.key.public_key()),
+                *public_keys
+            ]
+        }
+
+    def signing_key(self) -> TokenKey:
+        return self._signing_key
+
+    def verification_key(self, key_id: str) -> TokenKey | None:
+        return self._public_keys.get(key_id)
+
+    def public_key_set(self) -> JsonWebKeySet:
+        return JsonWebKeySet(keys=[
+            JsonWebKey(kid=key.key_id, **key.key.to_dict())
+            for key in self._public_keys.values()
+        ])
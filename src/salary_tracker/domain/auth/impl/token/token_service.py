@@ -2,11 +2,10 @@ import secrets
 from datetime import datetime, UTC
 from uuid import UUID, uuid4
 
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
 from jose import jwt, JWTError
 from pydantic import validate_call, ConfigDict
 
+from salary_tracker.domain.auth.keys import ITokenKeyRing
 from salary_tracker.domain.auth.models import RefreshToken, TokenPair, AccessToken, TokenSettings
 from salary_tracker.domain.auth.repositories import IRefreshTokenRepository
 from salary_tracker.domain.auth.services import ITokenService
@@ -18,24 +17,9 @@ from salary_tracker.usecase.exceptions import AuthException
 
 class TokenService(ITokenService):
     @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
-    def __init__(self, token_settings: TokenSettings, refresh_token_repository: IRefreshTokenRepository,
-                 user_repository: IUserRepository):
-        self._private_key = serialization.load_pem_private_key(
-            token_settings.access_token_private_key.encode('utf-8'),
-            password=None,
-            backend=default_backend()
-        )
-
-        self._private_key_str = self._private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption()
-        ).decode('utf-8')
-
-        self._public_key_str = self._private_key.public_key().public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo
-        ).decode('utf-8')
+    def __init__(self, token_settings: TokenSettings, token_key_ring: ITokenKeyRing,
+                 refresh_token_repository: IRefreshTokenRepository, user_repository: IUserRepository):
+        self._token_key_ring = token_key_ring
 
         self._access_token_expiration_time = token_settings.access_token_expiration_time
         self._access_token_issuer = token_settings.access_token_issuer
@@ -47,10 +31,17 @@ class TokenService(ITokenService):
 
     async def validate_access_token(self, access_token: str) -> AccessToken:
         try:
+            # tokens issued before they carried a key id were signed with the only key there was
+            key_id = jwt.get_unverified_header(access_token).get('kid', self._token_key_ring.signing_key().key_id)
+            token_key = self._token_key_ring.verification_key(key_id)
+            if token_key is None:
+                raise InvalidTokenDomainException()
+
             claims = jwt.decode(
                 token=access_token,
-                key=self._public_key_str,
-                algorithms=['RS256'],
+                key=token_key.key,
+                # pinned to the key, the alg header can't pick another algorithm
+                algorithms=[token_key.algorithm],
                 audience=self._access_token_audience,
                 issuer=self._access_token_issuer
             )
@@ -80,7 +71,8 @@ class TokenService(ITokenService):
             'iss': self._access_token_issuer
         }
 
-        token = jwt.encode(claims, self._private_key_str, algorithm='RS256')
+        signing_key = self._token_key_ring.signing_key()
+        token = jwt.encode(claims, signing_key.key, algorithm=signing_key.algorithm, headers={'kid': signing_key.key_id})
 
         access_token = AccessToken(
             user_uuid=user_uuid,
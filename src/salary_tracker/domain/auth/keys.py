@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+
+from jose.backends.base import Key
+from pydantic import BaseModel, ConfigDict
+
+from salary_tracker.domain.auth.models import JsonWebKeySet
+
+
+class TokenKey(BaseModel):
+    key_id: str
+    algorithm: str
+    key: Key
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+
+class ITokenKeyRing(ABC):
+
+    @abstractmethod
+    def signing_key(self) -> TokenKey:
+        pass
+
+    @abstractmethod
+    def verification_key(self, key_id: str) -> TokenKey | None:
+        pass
+
+    @abstractmethod
+    def public_key_set(self) -> JsonWebKeySet:
+        pass
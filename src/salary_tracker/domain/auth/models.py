@@ -2,13 +2,12 @@ from enum import StrEnum
 from uuid import UUID
 
 from asyncpg.pgproto.pgproto import timedelta
-from pydantic import AwareDatetime, BaseModel, AnyHttpUrl, EmailStr
+from pydantic import AwareDatetime, BaseModel, AnyHttpUrl, EmailStr, NonNegativeInt
 
 from salary_tracker.domain.user.models import User
 
 
 class TokenSettings(BaseModel):
-    access_token_private_key: str
     access_token_expiration_time: timedelta
     access_token_issuer: str
     access_token_audience: str
@@ -21,6 +20,28 @@ class AccessToken(BaseModel):
     expires_at: AwareDatetime
 
 
+class AccessTokenCacheStats(BaseModel):
+    hits: NonNegativeInt
+    misses: NonNegativeInt
+    size: NonNegativeInt
+
+
+class JsonWebKey(BaseModel):
+    kid: str
+    kty: str
+    alg: str
+    use: str = "sig"
+    n: str | None = None
+    e: str | None = None
+    crv: str | None = None
+    x: str | None = None
+    y: str | None = None
+
+
+class JsonWebKeySet(BaseModel):
+    keys: list[JsonWebKey]
+
+
 class RefreshToken(BaseModel):
     user_uuid: UUID
     token: str
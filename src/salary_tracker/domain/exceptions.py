@@ -31,6 +31,18 @@ class RecordNotFoundDomainException(DomainException):
         self.record_uuid = record_uuid
 
 
+class RateNotFoundDomainException(DomainException):
+    def __init__(self, record_uuids: list[UUID]):
+        super().__init__(f"Rate not found for records {', '.join(str(uuid) for uuid in record_uuids)}")
+        self.record_uuids = record_uuids
+
+
+class RateTablesOverlapDomainException(DomainException):
+    def __init__(self, sheet_uuid: UUID):
+        super().__init__(f"Rate tables of sheet with uuid {sheet_uuid} cannot overlap")
+        self.sheet_uuid = sheet_uuid
+
+
 class InvalidTokenDomainException(DomainException):
     def __init__(self):
         super().__init__("Invalid token")
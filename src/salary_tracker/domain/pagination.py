@@ -1,4 +1,5 @@
-from typing import TypeVar, Generic
+from enum import StrEnum
+from typing import TypeVar, Generic, Any
 
 from pydantic import BaseModel, conint
 
@@ -6,19 +7,38 @@ DataType = TypeVar("DataType", bound=BaseModel)
 FiltersType = TypeVar("FiltersType")
 
 
+class TotalMode(StrEnum):
+    EXACT = "exact"
+    # planner row estimate, cheap but can be off
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
 class PageParams(BaseModel):
-    page: conint(ge=0)
+    page: conint(ge=0) = 0
     per_page: conint(ge=1, le=100)
+    total: TotalMode = TotalMode.EXACT
+
+
+class PageCursor(BaseModel):
+    # json values of the sort columns of the item the page starts after, or ends before
+    sort_key: list[Any]
+    before: bool = False
 
 
 class PaginatedRequest(BaseModel, Generic[FiltersType]):
     page_params: PageParams
     filters: FiltersType
+    # takes over from page_params.page when set
+    cursor: PageCursor | None = None
 
 
 class PaginatedResult(BaseModel, Generic[DataType]):
     items: list[DataType]
-    total: int
-    page: int
+    total: int | None
+    page: int | None
     per_page: int
-    total_pages: int
+    total_pages: int | None
+    has_more: bool
+    next_cursor: PageCursor | None = None
+    prev_cursor: PageCursor | None = None
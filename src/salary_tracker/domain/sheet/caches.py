@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+from salary_tracker.domain.sheet.models import Salary, SalaryCacheKey, SalaryCacheStats
+
+
+class ISalaryCache(ABC):
+
+    @abstractmethod
+    async def get(self, key: SalaryCacheKey) -> Salary | None:
+        pass
+
+    @abstractmethod
+    async def set(self, key: SalaryCacheKey, salary: Salary) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> SalaryCacheStats:
+        pass
@@ -0,0 +1,45 @@
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Callable
+
+from pydantic import validate_call, PositiveInt
+
+from salary_tracker.domain.sheet.caches import ISalaryCache
+from salary_tracker.domain.sheet.models import Salary, SalaryCacheKey, SalaryCacheStats
+
+
+class InMemorySalaryCache(ISalaryCache):
+    @validate_call
+    def __init__(self, max_size: PositiveInt, ttl: timedelta, clock: Callable[[], float] = time.monotonic):
+        self._max_size = max_size
+        self._ttl = ttl.total_seconds()
+        self._clock = clock
+        self._entries: OrderedDict[SalaryCacheKey, tuple[float, Salary]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    async def get(self, key: SalaryCacheKey) -> Salary | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            self._entries.pop(key, None)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry[1]
+
+    async def set(self, key: SalaryCacheKey, salary: Salary) -> None:
+        self._entries[key] = (self._clock() + self._ttl, salary)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> SalaryCacheStats:
+        return SalaryCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._entries)
+        )
@@ -0,0 +1,54 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import ConfigDict, validate_call
+
+from salary_tracker.domain.sheet.caches import ISalaryCache
+from salary_tracker.domain.sheet.models import Salary, SalaryPeriod, SalaryGranularity, SalaryBreakdown, \
+    SalaryCacheKey, UserSalary
+from salary_tracker.domain.sheet.repositories import ISheetRepository
+from salary_tracker.domain.sheet.services import ISalaryService
+
+
+class CachedSalaryService(ISalaryService):
+    @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+    def __init__(self, salary_service: ISalaryService, sheet_repository: ISheetRepository,
+                 salary_cache: ISalaryCache):
+        self._salary_service = salary_service
+        self._sheet_repository = sheet_repository
+        self._salary_cache = salary_cache
+
+    async def calculate_salary(self, sheet_uuid: UUID, datetime_from: datetime, datetime_to: datetime) -> Salary:
+        data_version = await self._sheet_repository.get_data_version(sheet_uuid)
+        if data_version is None:
+            return await self._salary_service.calculate_salary(sheet_uuid, datetime_from, datetime_to)
+
+        # any change to the records or rate tables bumps the version, so stale entries are never hit again
+        key = SalaryCacheKey(
+            sheet_uuid=sheet_uuid,
+            datetime_from=datetime_from,
+            datetime_to=datetime_to,
+            data_version=data_version
+        )
+
+        cached_salary = await self._salary_cache.get(key)
+        if cached_salary is not None:
+            # the same instants may have been requested with other offsets
+            return cached_salary.model_copy(update=dict(datetime_from=datetime_from, datetime_to=datetime_to))
+
+        salary = await self._salary_service.calculate_salary(sheet_uuid, datetime_from, datetime_to)
+        await self._salary_cache.set(key, salary)
+
+        return salary
+
+    async def calculate_salaries(self, sheet_uuid: UUID, periods: list[SalaryPeriod]) -> list[Salary]:
+        return await self._salary_service.calculate_salaries(sheet_uuid, periods)
+
+    async def calculate_user_salary(self, owner_user_uuid: UUID, datetime_from: datetime,
+                                    datetime_to: datetime) -> UserSalary:
+        return await self._salary_service.calculate_user_salary(owner_user_uuid, datetime_from, datetime_to)
+
+    async def calculate_salary_breakdown(self, sheet_uuid: UUID, datetime_from: datetime, datetime_to: datetime,
+                                         granularity: SalaryGranularity, timezone: str) -> SalaryBreakdown:
+        return await self._salary_service.calculate_salary_breakdown(sheet_uuid, datetime_from, datetime_to,
+                                                                     granularity, timezone)
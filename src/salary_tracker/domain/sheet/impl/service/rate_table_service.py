@@ -15,11 +15,11 @@ class _RateTablesOverlapValidator(BaseModel):
 
     @model_validator(mode='after')
     def check_model(self):
-        for i in range(len(self.rate_tables)):
-            for j in range(i + 1, len(self.rate_tables)):
-                if self.rate_tables[i].valid_from < self.rate_tables[j].valid_to and self.rate_tables[i].valid_to > \
-                        self.rate_tables[j].valid_from:
-                    raise ValueError("Rate tables cannot overlap")
+        # once sorted by start, any overlap shows up between neighbours
+        rate_tables = sorted(self.rate_tables, key=lambda x: x.valid_from)
+        for previous, current in zip(rate_tables, rate_tables[1:]):
+            if current.valid_from <= previous.valid_to:
+                raise ValueError("Rate tables cannot overlap")
 
         return self
 
@@ -1,61 +1,152 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from pydantic import ConfigDict, validate_call
 
-from salary_tracker.domain.exceptions import SheetNotFoundDomainException, DomainException
-from salary_tracker.domain.pagination import PaginatedRequest, PageParams
-from salary_tracker.domain.sheet.models import Salary, SheetRecordFilters
-from salary_tracker.domain.sheet.repositories import ISheetRepository, IRateTableRepository, ISheetRecordRepository
+from salary_tracker.domain.exceptions import SheetNotFoundDomainException, RateNotFoundDomainException, \
+    DomainException
+from salary_tracker.domain.sheet.models import Salary, SalaryGranularity, SalaryBreakdown, SalaryPeriod, \
+    UserSalary, SheetSalary
+from salary_tracker.domain.sheet.months import month_start, next_month_start
+from salary_tracker.domain.sheet.repositories import ISheetRepository, ISalaryRepository
 from salary_tracker.domain.sheet.services import ISalaryService
 
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _full_months(datetime_from: datetime, datetime_to: datetime) -> tuple[datetime, datetime] | None:
+    # whole UTC months inside the inclusive range, as [month_from, month_to)
+    try:
+        month_from = month_start(datetime_from)
+        if month_from < datetime_from:
+            month_from = next_month_start(datetime_from)
+        month_to = month_start(datetime_to + _ONE_MICROSECOND)
+    except (OverflowError, ValueError):
+        return None
+
+    if month_from >= month_to:
+        return None
+
+    return month_from, month_to
+
 
 class SalaryService(ISalaryService):
     @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
-    def __init__(self, sheet_repository: ISheetRepository, sheet_record_repository: ISheetRecordRepository,
-                 rate_table_repository: IRateTableRepository):
+    def __init__(self, sheet_repository: ISheetRepository, salary_repository: ISalaryRepository):
         self.sheet_repository = sheet_repository
-        self.sheet_record_repository = sheet_record_repository
-        self.rate_table_repository = rate_table_repository
+        self.salary_repository = salary_repository
 
     async def calculate_salary(self, sheet_uuid: UUID, datetime_from: datetime, datetime_to: datetime) -> Salary:
         sheet = await self.sheet_repository.get_by_uuid(sheet_uuid)
         if sheet is None:
             raise SheetNotFoundDomainException(sheet_uuid)
 
-        page = 0
-        per_page = 100
-        records_page = await self.sheet_record_repository.get_paginated(PaginatedRequest(
-            page_params=PageParams(page=page, per_page=per_page),
-            filters=SheetRecordFilters(
-                sheet_uuid=sheet_uuid,
-                datetime_from=datetime_from,
-                datetime_to=datetime_to
-            )
-        ))
+        return Salary(
+            datetime_from=datetime_from,
+            datetime_to=datetime_to,
+            salary=await self._sum_salary(sheet_uuid, datetime_from, datetime_to)
+        )
 
+    async def _sum_salary(self, sheet_uuid: UUID, datetime_from: datetime, datetime_to: datetime) -> Decimal:
+        full_months = _full_months(datetime_from, datetime_to)
+        if full_months is None:
+            return await self._scan_salary(sheet_uuid, [(datetime_from, datetime_to)])
+
+        month_from, month_to = full_months
+        summary = await self.salary_repository.get_salary_summary(sheet_uuid, month_from, month_to)
+        if summary.unpriced_records_count:
+            # the summary only counts unpriced records, the scan tells which ones they are
+            return await self._scan_salary(sheet_uuid, [(datetime_from, datetime_to)])
+
+        edges = []
+        if datetime_from < month_from:
+            edges.append((datetime_from, month_from - _ONE_MICROSECOND))
+        if month_to <= datetime_to:
+            edges.append((month_to, datetime_to))
+
+        return summary.salary + await self._scan_salary(sheet_uuid, edges)
+
+    async def _scan_salary(self, sheet_uuid: UUID, ranges: list[tuple[datetime, datetime]]) -> Decimal:
         salary = Decimal(0)
-        while records_page.items:
-            for record in records_page.items:
-                rate_table = await self.rate_table_repository.get_for_datetime(sheet_uuid, record.happened_at)
-                if rate_table is None:
-                    raise DomainException(f"Rate table not found for datetime {record.happened_at}")
-
-                salary += rate_table.get_salary(record.group_size, record.duration)
-
-            page += 1
-            records_page = await self.sheet_record_repository.get_paginated(PaginatedRequest(
-                page_params=PageParams(page=page, per_page=per_page),
-                filters=SheetRecordFilters(
-                    sheet_uuid=sheet_uuid,
-                    datetime_from=datetime_from,
-                    datetime_to=datetime_to
-                )
-            ))
+        for datetime_from, datetime_to in ranges:
+            calculation = await self.salary_repository.get_salary(sheet_uuid, datetime_from, datetime_to)
+            if calculation.unpriced_record_uuids:
+                raise RateNotFoundDomainException(calculation.unpriced_record_uuids)
 
-        return Salary(
+            salary += calculation.salary
+
+        return salary
+
+    async def calculate_salaries(self, sheet_uuid: UUID, periods: list[SalaryPeriod]) -> list[Salary]:
+        sheet = await self.sheet_repository.get_by_uuid(sheet_uuid)
+        if sheet is None:
+            raise SheetNotFoundDomainException(sheet_uuid)
+
+        calculations = await self.salary_repository.get_salaries(sheet_uuid, periods)
+
+        unpriced_record_uuids = list(dict.fromkeys(
+            record_uuid for calculation in calculations for record_uuid in calculation.unpriced_record_uuids
+        ))
+        if unpriced_record_uuids:
+            raise RateNotFoundDomainException(unpriced_record_uuids)
+
+        return [
+            Salary(
+                datetime_from=period.datetime_from,
+                datetime_to=period.datetime_to,
+                salary=calculation.salary
+            ) for period, calculation in zip(periods, calculations)
+        ]
+
+    async def calculate_user_salary(self, owner_user_uuid: UUID, datetime_from: datetime,
+                                    datetime_to: datetime) -> UserSalary:
+        calculations = await self.salary_repository.get_salaries_by_owner(owner_user_uuid, datetime_from,
+                                                                          datetime_to)
+
+        unpriced_record_uuids = [
+            record_uuid for calculation in calculations for record_uuid in calculation.unpriced_record_uuids
+        ]
+        if unpriced_record_uuids:
+            raise RateNotFoundDomainException(unpriced_record_uuids)
+
+        return UserSalary(
+            datetime_from=datetime_from,
+            datetime_to=datetime_to,
+            salary=sum((calculation.salary for calculation in calculations), Decimal(0)),
+            sheets=[
+                SheetSalary(
+                    sheet_uuid=calculation.sheet_uuid,
+                    title=calculation.title,
+                    salary=calculation.salary
+                ) for calculation in calculations
+            ]
+        )
+
+    async def calculate_salary_breakdown(self, sheet_uuid: UUID, datetime_from: datetime, datetime_to: datetime,
+                                         granularity: SalaryGranularity, timezone: str) -> SalaryBreakdown:
+        try:
+            zone_info = ZoneInfo(timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise DomainException(f"Unknown timezone {timezone}")
+
+        sheet = await self.sheet_repository.get_by_uuid(sheet_uuid)
+        if sheet is None:
+            raise SheetNotFoundDomainException(sheet_uuid)
+
+        calculation = await self.salary_repository.get_salary_breakdown(sheet_uuid, datetime_from, datetime_to,
+                                                                        granularity, timezone)
+        if calculation.unpriced_record_uuids:
+            raise RateNotFoundDomainException(calculation.unpriced_record_uuids)
+
+        for bucket in calculation.buckets:
+            bucket.bucket_start = bucket.bucket_start.astimezone(zone_info)
+
+        return SalaryBreakdown(
             datetime_from=datetime_from,
             datetime_to=datetime_to,
-            salary=salary
+            granularity=granularity,
+            timezone=timezone,
+            buckets=calculation.buckets
         )
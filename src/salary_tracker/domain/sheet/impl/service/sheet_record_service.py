@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from uuid import UUID, uuid4
 
 from pydantic import validate_call, ConfigDict, BaseModel, model_validator, ValidationError
@@ -10,16 +11,34 @@ from salary_tracker.domain.sheet.repositories import ISheetRecordRepository, ISh
 from salary_tracker.domain.sheet.services import ISheetRecordService
 
 
+def _check_record(sheet: Sheet, record: Record) -> None:
+    if record.group_size not in sheet.group_sizes:
+        raise ValueError(f"Group size {record.group_size} is not in sheet group_sizes")
+    if record.duration not in sheet.durations:
+        raise ValueError(f"Duration ({record.duration}) is not in sheet durations")
+
+
 class _SheetRecordValidator(BaseModel):
     sheet: Sheet
     record: Record
 
     @model_validator(mode='after')
     def check_model(self):
-        if self.record.group_size not in self.sheet.group_sizes:
-            raise ValueError(f"Group size {self.record.group_size} is not in sheet group_sizes")
-        if self.record.duration not in self.sheet.durations:
-            raise ValueError(f"Duration ({self.record.duration}) is not in sheet durations")
+        _check_record(self.sheet, self.record)
+        return self
+
+
+class _SheetRecordsValidator(BaseModel):
+    sheet: Sheet
+    records: list[Record]
+
+    @model_validator(mode='after')
+    def check_model(self):
+        for index, record in enumerate(self.records):
+            try:
+                _check_record(self.sheet, record)
+            except ValueError as e:
+                raise ValueError(f"Record {index}: {e}")
         return self
 
 
@@ -32,6 +51,9 @@ class SheetRecordService(ISheetRecordService):
     async def get_paginated(self, request: PaginatedRequest[SheetRecordFilters]) -> PaginatedResult[Record]:
         return await self._sheet_record_repository.get_paginated(request)
 
+    def iter_records(self, filters: SheetRecordFilters, batch_size: int = 1000) -> AsyncIterator[Record]:
+        return self._sheet_record_repository.iter_records(filters, batch_size)
+
     async def create(self, sheet_uuid: UUID, new_record_data: NewRecordData) -> Record:
         sheet = await self._sheet_repository.get_by_uuid(sheet_uuid)
         if sheet is None:
@@ -53,6 +75,25 @@ class SheetRecordService(ISheetRecordService):
 
         return await self._sheet_record_repository.add(sheet.uuid, record)
 
+    async def create_many(self, sheet_uuid: UUID, new_records_data: list[NewRecordData]) -> list[Record]:
+        sheet = await self._sheet_repository.get_by_uuid(sheet_uuid)
+        if sheet is None:
+            raise SheetNotFoundDomainException(sheet_uuid)
+
+        try:
+            records = [
+                Record(uuid=uuid4(), **new_record_data.model_dump())
+                for new_record_data in new_records_data
+            ]
+            _SheetRecordsValidator(
+                sheet=sheet,
+                records=records
+            )
+        except ValidationError as e:
+            raise ModelValidationDomainException(e)
+
+        return await self._sheet_record_repository.add_many(sheet.uuid, records)
+
     async def delete(self, sheet_uuid: UUID, record_uuid: UUID) -> None:
         sheet = await self._sheet_repository.get_by_uuid(sheet_uuid)
         if sheet is None:
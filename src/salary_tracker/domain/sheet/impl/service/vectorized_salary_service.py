@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+from uuid import UUID
+
+import numpy as np
+from pydantic import ConfigDict, validate_call
+
+from salary_tracker.domain.sheet.impl.service.salary_service import SalaryService
+from salary_tracker.domain.sheet.models import RecordColumns, SalarySummary
+from salary_tracker.domain.sheet.repositories import ISheetRepository, ISalaryRepository, IRateTableRepository
+from salary_tracker.domain.sheet.timeline import RateTableTimeline
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _microseconds(value: datetime | timedelta) -> int:
+    if isinstance(value, datetime):
+        value = value - _EPOCH
+
+    return value // _ONE_MICROSECOND
+
+
+def _lookup(known_values: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    indices = np.minimum(np.searchsorted(known_values, values), len(known_values) - 1)
+    return indices, known_values[indices] == values
+
+
+def price_record_columns(timeline: RateTableTimeline, record_columns: RecordColumns) -> SalarySummary:
+    happened_at = np.asarray(record_columns.happened_at, dtype=np.int64)
+    group_sizes = np.asarray(record_columns.group_sizes, dtype=np.int64)
+    durations = np.asarray(record_columns.durations, dtype=np.int64)
+
+    rate_tables = timeline.rate_tables
+    if not rate_tables:
+        return SalarySummary(salary=Decimal(0), unpriced_records_count=len(happened_at))
+
+    # the timeline's intervals as arrays, searchsorted then resolves every record at once
+    valid_froms = np.array([_microseconds(rate_table.valid_from) for rate_table in rate_tables], dtype=np.int64)
+    valid_tos = np.array([_microseconds(rate_table.valid_to) for rate_table in rate_tables], dtype=np.int64)
+
+    known_group_sizes = np.unique(np.array(
+        [rate.group_size for rate_table in rate_tables for rate in rate_table.rates], dtype=np.int64
+    ))
+    known_durations = np.unique(np.array(
+        [_microseconds(rate.duration) for rate_table in rate_tables for rate in rate_table.rates], dtype=np.int64
+    ))
+
+    # rates in integer cents so the sum is exact, -1 marks a missing rate
+    rate_cents = np.full((len(rate_tables), len(known_group_sizes), len(known_durations)), -1, dtype=np.int64)
+    group_size_positions = {int(group_size): index for index, group_size in enumerate(known_group_sizes)}
+    duration_positions = {int(duration): index for index, duration in enumerate(known_durations)}
+    for table_index, rate_table in enumerate(rate_tables):
+        # reversed, so the first of duplicated rates wins like in RateTable.get_salary
+        for rate in reversed(rate_table.rates):
+            rate_cents[
+                table_index,
+                group_size_positions[rate.group_size],
+                duration_positions[_microseconds(rate.duration)]
+            ] = int(rate.rate * 100)
+
+    table_indices = np.searchsorted(valid_froms, happened_at, side="right") - 1
+    in_table = table_indices >= 0
+    table_indices = np.maximum(table_indices, 0)
+    in_table &= happened_at <= valid_tos[table_indices]
+
+    group_size_indices, known_group_size = _lookup(known_group_sizes, group_sizes)
+    duration_indices, known_duration = _lookup(known_durations, durations)
+
+    cents = rate_cents[table_indices, group_size_indices, duration_indices]
+    priced = in_table & known_group_size & known_duration & (cents >= 0)
+
+    return SalarySummary(
+        salary=Decimal(int(cents[priced].sum())).scaleb(-2),
+        unpriced_records_count=int(np.count_nonzero(~priced))
+    )
+
+
+class VectorizedSalaryService(SalaryService):
+    @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+    def __init__(self, sheet_repository: ISheetRepository, salary_repository: ISalaryRepository,
+                 rate_table_repository: IRateTableRepository):
+        super().__init__(sheet_repository=sheet_repository, salary_repository=salary_repository)
+        self.rate_table_repository = rate_table_repository
+
+    async def _scan_salary(self, sheet_uuid: UUID, ranges: list[tuple[datetime, datetime]]) -> Decimal:
+        if not ranges:
+            return Decimal(0)
+
+        # loaded once for all ranges of the calculation
+        timeline = await RateTableTimeline.load(self.rate_table_repository, sheet_uuid)
+
+        salary = Decimal(0)
+        for datetime_from, datetime_to in ranges:
+            record_columns = await self.salary_repository.get_record_columns(sheet_uuid, datetime_from, datetime_to)
+
+            summary = price_record_columns(timeline, record_columns)
+            if summary.unpriced_records_count:
+                # the database scan reports which records are unpriced
+                return await super()._scan_salary(sheet_uuid, [(datetime_from, datetime_to)])
+
+            salary += summary.salary
+
+        return salary
@@ -1,8 +1,11 @@
 from datetime import timedelta
+from decimal import Decimal
+from enum import StrEnum
+from typing import Annotated
 from uuid import UUID
 
 from pydantic import BaseModel, PositiveInt, AwareDatetime, conset, conlist, condecimal, \
-    model_validator
+    model_validator, NonNegativeInt, ConfigDict, Field
 
 from salary_tracker.domain.exceptions import DomainException
 
@@ -12,25 +15,43 @@ class Rate(BaseModel):
     group_size: PositiveInt
     duration: timedelta
 
+    model_config = ConfigDict(frozen=True)
+
 
 class RateTable(BaseModel):
     uuid: UUID
     valid_from: AwareDatetime
     valid_to: AwareDatetime
-    rates: conlist(Rate, min_length=1)
+    # immutable, so the rates lookup can't go stale through changes made in place
+    rates: Annotated[tuple[Rate, ...], Field(min_length=1)]
 
     @model_validator(mode='after')
     def check_model(self):
         if self.valid_to <= self.valid_from:
             raise ValueError("valid_to must be greater than or equal to valid_from")
+
         return self
 
+    @property
+    def _rates_lookup(self) -> dict[tuple[int, timedelta], Decimal]:
+        # kept in __dict__, which is much cheaper to read than a pydantic private attribute. It remembers the rates it
+        # was built from, copies and assignments with other rates rebuild it
+        rates, rates_lookup = self.__dict__.get('_rates_lookup_entry', (None, None))
+        if rates is not self.rates:
+            rates_lookup = {}
+            for rate in self.rates:
+                rates_lookup.setdefault((rate.group_size, rate.duration), rate.rate)
+
+            self.__dict__['_rates_lookup_entry'] = (self.rates, rates_lookup)
+
+        return rates_lookup
+
     def get_salary(self, group_size: PositiveInt, duration: timedelta) -> condecimal(ge=0, decimal_places=2):
-        for rate in self.rates:
-            if rate.group_size == group_size and rate.duration == duration:
-                return rate.rate
+        rate = self._rates_lookup.get((group_size, duration))
+        if rate is None:
+            raise DomainException(f"Rate not found for group_size={group_size} and duration={duration}")
 
-        raise DomainException(f"Rate not found for group_size={group_size} and duration={duration}")
+        return rate
 
 
 class Record(BaseModel):
@@ -84,3 +105,90 @@ class Salary(BaseModel):
     datetime_from: AwareDatetime
     datetime_to: AwareDatetime
     salary: condecimal(ge=0, decimal_places=2)
+
+
+class SalaryPeriod(BaseModel):
+    datetime_from: AwareDatetime
+    datetime_to: AwareDatetime
+
+
+class SalaryPeriodsData(BaseModel):
+    periods: conlist(SalaryPeriod, min_length=1, max_length=100)
+
+
+class SalaryCalculation(BaseModel):
+    salary: condecimal(ge=0, decimal_places=2)
+    unpriced_record_uuids: list[UUID]
+
+
+class RecordColumns(BaseModel):
+    # integer microseconds, the unix epoch for happened_at, so the columns load straight into arrays
+    happened_at: list[int]
+    group_sizes: list[int]
+    durations: list[int]
+
+
+class SalarySummary(BaseModel):
+    salary: condecimal(ge=0, decimal_places=2)
+    unpriced_records_count: NonNegativeInt
+
+
+class SheetSalaryCalculation(BaseModel):
+    sheet_uuid: UUID
+    title: str
+    salary: condecimal(ge=0, decimal_places=2)
+    unpriced_record_uuids: list[UUID]
+
+
+class SheetSalary(BaseModel):
+    sheet_uuid: UUID
+    title: str
+    salary: condecimal(ge=0, decimal_places=2)
+
+
+class UserSalary(BaseModel):
+    datetime_from: AwareDatetime
+    datetime_to: AwareDatetime
+    salary: condecimal(ge=0, decimal_places=2)
+    sheets: list[SheetSalary]
+
+
+class SalaryGranularity(StrEnum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class SalaryBucket(BaseModel):
+    bucket_start: AwareDatetime
+    salary: condecimal(ge=0, decimal_places=2)
+    records_count: NonNegativeInt
+    total_duration: timedelta
+
+
+class SalaryBreakdown(BaseModel):
+    datetime_from: AwareDatetime
+    datetime_to: AwareDatetime
+    granularity: SalaryGranularity
+    timezone: str
+    buckets: list[SalaryBucket]
+
+
+class SalaryBreakdownCalculation(BaseModel):
+    buckets: list[SalaryBucket]
+    unpriced_record_uuids: list[UUID]
+
+
+class SalaryCacheKey(BaseModel):
+    sheet_uuid: UUID
+    datetime_from: AwareDatetime
+    datetime_to: AwareDatetime
+    data_version: NonNegativeInt
+
+    model_config = ConfigDict(frozen=True)
+
+
+class SalaryCacheStats(BaseModel):
+    hits: NonNegativeInt
+    misses: NonNegativeInt
+    size: NonNegativeInt
@@ -0,0 +1,13 @@
+from datetime import datetime, UTC
+
+
+def month_start(value: datetime) -> datetime:
+    return value.astimezone(UTC).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month_start(value: datetime) -> datetime:
+    start = month_start(value)
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+
+    return start.replace(month=start.month + 1)
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
 from uuid import UUID
 
 from salary_tracker.domain.pagination import PaginatedRequest, PaginatedResult
-from salary_tracker.domain.sheet.models import Sheet, RateTable, Record, SheetRecordFilters, Salary
+from salary_tracker.domain.sheet.models import Sheet, RateTable, Record, SheetRecordFilters, SalaryCalculation, \
+    SalaryGranularity, SalaryBreakdownCalculation, SalarySummary, SalaryPeriod, \
+    RecordColumns, SheetSalaryCalculation
 
 
 class ISheetRepository(ABC):
@@ -12,6 +15,10 @@ class ISheetRepository(ABC):
     async def get_by_uuid(self, sheet_uuid: UUID) -> Sheet | None:
         pass
 
+    @abstractmethod
+    async def get_data_version(self, sheet_uuid: UUID) -> int | None:
+        pass
+
     @abstractmethod
     async def get_by_owner_paginated(self, request: PaginatedRequest[UUID]) -> PaginatedResult[Sheet]:
         pass
@@ -46,6 +53,10 @@ class ISheetRecordRepository(ABC):
     async def get_paginated(self, request: PaginatedRequest[SheetRecordFilters]) -> PaginatedResult[Record]:
         pass
 
+    @abstractmethod
+    def iter_records(self, filters: SheetRecordFilters, batch_size: int = 1000) -> AsyncIterator[Record]:
+        pass
+
     @abstractmethod
     async def get_by_uuid(self, sheet_uuid: UUID, record_uuid: UUID) -> Record | None:
         pass
@@ -54,6 +65,10 @@ class ISheetRecordRepository(ABC):
     async def add(self, sheet_uuid: UUID, record: Record) -> Record:
         pass
 
+    @abstractmethod
+    async def add_many(self, sheet_uuid: UUID, records: list[Record]) -> list[Record]:
+        pass
+
     @abstractmethod
     async def delete(self, sheet_uuid: UUID, record_uuid: UUID) -> None:
         pass
@@ -62,5 +77,29 @@ class ISheetRecordRepository(ABC):
 class ISalaryRepository(ABC):
 
     @abstractmethod
-    async def get_salary(self, sheet_uuid: UUID, datetime_from: datetime, datetime_to: datetime) -> Salary:
+    async def get_salary(self, sheet_uuid: UUID, datetime_from: datetime,
+                         datetime_to: datetime) -> SalaryCalculation:
+        pass
+
+    @abstractmethod
+    async def get_salaries(self, sheet_uuid: UUID, periods: list[SalaryPeriod]) -> list[SalaryCalculation]:
+        pass
+
+    @abstractmethod
+    async def get_salaries_by_owner(self, owner_user_uuid: UUID, datetime_from: datetime,
+                                    datetime_to: datetime) -> list[SheetSalaryCalculation]:
+        pass
+
+    @abstractmethod
+    async def get_salary_breakdown(self, sheet_uuid: UUID, datetime_from: datetime, datetime_to: datetime,
+                                   granularity: SalaryGranularity, timezone: str) -> SalaryBreakdownCalculation:
+        pass
+
+    @abstractmethod
+    async def get_salary_summary(self, sheet_uuid: UUID, month_from: datetime, month_to: datetime) -> SalarySummary:
+        pass
+
+    @abstractmethod
+    async def get_record_columns(self, sheet_uuid: UUID, datetime_from: datetime,
+                                 datetime_to: datetime) -> RecordColumns:
         pass
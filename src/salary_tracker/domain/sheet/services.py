@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from datetime import datetime
 from uuid import UUID
 
 from salary_tracker.domain.pagination import PaginatedRequest, PaginatedResult
 from salary_tracker.domain.sheet.models import Sheet, NewSheetData, RateTableData, RateTable, Record, \
-    NewRecordData, SheetRecordFilters, Salary
+    NewRecordData, SheetRecordFilters, Salary, SalaryGranularity, SalaryBreakdown, SalaryPeriod, \
+    UserSalary
 
 
 class ISheetService(ABC):
@@ -47,10 +49,18 @@ class ISheetRecordService(ABC):
     async def get_paginated(self, request: PaginatedRequest[SheetRecordFilters]) -> PaginatedResult[Record]:
         pass
 
+    @abstractmethod
+    def iter_records(self, filters: SheetRecordFilters, batch_size: int = 1000) -> AsyncIterator[Record]:
+        pass
+
     @abstractmethod
     async def create(self, sheet_uuid: UUID, new_record_data: NewRecordData) -> Record:
         pass
 
+    @abstractmethod
+    async def create_many(self, sheet_uuid: UUID, new_records_data: list[NewRecordData]) -> list[Record]:
+        pass
+
     @abstractmethod
     async def delete(self, sheet_uuid: UUID, record_uuid: UUID) -> None:
         pass
@@ -61,3 +71,17 @@ class ISalaryService(ABC):
     @abstractmethod
     async def calculate_salary(self, sheet_uuid: UUID, datetime_from: datetime, datetime_to: datetime) -> Salary:
         pass
+
+    @abstractmethod
+    async def calculate_salaries(self, sheet_uuid: UUID, periods: list[SalaryPeriod]) -> list[Salary]:
+        pass
+
+    @abstractmethod
+    async def calculate_user_salary(self, owner_user_uuid: UUID, datetime_from: datetime,
+                                    datetime_to: datetime) -> UserSalary:
+        pass
+
+    @abstractmethod
+    async def calculate_salary_breakdown(self, sheet_uuid: UUID, datetime_from: datetime, datetime_to: datetime,
+                                         granularity: SalaryGranularity, timezone: str) -> SalaryBreakdown:
+        pass
@@ -0,0 +1,49 @@
+from bisect import bisect_right
+from datetime import datetime
+from typing import Iterable
+from uuid import UUID
+
+from salary_tracker.domain.sheet.models import RateTable
+from salary_tracker.domain.sheet.repositories import IRateTableRepository
+
+
+class RateTableTimeline:
+    def __init__(self, rate_tables: Iterable[RateTable]):
+        self._rate_tables = sorted(rate_tables, key=lambda x: x.valid_from)
+        self._valid_froms = [rate_table.valid_from for rate_table in self._rate_tables]
+
+    @property
+    def rate_tables(self) -> list[RateTable]:
+        # ordered by valid_from
+        return list(self._rate_tables)
+
+    @classmethod
+    async def load(cls, rate_table_repository: IRateTableRepository, sheet_uuid: UUID) -> 'RateTableTimeline':
+        return cls(await rate_table_repository.get_for_sheet(sheet_uuid))
+
+    def resolve(self, datetime_point: datetime) -> RateTable | None:
+        index = bisect_right(self._valid_froms, datetime_point) - 1
+        if index < 0:
+            return None
+
+        rate_table = self._rate_tables[index]
+        if datetime_point > rate_table.valid_to:
+            return None
+
+        return rate_table
+
+    def resolve_many(self, datetime_points: Iterable[datetime]) -> list[RateTable | None]:
+        datetime_points = list(datetime_points)
+        result: list[RateTable | None] = [None] * len(datetime_points)
+
+        # sorted() is linear for already sorted input, so the usual chronological batches cost a single pass
+        index = -1
+        for position in sorted(range(len(datetime_points)), key=datetime_points.__getitem__):
+            datetime_point = datetime_points[position]
+            while index + 1 < len(self._valid_froms) and self._valid_froms[index + 1] <= datetime_point:
+                index += 1
+
+            if index >= 0 and datetime_point <= self._rate_tables[index].valid_to:
+                result[position] = self._rate_tables[index]
+
+        return result
@@ -0,0 +1,51 @@
+import hashlib
+import hmac
+from base64 import urlsafe_b64encode, urlsafe_b64decode
+from binascii import Error as BinasciiError
+
+from pydantic import ValidationError, BaseModel
+
+from salary_tracker.domain.pagination import PageCursor, PaginatedResult
+from salary_tracker.usecase.exceptions import InvalidCursorException
+
+
+def _b64encode(value: bytes) -> str:
+    return urlsafe_b64encode(value).rstrip(b"=").decode()
+
+
+def _b64decode(value: str) -> bytes:
+    return urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+class CursorCodec:
+    def __init__(self, secret: str):
+        self._secret = secret.encode()
+
+    def _sign(self, payload: bytes, scope: str) -> bytes:
+        # the scope ties a cursor to the listing it came from
+        return hmac.new(self._secret, scope.encode() + b"\0" + payload, hashlib.sha256).digest()
+
+    def encode(self, cursor: PageCursor, scope: str) -> str:
+        payload = cursor.model_dump_json().encode()
+        return f"{_b64encode(payload)}.{_b64encode(self._sign(payload, scope))}"
+
+    def decode(self, value: str, scope: str) -> PageCursor:
+        try:
+            payload, signature = (_b64decode(part) for part in value.split("."))
+        except (ValueError, BinasciiError):
+            raise InvalidCursorException("Malformed cursor")
+
+        if not hmac.compare_digest(signature, self._sign(payload, scope)):
+            raise InvalidCursorException("Cursor signature does not match")
+
+        try:
+            return PageCursor.model_validate_json(payload)
+        except ValidationError:
+            raise InvalidCursorException("Malformed cursor")
+
+    def encode_result(self, result: PaginatedResult[BaseModel], scope: str) -> dict:
+        return {
+            **result.model_dump(exclude={"next_cursor", "prev_cursor"}),
+            "next_cursor": self.encode(result.next_cursor, scope) if result.next_cursor else None,
+            "prev_cursor": self.encode(result.prev_cursor, scope) if result.prev_cursor else None
+        }
@@ -0,0 +1,32 @@
+from functools import lru_cache
+
+from fastapi import Depends
+
+from salary_tracker.domain.auth.caches import IAccessTokenCache, ICertificateCache
+from salary_tracker.domain.auth.impl.cache.http_certificate_cache import HttpCertificateCache
+from salary_tracker.domain.auth.impl.cache.in_memory_access_token_cache import InMemoryAccessTokenCache
+from salary_tracker.domain.sheet.caches import ISalaryCache
+from salary_tracker.domain.sheet.impl.cache.in_memory_salary_cache import InMemorySalaryCache
+from salary_tracker.presentation.dependencies.presentation import get_settings
+from salary_tracker.presentation.settings import AppSettings
+
+
+@lru_cache
+def get_salary_cache(
+        settings: AppSettings = Depends(get_settings)
+) -> ISalaryCache:
+    return InMemorySalaryCache(max_size=settings.salary_cache_max_size, ttl=settings.salary_cache_ttl)
+
+
+@lru_cache
+def get_access_token_cache(
+        settings: AppSettings = Depends(get_settings)
+) -> IAccessTokenCache:
+    return InMemoryAccessTokenCache(max_size=settings.access_token_cache_max_size)
+
+
+@lru_cache
+def get_google_certificate_cache(
+        settings: AppSettings = Depends(get_settings)
+) -> ICertificateCache:
+    return HttpCertificateCache(url=settings.google_certificates_url)
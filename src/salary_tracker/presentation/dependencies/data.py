@@ -1,33 +1,85 @@
 from functools import lru_cache
 
-from fastapi import Depends
+from fastapi import Depends, Request, Response
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from salary_tracker.data.database import Database
 from salary_tracker.data.repositories.auth.refresh_token_repository import RefreshTokenRepository
 from salary_tracker.data.repositories.auth.user_external_account_repository import UserExternalAccountRepository
 from salary_tracker.data.repositories.sheet.rate_table_repository import RateTableRepository
+from salary_tracker.data.repositories.sheet.salary_repository import SalaryRepository
 from salary_tracker.data.repositories.sheet.sheet_record_repository import SheetRecordRepository
 from salary_tracker.data.repositories.sheet.sheet_repository import SheetRepository
 from salary_tracker.data.repositories.user.user_repository import UserRepository
 from salary_tracker.domain.auth.repositories import IRefreshTokenRepository, IUserExternalAccountRepository
-from salary_tracker.domain.sheet.repositories import ISheetRepository, IRateTableRepository, ISheetRecordRepository
+from salary_tracker.domain.sheet.repositories import ISheetRepository, IRateTableRepository, ISheetRecordRepository, \
+    ISalaryRepository
 from salary_tracker.domain.user.repositories import IUserRepository
 from salary_tracker.presentation.dependencies.presentation import get_settings
+from salary_tracker.presentation.routing import track_request_session
 from salary_tracker.presentation.settings import AppSettings
 
 
+_PRIMARY_READS_COOKIE_NAME = "primary_reads"
+
+
+def _keep_reads_on_primary_after_commit(session: AsyncSession, response: Response, settings: AppSettings) -> None:
+    # replicas may not have replayed the write yet, the cookie routes this client's reads to the primary meanwhile
+    def after_commit(_):
+        if _PRIMARY_READS_COOKIE_NAME not in session.info:
+            session.info[_PRIMARY_READS_COOKIE_NAME] = True
+            response.set_cookie(
+                key=_PRIMARY_READS_COOKIE_NAME,
+                value="1",
+                max_age=max(int(settings.database_read_your_writes_window.total_seconds()), 1),
+                httponly=True,
+                # sent along with the refresh token cookie, so a frontend on another site gets it back as well
+                secure=settings.refresh_token_cookie_secure,
+                samesite=settings.refresh_token_cookie_same_site,
+                domain=settings.refresh_token_cookie_domain
+            )
+
+    event.listen(session.sync_session, "after_commit", after_commit)
+
+
 @lru_cache
 def get_database(
         settings: AppSettings = Depends(get_settings)
 ) -> Database:
-    return Database(settings.database_url.unicode_string())
+    return Database(
+        settings.database_url.unicode_string(),
+        replica_urls=[replica_url.unicode_string() for replica_url in settings.database_replica_urls],
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        prepared_statement_cache_size=settings.database_prepared_statement_cache_size,
+        command_timeout=settings.database_command_timeout
+    )
 
 
 async def get_session(
-        database: Database = Depends(get_database)
+        response: Response,
+        database: Database = Depends(get_database),
+        settings: AppSettings = Depends(get_settings)
 ) -> AsyncSession:
+    # no connection is checked out until the first statement, SessionReleasingRoute returns it once the endpoint is done
     async with database.session() as session:
+        track_request_session(session)
+        if database.has_replicas:
+            _keep_reads_on_primary_after_commit(session, response, settings)
+
+        yield session
+
+
+async def get_read_session(
+        request: Request,
+        database: Database = Depends(get_database)
+) -> AsyncSession:
+    async with database.read_session(use_primary=_PRIMARY_READS_COOKIE_NAME in request.cookies) as session:
+        track_request_session(session)
         yield session
 
 
@@ -64,4 +116,34 @@ async def get_rate_table_repository(
 async def get_sheet_record_repository(
         session: AsyncSession = Depends(get_session),
 ) -> ISheetRecordRepository:
-    return SheetRecordRepository(session=session)
\ No newline at end of file
+    return SheetRecordRepository(session=session)
+
+
+async def get_read_user_repository(
+        session: AsyncSession = Depends(get_read_session),
+) -> IUserRepository:
+    return UserRepository(session=session)
+
+
+async def get_read_sheet_repository(
+        session: AsyncSession = Depends(get_read_session),
+) -> ISheetRepository:
+    return SheetRepository(session=session)
+
+
+async def get_read_rate_table_repository(
+        session: AsyncSession = Depends(get_read_session),
+) -> IRateTableRepository:
+    return RateTableRepository(session=session)
+
+
+async def get_read_sheet_record_repository(
+        session: AsyncSession = Depends(get_read_session),
+) -> ISheetRecordRepository:
+    return SheetRecordRepository(session=session)
+
+
+async def get_read_salary_repository(
+        session: AsyncSession = Depends(get_read_session),
+) -> ISalaryRepository:
+    return SalaryRepository(session=session)
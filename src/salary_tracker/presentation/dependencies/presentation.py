@@ -1,7 +1,29 @@
 from functools import lru_cache
 
+from fastapi import Depends, Request
+
+from salary_tracker.domain.pagination import PageCursor
+from salary_tracker.presentation.cursor import CursorCodec
 from salary_tracker.presentation.settings import AppSettings
 
 @lru_cache
 def get_settings() -> AppSettings:
-    return AppSettings()
\ No newline at end of file
+    return AppSettings()
+
+
+@lru_cache
+def get_cursor_codec(
+        settings: AppSettings = Depends(get_settings)
+) -> CursorCodec:
+    return CursorCodec(secret=settings.pagination_cursor_secret)
+
+
+async def get_page_cursor(
+        request: Request,
+        cursor: str | None = None,
+        cursor_codec: CursorCodec = Depends(get_cursor_codec)
+) -> PageCursor | None:
+    if cursor is None:
+        return None
+
+    return cursor_codec.decode(cursor, scope=request.url.path)
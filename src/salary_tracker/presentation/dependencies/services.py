@@ -1,25 +1,38 @@
+from functools import lru_cache
+
 from fastapi import Depends
 
+from salary_tracker.domain.auth.caches import IAccessTokenCache, ICertificateCache
 from salary_tracker.domain.auth.factories import IAuthProviderUserDataExtractorFactory
 from salary_tracker.domain.auth.impl.provider.auth_provider_service import AuthProviderService
 from salary_tracker.domain.auth.impl.provider.auth_provider_user_data_extractor_factory import \
     AuthProviderUserDataExtractorFactory
+from salary_tracker.domain.auth.impl.token.cached_token_service import CachedTokenService
+from salary_tracker.domain.auth.impl.token.token_key_ring import TokenKeyRing
 from salary_tracker.domain.auth.impl.token.token_service import TokenService
+from salary_tracker.domain.auth.keys import ITokenKeyRing
 from salary_tracker.domain.auth.models import TokenSettings
 from salary_tracker.domain.auth.repositories import IRefreshTokenRepository, IUserExternalAccountRepository
 from salary_tracker.domain.auth.services import ITokenService, IAuthProviderService
+from salary_tracker.domain.sheet.caches import ISalaryCache
 from salary_tracker.domain.sheet.factories import IRateTableFactory
+from salary_tracker.domain.sheet.impl.service.cached_salary_service import CachedSalaryService
 from salary_tracker.domain.sheet.impl.service.rate_table_service import RateTableService
 from salary_tracker.domain.sheet.impl.service.salary_service import SalaryService
 from salary_tracker.domain.sheet.impl.service.sheet_record_service import SheetRecordService
 from salary_tracker.domain.sheet.impl.service.sheet_service import SheetService
-from salary_tracker.domain.sheet.repositories import ISheetRepository, IRateTableRepository, ISheetRecordRepository
+from salary_tracker.domain.sheet.repositories import ISheetRepository, IRateTableRepository, ISheetRecordRepository, \
+    ISalaryRepository
 from salary_tracker.domain.sheet.services import ISheetService, IRateTableService, ISheetRecordService, ISalaryService
 from salary_tracker.domain.user.impl.user_service import UserService
 from salary_tracker.domain.user.repositories import IUserRepository
 from salary_tracker.domain.user.services import IUserService
+from salary_tracker.presentation.dependencies.caches import get_salary_cache, get_access_token_cache, \
+    get_google_certificate_cache
 from salary_tracker.presentation.dependencies.data import get_user_repository, get_refresh_token_repository, \
-    get_user_external_account_repository, get_sheet_repository, get_rate_table_repository, get_sheet_record_repository
+    get_user_external_account_repository, get_sheet_repository, get_rate_table_repository, get_sheet_record_repository, \
+    get_read_user_repository, get_read_sheet_repository, get_read_rate_table_repository, \
+    get_read_sheet_record_repository, get_read_salary_repository
 from salary_tracker.presentation.dependencies.factories import get_rate_table_factory
 from salary_tracker.presentation.dependencies.presentation import get_settings
 from salary_tracker.presentation.settings import AppSettings
@@ -31,28 +44,49 @@ async def get_user_service(
     return UserService(user_repository=user_repository)
 
 
+@lru_cache
+def get_token_key_ring(
+        settings: AppSettings = Depends(get_settings)
+) -> ITokenKeyRing:
+    return TokenKeyRing(
+        private_key=settings.access_token_private_key,
+        verification_keys=settings.access_token_verification_keys
+    )
+
+
 async def get_token_service(
         refresh_token_repository: IRefreshTokenRepository = Depends(get_refresh_token_repository),
         user_repository: IUserRepository = Depends(get_user_repository),
+        token_key_ring: ITokenKeyRing = Depends(get_token_key_ring),
+        access_token_cache: IAccessTokenCache = Depends(get_access_token_cache),
         settings: AppSettings = Depends(get_settings),
 ) -> ITokenService:
-    return TokenService(
+    token_service = TokenService(
         token_settings=TokenSettings(
-            access_token_private_key=settings.access_token_private_key,
             access_token_expiration_time=settings.access_token_expiration_time,
             access_token_issuer=settings.access_token_issuer,
             access_token_audience=settings.access_token_audience,
             refresh_token_expiration_time=settings.refresh_token_expiration_time
         ),
+        token_key_ring=token_key_ring,
         refresh_token_repository=refresh_token_repository,
         user_repository=user_repository
     )
 
+    return CachedTokenService(
+        token_service=token_service,
+        access_token_cache=access_token_cache
+    )
+
 
 async def get_auth_provider_user_data_extractor_factory(
+        google_certificate_cache: ICertificateCache = Depends(get_google_certificate_cache),
         settings: AppSettings = Depends(get_settings),
 ) -> IAuthProviderUserDataExtractorFactory:
-    return AuthProviderUserDataExtractorFactory(google_app_client_id=settings.google_app_client_id)
+    return AuthProviderUserDataExtractorFactory(
+        google_app_client_id=settings.google_app_client_id,
+        google_certificate_cache=google_certificate_cache
+    )
 
 
 async def get_auth_provider_service(
@@ -105,13 +139,82 @@ async def get_sheet_record_service(
     )
 
 
-async def get_salary_service(
-        sheet_repository: ISheetRepository = Depends(get_sheet_repository),
-        sheet_record_repository: ISheetRecordRepository = Depends(get_sheet_record_repository),
-        rate_table_repository: IRateTableRepository = Depends(get_rate_table_repository),
+async def get_read_sheet_service(
+        sheet_repository: ISheetRepository = Depends(get_read_sheet_repository),
+        user_repository: IUserRepository = Depends(get_read_user_repository),
+        rate_table_repository: IRateTableRepository = Depends(get_read_rate_table_repository),
+        rate_table_factory: IRateTableFactory = Depends(get_rate_table_factory),
+) -> ISheetService:
+    return SheetService(
+        sheet_repository=sheet_repository,
+        user_repository=user_repository,
+        rate_table_repository=rate_table_repository,
+        rate_table_factory=rate_table_factory
+    )
+
+
+async def get_read_rate_table_service(
+        sheet_repository: ISheetRepository = Depends(get_read_sheet_repository),
+        rate_table_repository: IRateTableRepository = Depends(get_read_rate_table_repository),
+        rate_table_factory: IRateTableFactory = Depends(get_rate_table_factory),
+) -> IRateTableService:
+    return RateTableService(
+        sheet_repository=sheet_repository,
+        rate_table_repository=rate_table_repository,
+        rate_table_factory=rate_table_factory
+    )
+
+
+async def get_read_sheet_record_service(
+        sheet_repository: ISheetRepository = Depends(get_read_sheet_repository),
+        sheet_record_repository: ISheetRecordRepository = Depends(get_read_sheet_record_repository),
+) -> ISheetRecordService:
+    return SheetRecordService(
+        sheet_repository=sheet_repository,
+        sheet_record_repository=sheet_record_repository
+    )
+
+
+@lru_cache
+def get_salary_service_class(
+        settings: AppSettings = Depends(get_settings)
+) -> type[SalaryService]:
+    if settings.salary_engine == 'vectorized':
+        # imported here so numpy is only needed when the vectorized engine is enabled
+        try:
+            from salary_tracker.domain.sheet.impl.service.vectorized_salary_service import VectorizedSalaryService
+        except ImportError as e:
+            raise RuntimeError(
+                "SALARY_ENGINE='vectorized' needs numpy, install requirements-vectorized.txt"
+            ) from e
+
+        return VectorizedSalaryService
+
+    return SalaryService
+
+
+async def get_read_salary_service(
+        sheet_repository: ISheetRepository = Depends(get_read_sheet_repository),
+        salary_repository: ISalaryRepository = Depends(get_read_salary_repository),
+        rate_table_repository: IRateTableRepository = Depends(get_read_rate_table_repository),
+        salary_cache: ISalaryCache = Depends(get_salary_cache),
+        salary_service_class: type[SalaryService] = Depends(get_salary_service_class),
+        settings: AppSettings = Depends(get_settings),
 ) -> ISalaryService:
-    return SalaryService(
+    if settings.salary_engine == 'vectorized':
+        salary_service = salary_service_class(
+            sheet_repository=sheet_repository,
+            salary_repository=salary_repository,
+            rate_table_repository=rate_table_repository
+        )
+    else:
+        salary_service = salary_service_class(
+            sheet_repository=sheet_repository,
+            salary_repository=salary_repository
+        )
+
+    return CachedSalaryService(
+        salary_service=salary_service,
         sheet_repository=sheet_repository,
-        sheet_record_repository=sheet_record_repository,
-        rate_table_repository=rate_table_repository
+        salary_cache=salary_cache
     )
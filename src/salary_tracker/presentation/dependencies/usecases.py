@@ -1,11 +1,15 @@
 from fastapi import Depends
 
+from salary_tracker.domain.auth.keys import ITokenKeyRing
 from salary_tracker.domain.auth.services import ITokenService, IAuthProviderService
 from salary_tracker.domain.sheet.services import ISheetService, IRateTableService, ISheetRecordService, ISalaryService
 from salary_tracker.domain.user.services import IUserService
 from salary_tracker.presentation.dependencies.services import get_user_service, get_token_service, \
-    get_auth_provider_service, get_sheet_service, get_rate_table_service, get_sheet_record_service, get_salary_service
+    get_auth_provider_service, get_sheet_service, get_rate_table_service, get_sheet_record_service, \
+    get_read_sheet_service, get_read_rate_table_service, get_read_sheet_record_service, get_read_salary_service, \
+    get_token_key_ring
 from salary_tracker.usecase.auth.auth_provider_login import LoginWithAuthProviderUseCase
+from salary_tracker.usecase.auth.get_json_web_key_set import GetJsonWebKeySetUseCase
 from salary_tracker.usecase.auth.rotate_refresh_token import RotateRefreshTokenUseCase
 from salary_tracker.usecase.auth.validate_access_token import ValidateAccessTokenUseCase
 from salary_tracker.usecase.sheet.create_sheet import CreateSheetUseCase
@@ -15,9 +19,13 @@ from salary_tracker.usecase.sheet.get_user_sheets import GetPaginatedUserSheetsU
 from salary_tracker.usecase.sheet.rate_table.add_rate_table import AddSheetRateTableUseCase
 from salary_tracker.usecase.sheet.rate_table.get_rate_table_for_datetime import GetRateTableForDatetime
 from salary_tracker.usecase.sheet.record.add_record import AddSheetRecordUseCase
+from salary_tracker.usecase.sheet.record.add_records import AddSheetRecordsUseCase
 from salary_tracker.usecase.sheet.record.delete_record import DeleteRecordUseCase
 from salary_tracker.usecase.sheet.record.get_paginated_sheet_records import GetPaginatedSheetRecordsUseCase
+from salary_tracker.usecase.sheet.salary.calculate_salaries import CalculateSalariesUseCase
 from salary_tracker.usecase.sheet.salary.calculate_salary import CalculateSalaryUseCase
+from salary_tracker.usecase.sheet.salary.calculate_salary_breakdown import CalculateSalaryBreakdownUseCase
+from salary_tracker.usecase.sheet.salary.calculate_user_salary import CalculateUserSalaryUseCase
 from salary_tracker.usecase.user.get_user import GetUserUseCase
 
 
@@ -47,6 +55,14 @@ async def get_validate_access_token_use_case(
     )
 
 
+async def get_json_web_key_set_use_case(
+        token_key_ring: ITokenKeyRing = Depends(get_token_key_ring)
+) -> GetJsonWebKeySetUseCase:
+    return GetJsonWebKeySetUseCase(
+        token_key_ring=token_key_ring
+    )
+
+
 async def get_user_use_case(
         user_service: IUserService = Depends(get_user_service)
 ) -> GetUserUseCase:
@@ -62,7 +78,7 @@ async def get_create_sheet_use_case(
 
 
 async def get_get_sheet_for_user_use_case(
-        sheet_service: ISheetService = Depends(get_sheet_service)
+        sheet_service: ISheetService = Depends(get_read_sheet_service)
 ) -> GetSheetForUserUseCase:
     return GetSheetForUserUseCase(sheet_service=sheet_service)
 
@@ -75,8 +91,8 @@ async def get_add_sheet_rate_table_use_case(
 
 
 async def get_get_rate_table_for_datetime_use_case(
-        sheet_service: ISheetService = Depends(get_sheet_service),
-        rate_table_service: IRateTableService = Depends(get_rate_table_service)
+        sheet_service: ISheetService = Depends(get_read_sheet_service),
+        rate_table_service: IRateTableService = Depends(get_read_rate_table_service)
 ) -> GetRateTableForDatetime:
     return GetRateTableForDatetime(sheet_service=sheet_service, rate_table_service=rate_table_service)
 
@@ -88,20 +104,47 @@ async def get_add_sheet_record_use_case(
     return AddSheetRecordUseCase(sheet_service=sheet_service, sheet_record_service=sheet_record_service)
 
 
-async def get_get_paginated_sheet_records_use_case(
+async def get_add_sheet_records_use_case(
         sheet_service: ISheetService = Depends(get_sheet_service),
         sheet_record_service: ISheetRecordService = Depends(get_sheet_record_service)
+) -> AddSheetRecordsUseCase:
+    return AddSheetRecordsUseCase(sheet_service=sheet_service, sheet_record_service=sheet_record_service)
+
+
+async def get_get_paginated_sheet_records_use_case(
+        sheet_service: ISheetService = Depends(get_read_sheet_service),
+        sheet_record_service: ISheetRecordService = Depends(get_read_sheet_record_service)
 ) -> GetPaginatedSheetRecordsUseCase:
     return GetPaginatedSheetRecordsUseCase(sheet_service=sheet_service, sheet_record_service=sheet_record_service)
 
 
 async def get_calculate_salary_use_case(
-        sheet_service: ISheetService = Depends(get_sheet_service),
-        salary_service: ISalaryService = Depends(get_salary_service)
+        sheet_service: ISheetService = Depends(get_read_sheet_service),
+        salary_service: ISalaryService = Depends(get_read_salary_service)
 ) -> CalculateSalaryUseCase:
     return CalculateSalaryUseCase(sheet_service=sheet_service, salary_service=salary_service)
 
 
+async def get_calculate_salaries_use_case(
+        sheet_service: ISheetService = Depends(get_read_sheet_service),
+        salary_service: ISalaryService = Depends(get_read_salary_service)
+) -> CalculateSalariesUseCase:
+    return CalculateSalariesUseCase(sheet_service=sheet_service, salary_service=salary_service)
+
+
+async def get_calculate_user_salary_use_case(
+        salary_service: ISalaryService = Depends(get_read_salary_service)
+) -> CalculateUserSalaryUseCase:
+    return CalculateUserSalaryUseCase(salary_service=salary_service)
+
+
+async def get_calculate_salary_breakdown_use_case(
+        sheet_service: ISheetService = Depends(get_read_sheet_service),
+        salary_service: ISalaryService = Depends(get_read_salary_service)
+) -> CalculateSalaryBreakdownUseCase:
+    return CalculateSalaryBreakdownUseCase(sheet_service=sheet_service, salary_service=salary_service)
+
+
 async def get_delete_sheet_use_case(
         sheet_service: ISheetService = Depends(get_sheet_service)
 ) -> DeleteSheetUseCase:
@@ -116,6 +159,6 @@ async def get_delete_record_use_case(
 
 
 async def get_get_paginated_user_sheets_use_case(
-        sheet_service: ISheetService = Depends(get_sheet_service)
+        sheet_service: ISheetService = Depends(get_read_sheet_service)
 ) -> GetPaginatedUserSheetsUseCase:
     return GetPaginatedUserSheetsUseCase(sheet_service=sheet_service)
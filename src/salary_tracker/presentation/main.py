@@ -4,6 +4,7 @@ from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
 from salary_tracker.presentation.dependencies.presentation import get_settings
+from salary_tracker.presentation.dependencies.services import get_token_key_ring, get_salary_service_class
 from salary_tracker.presentation.error_handler import apply_error_handler
 from salary_tracker.presentation.routers.root import get_root_router
 from salary_tracker.presentation.settings import AppSettings
@@ -30,7 +31,11 @@ def create_app(settings: AppSettings) -> FastAPI:
         allow_headers=["*"]
     )
 
-    fastapi.include_router(get_root_router())
+    # loads the token keys and the salary engine at startup rather than on the first request that needs them
+    get_token_key_ring(settings)
+    get_salary_service_class(settings)
+
+    fastapi.include_router(get_root_router(include_internal=settings.internal_endpoints_enabled))
 
     return fastapi
 
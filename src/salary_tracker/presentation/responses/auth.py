@@ -1,5 +1,6 @@
 from pydantic import BaseModel, AwareDatetime
 
+from salary_tracker.domain.auth.models import JsonWebKeySet
 from salary_tracker.presentation.responses.user import UserResponse
 
 
@@ -11,3 +12,7 @@ class AccessTokenResponse(BaseModel):
 class AuthResponse(BaseModel):
     user: UserResponse
     access_token: AccessTokenResponse
+
+
+class JsonWebKeySetResponse(JsonWebKeySet):
+    pass
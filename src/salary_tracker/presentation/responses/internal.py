@@ -0,0 +1,10 @@
+from salary_tracker.data.pool import DatabasePoolStats
+from salary_tracker.domain.auth.models import AccessTokenCacheStats
+
+
+class DatabasePoolStatsResponse(DatabasePoolStats):
+    pass
+
+
+class AccessTokenCacheStatsResponse(AccessTokenCacheStats):
+    pass
@@ -8,4 +8,6 @@ from salary_tracker.domain.pagination import PaginatedResult
 DataType = TypeVar("DataType", bound=BaseModel)
 
 class PaginatedResultResponse(PaginatedResult[DataType]):
-    pass
+    # opaque signed cursors, passed back as the cursor query parameter
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
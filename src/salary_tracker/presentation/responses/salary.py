@@ -1,5 +1,13 @@
-from salary_tracker.domain.sheet.models import Salary
+from salary_tracker.domain.sheet.models import Salary, SalaryBreakdown, UserSalary
 
 
 class SalaryResponse(Salary):
     pass
+
+
+class SalaryBreakdownResponse(SalaryBreakdown):
+    pass
+
+
+class UserSalaryResponse(UserSalary):
+    pass
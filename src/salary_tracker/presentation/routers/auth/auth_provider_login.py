@@ -5,9 +5,10 @@ from salary_tracker.domain.auth.models import AuthProvider
 from salary_tracker.presentation.dependencies.auth import RefreshTokenStore
 from salary_tracker.presentation.dependencies.usecases import get_auth_provider_login_use_case
 from salary_tracker.presentation.responses.auth import AuthResponse
+from salary_tracker.presentation.routing import SessionReleasingRoute
 from salary_tracker.usecase.auth.auth_provider_login import LoginWithAuthProviderUseCase
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 class AuthProviderLoginRequest(BaseModel):
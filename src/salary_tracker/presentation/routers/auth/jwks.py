@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, Response
+
+from salary_tracker.presentation.dependencies.usecases import get_json_web_key_set_use_case
+from salary_tracker.presentation.responses.auth import JsonWebKeySetResponse
+from salary_tracker.usecase.auth.get_json_web_key_set import GetJsonWebKeySetUseCase
+
+router = APIRouter()
+
+
+@router.get(
+    "/jwks/",
+    description="Get the public keys access tokens are signed with",
+    response_model=JsonWebKeySetResponse,
+    response_model_exclude_none=True
+)
+async def get_json_web_key_set(
+        response: Response,
+        use_case: GetJsonWebKeySetUseCase = Depends(get_json_web_key_set_use_case)
+):
+    # the keys only change with a deployment
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return await use_case()
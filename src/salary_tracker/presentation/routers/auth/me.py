@@ -5,9 +5,10 @@ from fastapi import APIRouter, Depends
 from salary_tracker.presentation.dependencies.auth import get_current_user_uuid
 from salary_tracker.presentation.dependencies.usecases import get_user_use_case
 from salary_tracker.presentation.responses.user import UserResponse
+from salary_tracker.presentation.routing import SessionReleasingRoute
 from salary_tracker.usecase.user.get_user import GetUserUseCase
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 @router.get(
     "/me/",
@@ -3,10 +3,11 @@ from fastapi import APIRouter, Depends
 from salary_tracker.presentation.dependencies.auth import RefreshTokenStore
 from salary_tracker.presentation.dependencies.usecases import get_rotate_refresh_token_use_case
 from salary_tracker.presentation.responses.auth import AuthResponse
+from salary_tracker.presentation.routing import SessionReleasingRoute
 from salary_tracker.usecase.auth.rotate_refresh_token import RotateRefreshTokenUseCase
 from salary_tracker.usecase.exceptions import AuthException
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 @router.post(
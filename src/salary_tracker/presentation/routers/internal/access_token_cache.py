@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+
+from salary_tracker.domain.auth.caches import IAccessTokenCache
+from salary_tracker.presentation.dependencies.caches import get_access_token_cache
+from salary_tracker.presentation.responses.internal import AccessTokenCacheStatsResponse
+
+router = APIRouter()
+
+
+@router.get(
+    "/auth/access-token-cache/",
+    description="Get hit and miss counters of the verified access token cache",
+    response_model=AccessTokenCacheStatsResponse
+)
+async def get_access_token_cache_stats(
+        access_token_cache: IAccessTokenCache = Depends(get_access_token_cache)
+):
+    return access_token_cache.stats()
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+
+from salary_tracker.data.database import Database
+from salary_tracker.presentation.dependencies.data import get_database
+from salary_tracker.presentation.responses.internal import DatabasePoolStatsResponse
+
+router = APIRouter()
+
+
+@router.get(
+    "/database/pool/",
+    description="Get live statistics of the connection pools of the primary database and of each replica",
+    response_model=DatabasePoolStatsResponse
+)
+async def get_database_pool_stats(
+        database: Database = Depends(get_database)
+):
+    return database.pool_stats()
@@ -7,11 +7,13 @@ def get_auth_router():
     from salary_tracker.presentation.routers.auth.me import router as me_router
     from salary_tracker.presentation.routers.auth.auth_provider_login import router as auth_provider_login_router
     from salary_tracker.presentation.routers.auth.refresh_token import router as refresh_token_router
+    from salary_tracker.presentation.routers.auth.jwks import router as jwks_router
 
     router = APIRouter(prefix="/auth", tags=["Auth"])
     router.include_router(me_router)
     router.include_router(auth_provider_login_router)
     router.include_router(refresh_token_router)
+    router.include_router(jwks_router)
     return router
 
 def get_sheet_router():
@@ -20,8 +22,12 @@ def get_sheet_router():
     from salary_tracker.presentation.routers.sheet.rate_table.add import router as add_rate_table
     from salary_tracker.presentation.routers.sheet.rate_table.get_for_datetime import router as get_rate_table_for_datetime
     from salary_tracker.presentation.routers.sheet.record.add import router as add_sheet_record
+    from salary_tracker.presentation.routers.sheet.record.add_many import router as add_sheet_records
     from salary_tracker.presentation.routers.sheet.record.get_filtered import router as get_paginated_sheet_records
     from salary_tracker.presentation.routers.sheet.salary.calculate import router as calculate_salary
+    from salary_tracker.presentation.routers.sheet.salary.breakdown import router as calculate_salary_breakdown
+    from salary_tracker.presentation.routers.sheet.salary.calculate_batch import router as calculate_salaries
+    from salary_tracker.presentation.routers.sheet.salary.calculate_user import router as calculate_user_salary
     from salary_tracker.presentation.routers.sheet.record.delete import router as delete_record
     from salary_tracker.presentation.routers.sheet.delete import router as delete_sheet
     from salary_tracker.presentation.routers.sheet.get_user import router as get_user
@@ -29,17 +35,31 @@ def get_sheet_router():
     router = APIRouter(prefix="/sheets", tags=["Sheet"])
     router.include_router(create_sheet)
     router.include_router(get_user)
+    # before the /{sheet_uuid}/ routes, which would otherwise try to parse "salary" as a uuid
+    router.include_router(calculate_user_salary)
     router.include_router(get_sheet)
     router.include_router(delete_sheet)
     router.include_router(add_rate_table)
     router.include_router(get_rate_table_for_datetime)
     router.include_router(get_paginated_sheet_records)
     router.include_router(add_sheet_record)
+    router.include_router(add_sheet_records)
     router.include_router(delete_record)
     router.include_router(calculate_salary)
+    router.include_router(calculate_salary_breakdown)
+    router.include_router(calculate_salaries)
     return router
 
-def get_root_router():
+def get_internal_router():
+    from salary_tracker.presentation.routers.internal.database_pool import router as database_pool
+    from salary_tracker.presentation.routers.internal.access_token_cache import router as access_token_cache
+
+    router = APIRouter(prefix="/internal", tags=["Internal"], include_in_schema=False)
+    router.include_router(database_pool)
+    router.include_router(access_token_cache)
+    return router
+
+def get_root_router(include_internal: bool = False):
     router = APIRouter(
         prefix="/api/v1",
         responses={
@@ -50,4 +70,6 @@ def get_root_router():
     )
     router.include_router(get_auth_router())
     router.include_router(get_sheet_router())
+    if include_internal:
+        router.include_router(get_internal_router())
     return router
\ No newline at end of file
@@ -8,9 +8,10 @@ from salary_tracker.domain.sheet.models import NewSheetData, Rate
 from salary_tracker.presentation.dependencies.auth import get_current_user_uuid
 from salary_tracker.presentation.dependencies.usecases import get_create_sheet_use_case
 from salary_tracker.presentation.responses.sheet import SheetResponse
+from salary_tracker.presentation.routing import SessionReleasingRoute
 from salary_tracker.usecase.sheet.create_sheet import CreateSheetUseCase
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 class NewSheetRequest(BaseModel):
@@ -4,9 +4,10 @@ from fastapi import APIRouter, Depends
 
 from salary_tracker.presentation.dependencies.auth import get_current_user_uuid
 from salary_tracker.presentation.dependencies.usecases import get_delete_sheet_use_case
+from salary_tracker.presentation.routing import SessionReleasingRoute
 from salary_tracker.usecase.sheet.delete_sheet import DeleteSheetUseCase
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 @router.delete(
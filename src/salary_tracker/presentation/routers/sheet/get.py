@@ -5,9 +5,10 @@ from fastapi import APIRouter, Depends
 from salary_tracker.presentation.dependencies.auth import get_current_user_uuid
 from salary_tracker.presentation.dependencies.usecases import get_get_sheet_for_user_use_case
 from salary_tracker.presentation.responses.sheet import SheetResponse
+from salary_tracker.presentation.routing import SessionReleasingRoute
 from salary_tracker.usecase.sheet.get_sheet_for_user import GetSheetForUserUseCase
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 @router.get(
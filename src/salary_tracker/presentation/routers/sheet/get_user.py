@@ -1,16 +1,19 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 
-from salary_tracker.domain.pagination import PaginatedRequest, PageParams
+from salary_tracker.domain.pagination import PaginatedRequest, PageParams, PageCursor
+from salary_tracker.presentation.cursor import CursorCodec
 from salary_tracker.presentation.dependencies.auth import get_current_user_uuid
+from salary_tracker.presentation.dependencies.presentation import get_page_cursor, get_cursor_codec
 from salary_tracker.presentation.dependencies.usecases import get_get_paginated_user_sheets_use_case
 from salary_tracker.presentation.responses.pagination import PaginatedResultResponse
 from salary_tracker.presentation.responses.sheet import SheetResponse
+from salary_tracker.presentation.routing import SessionReleasingRoute
 from salary_tracker.usecase.sheet.get_user_sheets import GetPaginatedUserSheetsUseCase
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 @router.get(
@@ -19,11 +22,17 @@ router = APIRouter()
     response_model=PaginatedResultResponse[SheetResponse],
 )
 async def get_user_sheets(
+        request: Request,
         query_params: Annotated[PageParams, Query()],
+        cursor: PageCursor | None = Depends(get_page_cursor),
         current_user_uuid: UUID = Depends(get_current_user_uuid),
         use_case: GetPaginatedUserSheetsUseCase = Depends(get_get_paginated_user_sheets_use_case),
+        cursor_codec: CursorCodec = Depends(get_cursor_codec),
 ):
-    return await use_case(PaginatedRequest[UUID](
+    result = await use_case(PaginatedRequest[UUID](
         page_params=query_params,
-        filters=current_user_uuid
+        filters=current_user_uuid,
+        cursor=cursor
     ))
+
+    return cursor_codec.encode_result(result, scope=request.url.path)
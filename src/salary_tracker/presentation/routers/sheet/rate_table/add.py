@@ -5,9 +5,10 @@ from fastapi import APIRouter, Depends
 from salary_tracker.domain.sheet.models import RateTableData, RateTable
 from salary_tracker.presentation.dependencies.auth import get_current_user_uuid
 from salary_tracker.presentation.dependencies.usecases import get_add_sheet_rate_table_use_case
+from salary_tracker.presentation.routing import SessionReleasingRoute
 from salary_tracker.usecase.sheet.rate_table.add_rate_table import AddSheetRateTableUseCase
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 class RateTableDataRequest(RateTableData):
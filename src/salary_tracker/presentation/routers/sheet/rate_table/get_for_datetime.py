@@ -6,9 +6,10 @@ from pydantic import AwareDatetime
 from salary_tracker.domain.sheet.models import RateTable
 from salary_tracker.presentation.dependencies.auth import get_current_user_uuid
 from salary_tracker.presentation.dependencies.usecases import get_get_rate_table_for_datetime_use_case
+from salary_tracker.presentation.routing import SessionReleasingRoute
 from salary_tracker.usecase.sheet.rate_table.get_rate_table_for_datetime import GetRateTableForDatetime
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 @router.get(
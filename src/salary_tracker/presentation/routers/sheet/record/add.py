@@ -6,9 +6,10 @@ from salary_tracker.domain.sheet.models import NewRecordData
 from salary_tracker.presentation.dependencies.auth import get_current_user_uuid
 from salary_tracker.presentation.dependencies.usecases import get_add_sheet_record_use_case
 from salary_tracker.presentation.responses.sheet import RecordResponse
+from salary_tracker.presentation.routing import SessionReleasingRoute
 from salary_tracker.usecase.sheet.record.add_record import AddSheetRecordUseCase
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 class NewRecordRequest(NewRecordData):
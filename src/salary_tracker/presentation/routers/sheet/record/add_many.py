@@ -0,0 +1,29 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Body
+
+from salary_tracker.presentation.dependencies.auth import get_current_user_uuid
+from salary_tracker.presentation.dependencies.usecases import get_add_sheet_records_use_case
+from salary_tracker.presentation.responses.sheet import RecordResponse
+from salary_tracker.presentation.routers.sheet.record.add import NewRecordRequest
+from salary_tracker.presentation.routing import SessionReleasingRoute
+from salary_tracker.usecase.sheet.record.add_records import AddSheetRecordsUseCase
+
+router = APIRouter(route_class=SessionReleasingRoute)
+
+_MAX_RECORDS_PER_REQUEST = 10_000
+
+
+@router.post(
+    "/{sheet_uuid}/records/bulk/",
+    description="Add many records to the sheet at once, either all of them are added or none",
+    response_model=list[RecordResponse]
+)
+async def add_sheet_records(
+        sheet_uuid: UUID,
+        new_records_data: Annotated[list[NewRecordRequest], Body(min_length=1, max_length=_MAX_RECORDS_PER_REQUEST)],
+        current_user_uuid: UUID = Depends(get_current_user_uuid),
+        use_case: AddSheetRecordsUseCase = Depends(get_add_sheet_records_use_case)
+):
+    return await use_case(sheet_uuid, current_user_uuid, new_records_data)
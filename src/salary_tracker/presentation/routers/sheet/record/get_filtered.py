@@ -2,18 +2,21 @@ from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from fastapi.params import Query
 
-from salary_tracker.domain.pagination import PageParams, PaginatedRequest
+from salary_tracker.domain.pagination import PageParams, PaginatedRequest, PageCursor
 from salary_tracker.domain.sheet.models import SheetRecordFilters
+from salary_tracker.presentation.cursor import CursorCodec
 from salary_tracker.presentation.dependencies.auth import get_current_user_uuid
+from salary_tracker.presentation.dependencies.presentation import get_page_cursor, get_cursor_codec
 from salary_tracker.presentation.dependencies.usecases import get_get_paginated_sheet_records_use_case
 from salary_tracker.presentation.responses.pagination import PaginatedResultResponse
 from salary_tracker.presentation.responses.sheet import RecordResponse
+from salary_tracker.presentation.routing import SessionReleasingRoute
 from salary_tracker.usecase.sheet.record.get_paginated_sheet_records import GetPaginatedSheetRecordsUseCase
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 class QueryParams(PageParams):
     datetime_from: datetime | None = None
@@ -26,9 +29,12 @@ class QueryParams(PageParams):
 )
 async def get_filtered_sheet_records(
         sheet_uuid: UUID,
+        request: Request,
         query_params: Annotated[QueryParams, Query()],
+        cursor: PageCursor | None = Depends(get_page_cursor),
         current_user_uuid: UUID = Depends(get_current_user_uuid),
-        use_case: GetPaginatedSheetRecordsUseCase = Depends(get_get_paginated_sheet_records_use_case)
+        use_case: GetPaginatedSheetRecordsUseCase = Depends(get_get_paginated_sheet_records_use_case),
+        cursor_codec: CursorCodec = Depends(get_cursor_codec)
 ):
     result = await use_case(PaginatedRequest(
         page_params=query_params,
@@ -36,7 +42,8 @@ async def get_filtered_sheet_records(
             sheet_uuid=sheet_uuid,
             datetime_from=query_params.datetime_from,
             datetime_to=query_params.datetime_to
-        )
+        ),
+        cursor=cursor
     ), current_user_uuid)
 
-    return result
+    return cursor_codec.encode_result(result, scope=request.url.path)
@@ -0,0 +1,32 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from pydantic import AwareDatetime
+
+from salary_tracker.domain.sheet.models import SalaryGranularity
+from salary_tracker.presentation.dependencies.auth import get_current_user_uuid
+from salary_tracker.presentation.dependencies.usecases import get_calculate_salary_breakdown_use_case
+from salary_tracker.presentation.responses.salary import SalaryBreakdownResponse
+from salary_tracker.presentation.routing import SessionReleasingRoute
+from salary_tracker.usecase.sheet.salary.calculate_salary_breakdown import CalculateSalaryBreakdownUseCase
+
+router = APIRouter(route_class=SessionReleasingRoute)
+
+
+@router.get(
+    "/{sheet_uuid}/salary/breakdown/",
+    description="Calculate salary for a sheet split into day, week or month buckets of the given timezone",
+    response_model=SalaryBreakdownResponse
+)
+async def calculate_salary_breakdown(
+        sheet_uuid: UUID,
+        datetime_from: AwareDatetime,
+        datetime_to: AwareDatetime,
+        granularity: SalaryGranularity,
+        tz: str = "UTC",
+        current_user_uuid: UUID = Depends(get_current_user_uuid),
+        calculate_salary_breakdown_use_case: CalculateSalaryBreakdownUseCase = Depends(
+            get_calculate_salary_breakdown_use_case)
+):
+    return await calculate_salary_breakdown_use_case(sheet_uuid, current_user_uuid, datetime_from, datetime_to,
+                                                     granularity, tz)
@@ -6,9 +6,10 @@ from pydantic import AwareDatetime
 from salary_tracker.presentation.dependencies.auth import get_current_user_uuid
 from salary_tracker.presentation.dependencies.usecases import get_calculate_salary_use_case
 from salary_tracker.presentation.responses.salary import SalaryResponse
+from salary_tracker.presentation.routing import SessionReleasingRoute
 from salary_tracker.usecase.sheet.salary.calculate_salary import CalculateSalaryUseCase
 
-router = APIRouter()
+router = APIRouter(route_class=SessionReleasingRoute)
 
 
 @router.get(
@@ -0,0 +1,30 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+
+from salary_tracker.domain.sheet.models import SalaryPeriodsData
+from salary_tracker.presentation.dependencies.auth import get_current_user_uuid
+from salary_tracker.presentation.dependencies.usecases import get_calculate_salaries_use_case
+from salary_tracker.presentation.responses.salary import SalaryResponse
+from salary_tracker.presentation.routing import SessionReleasingRoute
+from salary_tracker.usecase.sheet.salary.calculate_salaries import CalculateSalariesUseCase
+
+router = APIRouter(route_class=SessionReleasingRoute)
+
+
+class SalaryPeriodsRequest(SalaryPeriodsData):
+    pass
+
+
+@router.post(
+    "/{sheet_uuid}/salary/batch/",
+    description="Calculate salary for a sheet in each of the given periods",
+    response_model=list[SalaryResponse]
+)
+async def calculate_salaries(
+        sheet_uuid: UUID,
+        periods_data: SalaryPeriodsRequest,
+        current_user_uuid: UUID = Depends(get_current_user_uuid),
+        calculate_salaries_use_case: CalculateSalariesUseCase = Depends(get_calculate_salaries_use_case)
+):
+    return await calculate_salaries_use_case(sheet_uuid, current_user_uuid, periods_data)
@@ -0,0 +1,26 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from pydantic import AwareDatetime
+
+from salary_tracker.presentation.dependencies.auth import get_current_user_uuid
+from salary_tracker.presentation.dependencies.usecases import get_calculate_user_salary_use_case
+from salary_tracker.presentation.responses.salary import UserSalaryResponse
+from salary_tracker.presentation.routing import SessionReleasingRoute
+from salary_tracker.usecase.sheet.salary.calculate_user_salary import CalculateUserSalaryUseCase
+
+router = APIRouter(route_class=SessionReleasingRoute)
+
+
+@router.get(
+    "/salary/",
+    description="Calculate salary for every sheet of the current user and their total",
+    response_model=UserSalaryResponse
+)
+async def calculate_user_salary(
+        datetime_from: AwareDatetime,
+        datetime_to: AwareDatetime,
+        current_user_uuid: UUID = Depends(get_current_user_uuid),
+        calculate_user_salary_use_case: CalculateUserSalaryUseCase = Depends(get_calculate_user_salary_use_case)
+):
+    return await calculate_user_salary_use_case(current_user_uuid, datetime_from, datetime_to)
@@ -0,0 +1,56 @@
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_request_sessions: ContextVar[list[AsyncSession] | None] = ContextVar("request_sessions", default=None)
+
+
+def track_request_session(session: AsyncSession) -> None:
+    sessions = _request_sessions.get()
+    if sessions is not None:
+        sessions.append(session)
+
+
+async def _release_request_sessions() -> None:
+    # closing returns the connection to the pool, the session checks out a new one if it is used again
+    for session in _request_sessions.get() or ():
+        await session.close()
+
+
+def _releasing_sessions(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    # include_router rebuilds the route from its endpoint, which is already wrapped then
+    if getattr(endpoint, "releases_request_sessions", False):
+        return endpoint
+
+    @wraps(endpoint)
+    async def releasing_endpoint(*args, **kwargs):
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            await _release_request_sessions()
+
+    releasing_endpoint.releases_request_sessions = True
+    return releasing_endpoint
+
+
+class SessionReleasingRoute(APIRoute):
+    # dependencies with yield are torn down only after the response is serialized, the sessions of the request are
+    # closed as soon as the endpoint returns instead, so connections don't sit idle during serialization
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs):
+        super().__init__(path, _releasing_sessions(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        route_handler = super().get_route_handler()
+
+        async def session_scoped_route_handler(request: Request) -> Response:
+            token = _request_sessions.set([])
+            try:
+                return await route_handler(request)
+            finally:
+                _request_sessions.reset(token)
+
+        return session_scoped_route_handler
@@ -10,14 +10,31 @@ class AppSettings(BaseSettings):
     cors_allow_origins: frozenset[str]
 
     database_url: PostgresDsn
-
+    database_replica_urls: tuple[PostgresDsn, ...] = ()
+    # after a write the client keeps reading from the primary for this long, so it sees its own changes
+    database_read_your_writes_window: timedelta = timedelta(seconds=5)
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    database_pool_timeout: timedelta = timedelta(seconds=30)
+    database_pool_recycle: timedelta | None = None
+    database_pool_pre_ping: bool = False
+    database_prepared_statement_cache_size: int = 100
+    database_command_timeout: timedelta | None = None
+
+    # RSA or P-256, tokens are signed with RS256 or ES256 accordingly
     access_token_private_key: str
+    # public keys of retired signing keys, tokens they signed are accepted until they expire
+    access_token_verification_keys: tuple[str, ...] = ()
     access_token_expiration_time: timedelta
     access_token_issuer: str
     access_token_audience: str
     refresh_token_expiration_time: timedelta
+    access_token_cache_max_size: int = 4096
 
     google_app_client_id: str
+    google_certificates_url: str = 'https://www.googleapis.com/oauth2/v1/certs'
+
+    pagination_cursor_secret: str
 
     refresh_token_cookie_path: str
     refresh_token_cookie_http_only: bool
@@ -25,4 +42,11 @@ class AppSettings(BaseSettings):
     refresh_token_cookie_domain: str
     refresh_token_cookie_secure: bool
 
+    # exposes operational endpoints under /internal/, keep them behind the private network
+    internal_endpoints_enabled: bool = False
+
+    salary_engine: Literal['sql', 'vectorized'] = 'sql'
+    salary_cache_max_size: int = 4096
+    salary_cache_ttl: timedelta = timedelta(minutes=10)
+
     model_config = ConfigDict(frozen=True)
@@ -0,0 +1,13 @@
+from pydantic import ConfigDict, validate_call
+
+from salary_tracker.domain.auth.keys import ITokenKeyRing
+from salary_tracker.domain.auth.models import JsonWebKeySet
+
+
+class GetJsonWebKeySetUseCase:
+    @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+    def __init__(self, token_key_ring: ITokenKeyRing):
+        self._token_key_ring = token_key_ring
+
+    async def __call__(self) -> JsonWebKeySet:
+        return self._token_key_ring.public_key_set()
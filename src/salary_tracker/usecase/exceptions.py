@@ -23,3 +23,8 @@ class PermissionDeniedException(UseCaseException):
 class SheetTitleDoesNotMatchException(UseCaseException):
     def __init__(self, message: str):
         super().__init__(message, "core.sheet_title_does_not_match")
+
+
+class InvalidCursorException(UseCaseException):
+    def __init__(self, message: str):
+        super().__init__(message, "core.invalid_cursor")
@@ -0,0 +1,28 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import validate_call, ConfigDict
+
+from salary_tracker.domain.exceptions import DomainException
+from salary_tracker.domain.sheet.models import SalaryBreakdown, SalaryGranularity
+from salary_tracker.domain.sheet.services import ISalaryService, ISheetService
+from salary_tracker.usecase.exceptions import DomainRuleException, PermissionDeniedException
+
+
+class CalculateSalaryBreakdownUseCase:
+    @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+    def __init__(self, sheet_service: ISheetService, salary_service: ISalaryService):
+        self._sheet_service = sheet_service
+        self._salary_service = salary_service
+
+    async def __call__(self, sheet_uuid: UUID, requesting_user_uuid: UUID, datetime_from: datetime,
+                       datetime_to: datetime, granularity: SalaryGranularity, timezone: str) -> SalaryBreakdown:
+        try:
+            sheet = await self._sheet_service.get_by_uuid(sheet_uuid)
+            if sheet.owner_user_uuid != requesting_user_uuid:
+                raise PermissionDeniedException("You are not allowed to access this sheet")
+
+            return await self._salary_service.calculate_salary_breakdown(sheet_uuid, datetime_from, datetime_to,
+                                                                         granularity, timezone)
+        except DomainException as e:
+            raise DomainRuleException(str(e))
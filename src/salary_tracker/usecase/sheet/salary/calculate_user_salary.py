@@ -0,0 +1,23 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import validate_call, ConfigDict
+
+from salary_tracker.domain.exceptions import DomainException
+from salary_tracker.domain.sheet.models import UserSalary
+from salary_tracker.domain.sheet.services import ISalaryService
+from salary_tracker.usecase.exceptions import DomainRuleException
+
+
+class CalculateUserSalaryUseCase:
+    @validate_call(config=ConfigDict(arbitrary_types_allowed=True))
+    def __init__(self, salary_service: ISalaryService):
+        self._salary_service = salary_service
+
+    async def __call__(self, requesting_user_uuid: UUID, datetime_from: datetime,
+                       datetime_to: datetime) -> UserSalary:
+        try:
+            return await self._salary_service.calculate_user_salary(requesting_user_uuid, datetime_from,
+                                                                    datetime_to)
+        except DomainException as e:
+            raise DomainRuleException(str(e))
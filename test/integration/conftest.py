@@ -6,6 +6,7 @@ import pytest
 from asgi_lifespan import LifespanManager
 from dotenv import load_dotenv
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy import text
 
 from salary_tracker.domain.user.models import User
 from salary_tracker.data.database import Database
@@ -33,6 +34,7 @@ def event_loop(request):
 async def database(settings):
     database = Database(database_url=settings.database_url.unicode_string())
     async with database.connect() as connection:
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
         await connection.run_sync(Base.metadata.create_all)
     yield database
     async with database.connect() as connection:
@@ -1,15 +1,20 @@
+import asyncio
 from datetime import timedelta, UTC, datetime
 from decimal import Decimal
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, text
+from sqlalchemy.exc import IntegrityError
 
 from salary_tracker.data.exceptions import DataException
 from salary_tracker.data.model import DatabaseUser, DatabaseSheet, DatabaseSheetDuration, DatabaseSheetGroupSize, \
-    DatabaseSheetRateTable, DatabaseSheetRate
+    DatabaseSheetRateTable, DatabaseSheetRate, DatabaseSheetRecord, DatabaseSheetSalaryMonth
+from salary_tracker.data.repositories.sheet.data_version import bump_data_version
 from salary_tracker.data.repositories.sheet.rate_table_repository import RateTableRepository
+from salary_tracker.data.repositories.sheet.salary_months import add_records_to_salary_months
 from salary_tracker.data.repositories.sheet.sheet_record_repository import SheetRecordRepository
+from salary_tracker.domain.exceptions import RateTablesOverlapDomainException
 from salary_tracker.domain.sheet.models import RateTable, Rate
 
 
@@ -166,4 +171,150 @@ async def test_upsert(rate_table_repository, database_sheet, session):
 
 async def test_upsert_sheet_not_found(rate_table_repository):
     with pytest.raises(DataException):
-        await rate_table_repository.upsert(uuid4(), [])
\ No newline at end of file
+        await rate_table_repository.upsert(uuid4(), [])
+
+def _rate_table(uuid, valid_from, valid_to):
+    return RateTable(
+        uuid=uuid,
+        valid_from=valid_from,
+        valid_to=valid_to,
+        rates=[Rate(rate=Decimal('10.00'), group_size=2, duration=timedelta(hours=1))]
+    )
+
+
+async def test_upsert_overlapping_rate_tables(rate_table_repository, database_sheet):
+    # the failed upsert rolls back and expires the fixture
+    sheet_uuid = database_sheet.uuid
+    border_date = datetime(2021, 1, 1, tzinfo=UTC)
+    rate_tables = [
+        _rate_table(uuid4(), datetime.min.replace(tzinfo=UTC), border_date),
+        _rate_table(uuid4(), border_date, datetime.max.replace(tzinfo=UTC))
+    ]
+
+    with pytest.raises(RateTablesOverlapDomainException):
+        await rate_table_repository.upsert(sheet_uuid, rate_tables)
+
+    assert await rate_table_repository.get_for_sheet(sheet_uuid) == []
+
+
+async def test_overlap_checked_at_commit_and_per_sheet(database_sheet, session):
+    other_sheet = DatabaseSheet(
+        uuid=uuid4(),
+        owner_user_uuid=database_sheet.owner_user_uuid,
+        title="Other Sheet",
+        description="",
+        rate_tables=[]
+    )
+    session.add(other_sheet)
+    await session.commit()
+
+    def database_rate_table(sheet_uuid, valid_from, valid_to):
+        return DatabaseSheetRateTable(uuid=uuid4(), sheet_uuid=sheet_uuid, valid_from=valid_from, valid_to=valid_to)
+
+    first, second, third = (datetime(year, 1, 1, tzinfo=UTC) for year in (2020, 2021, 2022))
+
+    # other sheets may cover the same period
+    session.add(database_rate_table(database_sheet.uuid, first, second))
+    session.add(database_rate_table(other_sheet.uuid, first, second))
+    await session.commit()
+
+    # the bounds are inclusive, touching rate tables overlap, the check waits for the commit
+    session.add(database_rate_table(database_sheet.uuid, second, third))
+    await session.flush()
+
+    with pytest.raises(IntegrityError, match="sheet_rate_tables_validity_excl"):
+        await session.commit()
+
+
+async def test_upsert_moves_border(rate_table_repository, database_sheet):
+    left_uuid, right_uuid = uuid4(), uuid4()
+    old_border, new_border = datetime(2021, 1, 1, tzinfo=UTC), datetime(2022, 1, 1, tzinfo=UTC)
+    await rate_table_repository.upsert(database_sheet.uuid, [
+        _rate_table(left_uuid, datetime.min.replace(tzinfo=UTC), old_border),
+        _rate_table(right_uuid, old_border + timedelta(microseconds=1), datetime.max.replace(tzinfo=UTC))
+    ])
+
+    # the left table grows over the old border before the right one shrinks, only the end state has to be valid
+    await rate_table_repository.upsert(database_sheet.uuid, [
+        _rate_table(left_uuid, datetime.min.replace(tzinfo=UTC), new_border),
+        _rate_table(right_uuid, new_border + timedelta(microseconds=1), datetime.max.replace(tzinfo=UTC))
+    ])
+
+    result = await rate_table_repository.get_for_datetime(database_sheet.uuid, new_border)
+    assert result.uuid == left_uuid
+
+
+async def test_upsert_writes_only_changes(rate_table_repository, database_sheet, session):
+    sheet_uuid = database_sheet.uuid
+    left_uuid, right_uuid, border = uuid4(), uuid4(), datetime(2021, 1, 1, tzinfo=UTC)
+    left = _rate_table(left_uuid, datetime.min.replace(tzinfo=UTC), border)
+    right = _rate_table(right_uuid, border + timedelta(microseconds=1), datetime.max.replace(tzinfo=UTC))
+    right = right.model_copy(update=dict(
+        rates=(*right.rates, Rate(rate=Decimal('20.00'), group_size=5, duration=timedelta(hours=1)))
+    ))
+    await rate_table_repository.upsert(sheet_uuid, [left, right])
+
+    async def row_versions():
+        # xmin changes whenever a row is updated or deleted and inserted again
+        result = await session.execute(text(
+            "SELECT rate_table_uuid, group_size, duration, xmin::text FROM sheet_rates"
+        ))
+        return {key[:3]: key[3] for key in result}
+
+    before = await row_versions()
+
+    right = right.model_copy(update=dict(rates=(
+        Rate(rate=Decimal('25.00'), group_size=5, duration=timedelta(hours=1)),
+        Rate(rate=Decimal('30.00'), group_size=5, duration=timedelta(hours=4))
+    )))
+    result = await rate_table_repository.upsert(sheet_uuid, [left, right])
+
+    after = await row_versions()
+    assert result == [left, right]
+    one_hour, four_hours = timedelta(hours=1), timedelta(hours=4)
+    assert after[(left_uuid, 2, one_hour)] == before[(left_uuid, 2, one_hour)]
+    assert after[(right_uuid, 5, one_hour)] != before[(right_uuid, 5, one_hour)]
+    assert (right_uuid, 5, four_hours) in after
+    assert (right_uuid, 2, one_hour) not in after
+    assert (await rate_table_repository.get_for_datetime(sheet_uuid, border + timedelta(days=1))).rates == right.rates
+
+
+async def test_upsert_waits_for_concurrent_record_writer(rate_table_repository, database_sheet, database, session):
+    sheet_uuid = database_sheet.uuid
+    rate_table_uuid = uuid4()
+    await rate_table_repository.upsert(sheet_uuid, [
+        _rate_table(rate_table_uuid, datetime.min.replace(tzinfo=UTC), datetime.max.replace(tzinfo=UTC))
+    ])
+
+    async with database.session() as record_session:
+        # a record being added, the first of its month, priced with the old rate and not committed yet
+        await bump_data_version(record_session, sheet_uuid)
+        record_uuid = uuid4()
+        record_session.add(DatabaseSheetRecord(
+            uuid=record_uuid,
+            sheet_uuid=sheet_uuid,
+            group_size=2,
+            duration=timedelta(hours=1),
+            group_name="Test Group",
+            happened_at=datetime(2021, 6, 1, tzinfo=UTC),
+            additional_info=None
+        ))
+        await record_session.flush()
+        await add_records_to_salary_months(record_session, [record_uuid])
+
+        changed_rate_table = _rate_table(
+            rate_table_uuid, datetime.min.replace(tzinfo=UTC), datetime.max.replace(tzinfo=UTC)
+        ).model_copy(update=dict(rates=(Rate(rate=Decimal('20.00'), group_size=2, duration=timedelta(hours=1)),)))
+        upsert = asyncio.create_task(rate_table_repository.upsert(sheet_uuid, [changed_rate_table]))
+
+        await asyncio.sleep(0.2)
+        assert not upsert.done()
+        await record_session.commit()
+
+    await upsert
+
+    salary_months = (await session.execute(
+        select(DatabaseSheetSalaryMonth.salary, DatabaseSheetSalaryMonth.records_count)
+        .filter_by(sheet_uuid=sheet_uuid)
+    )).all()
+    assert salary_months == [(Decimal('20.00'), 1)]
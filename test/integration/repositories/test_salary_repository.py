@@ -0,0 +1,349 @@
+from datetime import timedelta, datetime, UTC
+from decimal import Decimal
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from salary_tracker.data.model import DatabaseUser, DatabaseSheet, DatabaseSheetDuration, DatabaseSheetGroupSize, \
+    DatabaseSheetRateTable, DatabaseSheetRate, DatabaseSheetRecord
+from salary_tracker.data.repositories.sheet.rate_table_repository import RateTableRepository
+from salary_tracker.data.repositories.sheet.salary_repository import SalaryRepository
+from salary_tracker.data.repositories.sheet.sheet_record_repository import SheetRecordRepository
+from salary_tracker.domain.sheet.models import SalaryGranularity, SalaryBucket, Record, RateTable, Rate, \
+    SalaryPeriod
+
+_BORDER_DATE = datetime(2021, 1, 15, tzinfo=UTC)
+
+
+@pytest.fixture
+def salary_repository(session):
+    return SalaryRepository(session=session)
+
+
+@pytest.fixture
+async def database_sheet(session):
+    database_user = DatabaseUser(
+        uuid=uuid4(),
+        email='test@test.com',
+        name='Test User'
+    )
+    session.add(database_user)
+    await session.commit()
+
+    database_sheet = DatabaseSheet(
+        uuid=uuid4(),
+        owner_user_uuid=database_user.uuid,
+        title="Test Sheet",
+        description="Test Description",
+        durations=[
+            DatabaseSheetDuration(duration=timedelta(hours=1)),
+            DatabaseSheetDuration(duration=timedelta(hours=4))
+        ],
+        group_sizes=[
+            DatabaseSheetGroupSize(group_size=2),
+            DatabaseSheetGroupSize(group_size=5)
+        ],
+        rate_tables=[
+            DatabaseSheetRateTable(
+                uuid=uuid4(),
+                valid_from=datetime.min.replace(tzinfo=UTC),
+                valid_to=_BORDER_DATE,
+                rates=[
+                    DatabaseSheetRate(rate=Decimal('10.00'), group_size=2, duration=timedelta(hours=1)),
+                    DatabaseSheetRate(rate=Decimal('20.00'), group_size=5, duration=timedelta(hours=4))
+                ]
+            ),
+            DatabaseSheetRateTable(
+                uuid=uuid4(),
+                valid_from=_BORDER_DATE + timedelta(microseconds=1),
+                valid_to=datetime.max.replace(tzinfo=UTC),
+                rates=[
+                    DatabaseSheetRate(rate=Decimal('15.50'), group_size=2, duration=timedelta(hours=1))
+                ]
+            )
+        ],
+        records=[]
+    )
+    session.add(database_sheet)
+    await session.commit()
+
+    return database_sheet
+
+
+def _database_record(sheet_uuid, group_size, duration, happened_at):
+    return DatabaseSheetRecord(
+        uuid=uuid4(),
+        sheet_uuid=sheet_uuid,
+        group_size=group_size,
+        duration=duration,
+        group_name="Test Group",
+        happened_at=happened_at,
+        additional_info=None
+    )
+
+
+async def test_get_salary(salary_repository, database_sheet, session):
+    session.add_all([
+        _database_record(database_sheet.uuid, 2, timedelta(hours=1), datetime(2021, 1, 1, tzinfo=UTC)),
+        _database_record(database_sheet.uuid, 5, timedelta(hours=4), datetime(2021, 1, 2, tzinfo=UTC)),
+        _database_record(database_sheet.uuid, 2, timedelta(hours=1), _BORDER_DATE),
+        _database_record(database_sheet.uuid, 2, timedelta(hours=1), datetime(2021, 1, 20, tzinfo=UTC)),
+        # outside of the requested range
+        _database_record(database_sheet.uuid, 2, timedelta(hours=1), datetime(2021, 3, 1, tzinfo=UTC)),
+    ])
+    await session.commit()
+
+    result = await salary_repository.get_salary(
+        database_sheet.uuid,
+        datetime(2021, 1, 1, tzinfo=UTC),
+        datetime(2021, 1, 31, tzinfo=UTC)
+    )
+
+    assert result.salary == Decimal('55.50')
+    assert result.unpriced_record_uuids == []
+
+
+async def test_get_salary_no_records(salary_repository, database_sheet):
+    result = await salary_repository.get_salary(
+        database_sheet.uuid,
+        datetime(2021, 1, 1, tzinfo=UTC),
+        datetime(2021, 1, 31, tzinfo=UTC)
+    )
+
+    assert result.salary == Decimal(0)
+    assert result.unpriced_record_uuids == []
+
+
+async def test_get_salary_reports_unpriced_records(salary_repository, database_sheet, session):
+    unpriced_record = _database_record(database_sheet.uuid, 5, timedelta(hours=4), datetime(2021, 1, 20, tzinfo=UTC))
+    session.add_all([
+        _database_record(database_sheet.uuid, 2, timedelta(hours=1), datetime(2021, 1, 1, tzinfo=UTC)),
+        unpriced_record
+    ])
+    await session.commit()
+
+    result = await salary_repository.get_salary(
+        database_sheet.uuid,
+        datetime(2021, 1, 1, tzinfo=UTC),
+        datetime(2021, 1, 31, tzinfo=UTC)
+    )
+
+    assert result.salary == Decimal('10.00')
+    assert result.unpriced_record_uuids == [unpriced_record.uuid]
+
+
+async def test_get_salaries(salary_repository, database_sheet, session):
+    unpriced_record = _database_record(database_sheet.uuid, 5, timedelta(hours=4), datetime(2021, 2, 10, tzinfo=UTC))
+    session.add_all([
+        _database_record(database_sheet.uuid, 2, timedelta(hours=1), datetime(2021, 1, 1, tzinfo=UTC)),
+        _database_record(database_sheet.uuid, 5, timedelta(hours=4), datetime(2021, 1, 2, tzinfo=UTC)),
+        _database_record(database_sheet.uuid, 2, timedelta(hours=1), datetime(2021, 1, 20, tzinfo=UTC)),
+        unpriced_record,
+    ])
+    await session.commit()
+
+    result = await salary_repository.get_salaries(database_sheet.uuid, [
+        SalaryPeriod(datetime_from=datetime(2021, 1, 1, tzinfo=UTC), datetime_to=datetime(2021, 1, 31, tzinfo=UTC)),
+        # overlaps the first period
+        SalaryPeriod(datetime_from=datetime(2021, 1, 2, tzinfo=UTC), datetime_to=datetime(2021, 2, 28, tzinfo=UTC)),
+        SalaryPeriod(datetime_from=datetime(2022, 1, 1, tzinfo=UTC), datetime_to=datetime(2022, 1, 31, tzinfo=UTC)),
+    ])
+
+    assert [calculation.salary for calculation in result] == [Decimal('45.50'), Decimal('35.50'), Decimal(0)]
+    assert [calculation.unpriced_record_uuids for calculation in result] == [[], [unpriced_record.uuid], []]
+
+
+async def test_get_record_columns(salary_repository, database_sheet, session):
+    session.add_all([
+        _database_record(database_sheet.uuid, 2, timedelta(hours=1), datetime(1970, 1, 1, 0, 0, 1, 5, tzinfo=UTC)),
+        _database_record(database_sheet.uuid, 5, timedelta(hours=4), datetime(2021, 1, 2, tzinfo=UTC)),
+    ])
+    await session.commit()
+
+    result = await salary_repository.get_record_columns(
+        database_sheet.uuid,
+        datetime(1970, 1, 1, tzinfo=UTC),
+        datetime(1970, 1, 2, tzinfo=UTC)
+    )
+
+    assert result.happened_at == [1_000_005]
+    assert result.group_sizes == [2]
+    assert result.durations == [3_600_000_000]
+
+    empty_result = await salary_repository.get_record_columns(
+        database_sheet.uuid,
+        datetime(2022, 1, 1, tzinfo=UTC),
+        datetime(2022, 1, 2, tzinfo=UTC)
+    )
+    assert empty_result.happened_at == []
+
+
+async def test_get_salaries_by_owner(salary_repository, database_sheet, session):
+    empty_sheet = DatabaseSheet(
+        uuid=uuid4(),
+        owner_user_uuid=database_sheet.owner_user_uuid,
+        title="Empty Sheet",
+        description="Test Description",
+        records=[]
+    )
+    other_user = DatabaseUser(uuid=uuid4(), email='other@test.com', name='Other User')
+    session.add(other_user)
+    await session.commit()
+    other_user_sheet = DatabaseSheet(
+        uuid=uuid4(),
+        owner_user_uuid=other_user.uuid,
+        title="Other User Sheet",
+        description="Test Description",
+        records=[]
+    )
+    session.add_all([empty_sheet, other_user_sheet])
+    await session.commit()
+
+    session.add_all([
+        _database_record(database_sheet.uuid, 2, timedelta(hours=1), datetime(2021, 1, 1, tzinfo=UTC)),
+        _database_record(database_sheet.uuid, 5, timedelta(hours=4), datetime(2021, 1, 2, tzinfo=UTC)),
+        # outside of the requested range
+        _database_record(database_sheet.uuid, 2, timedelta(hours=1), datetime(2021, 3, 1, tzinfo=UTC)),
+        _database_record(other_user_sheet.uuid, 2, timedelta(hours=1), datetime(2021, 1, 1, tzinfo=UTC)),
+    ])
+    await session.commit()
+
+    result = await salary_repository.get_salaries_by_owner(
+        database_sheet.owner_user_uuid,
+        datetime(2021, 1, 1, tzinfo=UTC),
+        datetime(2021, 1, 31, tzinfo=UTC)
+    )
+
+    assert [(calculation.sheet_uuid, calculation.salary) for calculation in result] == [
+        (empty_sheet.uuid, Decimal(0)),
+        (database_sheet.uuid, Decimal('30.00')),
+    ]
+    assert all(calculation.unpriced_record_uuids == [] for calculation in result)
+
+
+async def test_get_salary_breakdown(salary_repository, database_sheet, session):
+    session.add_all([
+        _database_record(database_sheet.uuid, 2, timedelta(hours=1), datetime(2021, 1, 1, 10, tzinfo=UTC)),
+        _database_record(database_sheet.uuid, 5, timedelta(hours=4), datetime(2021, 1, 2, tzinfo=UTC)),
+        # already February in Europe/Warsaw
+        _database_record(database_sheet.uuid, 2, timedelta(hours=1), datetime(2021, 1, 31, 23, 30, tzinfo=UTC)),
+    ])
+    await session.commit()
+
+    result = await salary_repository.get_salary_breakdown(
+        database_sheet.uuid,
+        datetime(2021, 1, 1, tzinfo=UTC),
+        datetime(2021, 2, 28, tzinfo=UTC),
+        SalaryGranularity.MONTH,
+        "Europe/Warsaw"
+    )
+
+    warsaw = ZoneInfo("Europe/Warsaw")
+    assert result.unpriced_record_uuids == []
+    assert result.buckets == [
+        SalaryBucket(
+            bucket_start=datetime(2021, 1, 1, tzinfo=warsaw),
+            salary=Decimal('30.00'),
+            records_count=2,
+            total_duration=timedelta(hours=5)
+        ),
+        SalaryBucket(
+            bucket_start=datetime(2021, 2, 1, tzinfo=warsaw),
+            salary=Decimal('15.50'),
+            records_count=1,
+            total_duration=timedelta(hours=1)
+        ),
+    ]
+
+
+async def test_get_salary_breakdown_reports_unpriced_records(salary_repository, database_sheet, session):
+    unpriced_record = _database_record(database_sheet.uuid, 5, timedelta(hours=4), datetime(2021, 1, 20, tzinfo=UTC))
+    session.add(unpriced_record)
+    await session.commit()
+
+    result = await salary_repository.get_salary_breakdown(
+        database_sheet.uuid,
+        datetime(2021, 1, 1, tzinfo=UTC),
+        datetime(2021, 1, 31, tzinfo=UTC),
+        SalaryGranularity.WEEK,
+        "UTC"
+    )
+
+    assert result.buckets == [
+        SalaryBucket(
+            bucket_start=datetime(2021, 1, 18, tzinfo=UTC),
+            salary=Decimal(0),
+            records_count=1,
+            total_duration=timedelta(hours=4)
+        )
+    ]
+    assert result.unpriced_record_uuids == [unpriced_record.uuid]
+
+
+def _record(group_size, duration, happened_at):
+    return Record(
+        uuid=uuid4(),
+        group_size=group_size,
+        duration=duration,
+        group_name="Test Group",
+        happened_at=happened_at,
+        additional_info=None
+    )
+
+
+async def test_get_salary_summary_follows_added_and_deleted_records(salary_repository, database_sheet, session):
+    sheet_record_repository = SheetRecordRepository(session=session)
+    deleted_record = _record(5, timedelta(hours=4), datetime(2021, 1, 2, tzinfo=UTC))
+    for record in [
+        _record(2, timedelta(hours=1), datetime(2021, 1, 1, tzinfo=UTC)),
+        deleted_record,
+        _record(2, timedelta(hours=1), datetime(2021, 1, 20, tzinfo=UTC)),
+        _record(5, timedelta(hours=4), datetime(2021, 2, 20, tzinfo=UTC)),
+    ]:
+        await sheet_record_repository.add(database_sheet.uuid, record)
+
+    january = await salary_repository.get_salary_summary(
+        database_sheet.uuid,
+        datetime(2021, 1, 1, tzinfo=UTC),
+        datetime(2021, 2, 1, tzinfo=UTC)
+    )
+    assert january.salary == Decimal('45.50')
+    assert january.unpriced_records_count == 0
+
+    await sheet_record_repository.delete(database_sheet.uuid, deleted_record.uuid)
+
+    january_and_february = await salary_repository.get_salary_summary(
+        database_sheet.uuid,
+        datetime(2021, 1, 1, tzinfo=UTC),
+        datetime(2021, 3, 1, tzinfo=UTC)
+    )
+    assert january_and_february.salary == Decimal('25.50')
+    assert january_and_february.unpriced_records_count == 1
+
+
+async def test_get_salary_summary_follows_rate_table_upsert(salary_repository, database_sheet, session):
+    sheet_record_repository = SheetRecordRepository(session=session)
+    await sheet_record_repository.add(database_sheet.uuid,
+                                      _record(2, timedelta(hours=1), datetime(2021, 1, 1, tzinfo=UTC)))
+    await sheet_record_repository.add(database_sheet.uuid,
+                                      _record(2, timedelta(hours=1), datetime(2021, 3, 1, tzinfo=UTC)))
+
+    rate_tables = sorted(await RateTableRepository(session=session).get_for_sheet(database_sheet.uuid),
+                         key=lambda rate_table: rate_table.valid_from)
+    rate_tables[1] = RateTable(
+        uuid=rate_tables[1].uuid,
+        valid_from=rate_tables[1].valid_from,
+        valid_to=rate_tables[1].valid_to,
+        rates=[Rate(rate=Decimal('30.00'), group_size=2, duration=timedelta(hours=1))]
+    )
+    await RateTableRepository(session=session).upsert(database_sheet.uuid, rate_tables)
+
+    result = await salary_repository.get_salary_summary(
+        database_sheet.uuid,
+        datetime(2021, 1, 1, tzinfo=UTC),
+        datetime(2021, 4, 1, tzinfo=UTC)
+    )
+
+    assert result.salary == Decimal('40.00')
+    assert result.unpriced_records_count == 0
@@ -2,12 +2,15 @@ from datetime import timedelta, datetime, UTC
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, event, text
 
 from salary_tracker.data.model import DatabaseUser, DatabaseSheet, DatabaseSheetDuration, DatabaseSheetGroupSize, \
-    DatabaseSheetRecord
+    DatabaseSheetRecord, DatabaseSheetSalaryMonth
+from salary_tracker.data.repositories.sheet import sheet_record_repository as sheet_record_repository_module
+from salary_tracker.data.repositories.sheet.salary_repository import SalaryRepository
 from salary_tracker.data.repositories.sheet.sheet_record_repository import SheetRecordRepository
-from salary_tracker.domain.pagination import PaginatedRequest, PageParams
+from salary_tracker.data.repositories.sheet.sheet_repository import SheetRepository
+from salary_tracker.domain.pagination import PaginatedRequest, PageParams, TotalMode
 from salary_tracker.domain.sheet.models import Record, SheetRecordFilters
 
 
@@ -144,6 +147,141 @@ async def test_get_paginated(sheet_record_repository, database_sheet, session):
     assert third_page.items == []
 
 
+async def test_get_paginated_cursor(sheet_record_repository, database_sheet, session):
+    # two records share a moment so the uuid has to break the tie
+    happened_at = [datetime(2021, 1, 1, tzinfo=UTC)] * 2 + [datetime(2021, 1, day, tzinfo=UTC) for day in range(2, 6)]
+    records = sorted([
+        Record(
+            uuid=uuid4(),
+            group_size=2,
+            duration=timedelta(hours=1),
+            group_name="Test Group",
+            happened_at=value,
+            additional_info=None
+        ) for value in happened_at
+    ], key=lambda record: (record.happened_at, record.uuid))
+    for record in records:
+        session.add(DatabaseSheetRecord(sheet_uuid=database_sheet.uuid, **record.model_dump()))
+    await session.commit()
+
+    async def get_paginated(cursor):
+        return await sheet_record_repository.get_paginated(PaginatedRequest(
+            page_params=PageParams(per_page=2),
+            filters=SheetRecordFilters(sheet_uuid=database_sheet.uuid, datetime_from=None, datetime_to=None),
+            cursor=cursor
+        ))
+
+    first_page = await get_paginated(None)
+    assert first_page.items == records[:2]
+    assert first_page.prev_cursor is None
+
+    second_page = await get_paginated(first_page.next_cursor)
+    assert second_page.items == records[2:4]
+    assert second_page.page is None
+
+    third_page = await get_paginated(second_page.next_cursor)
+    assert third_page.items == records[4:]
+    assert third_page.next_cursor is None
+
+    back_page = await get_paginated(third_page.prev_cursor)
+    assert back_page.items == records[2:4]
+
+    first_page_again = await get_paginated(back_page.prev_cursor)
+    assert first_page_again.items == records[:2]
+    assert first_page_again.prev_cursor is None
+    assert first_page_again.total == len(records)
+
+
+async def test_get_paginated_total_modes(sheet_record_repository, database_sheet, session):
+    for day in range(1, 6):
+        session.add(DatabaseSheetRecord(
+            uuid=uuid4(),
+            sheet_uuid=database_sheet.uuid,
+            group_size=2,
+            duration=timedelta(hours=1),
+            group_name="Test Group",
+            happened_at=datetime(2021, 1, day, tzinfo=UTC),
+            additional_info=None
+        ))
+    await session.commit()
+
+    statements = []
+    engine = session.bind.sync_engine
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    async def get_paginated(page: int, total: TotalMode, cursor=None):
+        statements.clear()
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            return await sheet_record_repository.get_paginated(PaginatedRequest(
+                page_params=PageParams(page=page, per_page=2, total=total),
+                filters=SheetRecordFilters(
+                    sheet_uuid=database_sheet.uuid,
+                    datetime_from=datetime(2021, 1, 1, tzinfo=UTC),
+                    datetime_to=None
+                ),
+                cursor=cursor
+            ))
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    exact = await get_paginated(1, TotalMode.EXACT)
+    assert (exact.total, exact.total_pages, exact.has_more) == (5, 3, True)
+    assert len(statements) == 1
+
+    exact_cursor = await get_paginated(0, TotalMode.EXACT, cursor=exact.next_cursor)
+    assert (len(exact_cursor.items), exact_cursor.total, exact_cursor.has_more) == (1, 5, False)
+    assert len(statements) == 1
+
+    past_end = await get_paginated(5, TotalMode.EXACT)
+    assert (past_end.items, past_end.total) == ([], 5)
+
+    none = await get_paginated(2, TotalMode.NONE)
+    assert (len(none.items), none.total, none.total_pages, none.has_more) == (1, None, None, False)
+    assert len(statements) == 1
+
+    estimate = await get_paginated(0, TotalMode.ESTIMATE)
+    assert estimate.total >= 3
+    assert estimate.has_more
+
+
+async def test_iter_records(sheet_record_repository, database_sheet, session):
+    happened_at = [
+        datetime(2021, 1, 1, 12, 0, tzinfo=UTC),
+        datetime(2021, 1, 2, 12, 0, tzinfo=UTC),
+        # records sharing happened_at are ordered by uuid
+        datetime(2021, 1, 2, 12, 0, tzinfo=UTC),
+        datetime(2021, 1, 2, 12, 0, tzinfo=UTC),
+        datetime(2021, 1, 3, 12, 0, tzinfo=UTC),
+        # outside of the filters
+        datetime(2021, 3, 1, 12, 0, tzinfo=UTC),
+    ]
+    records = [
+        Record(
+            uuid=uuid4(),
+            group_size=2,
+            duration=timedelta(hours=1),
+            group_name=f"Test Group {index}",
+            happened_at=record_happened_at,
+            additional_info=None
+        ) for index, record_happened_at in enumerate(happened_at)
+    ]
+
+    for record in records:
+        session.add(DatabaseSheetRecord(sheet_uuid=database_sheet.uuid, **record.model_dump()))
+    await session.commit()
+
+    filters = SheetRecordFilters(
+        sheet_uuid=database_sheet.uuid,
+        datetime_from=datetime(2021, 1, 1, 0, 0, tzinfo=UTC),
+        datetime_to=datetime(2021, 2, 2, 0, 0, tzinfo=UTC)
+    )
+    result = [record async for record in sheet_record_repository.iter_records(filters, batch_size=2)]
+
+    assert result == sorted(records[:5], key=lambda record: (record.happened_at, record.uuid))
+
+
 async def test_add(sheet_record_repository, database_sheet, session):
     record = Record(
         uuid=uuid4(),
@@ -167,6 +305,39 @@ async def test_add(sheet_record_repository, database_sheet, session):
     assert record_db.additional_info == record.additional_info
 
 
+async def test_add_many(sheet_record_repository, database_sheet, session, monkeypatch):
+    monkeypatch.setattr(sheet_record_repository_module, "_ADD_MANY_BATCH_SIZE", 2)
+    sheet_uuid = database_sheet.uuid
+    records = [
+        Record(
+            uuid=uuid4(),
+            group_size=2,
+            duration=timedelta(hours=1),
+            group_name="Test Group",
+            happened_at=datetime(2021, month, 1, 12, 0, tzinfo=UTC),
+            additional_info=None
+        ) for month in (1, 1, 2, 3, 3)
+    ]
+
+    result = await sheet_record_repository.add_many(sheet_uuid, records)
+
+    assert result == records
+
+    records_db = (await session.execute(
+        select(DatabaseSheetRecord).filter_by(sheet_uuid=sheet_uuid).order_by(DatabaseSheetRecord.happened_at)
+    )).scalars().all()
+    assert {record_db.uuid for record_db in records_db} == {record.uuid for record in records}
+
+    salary_months = (await session.execute(
+        select(DatabaseSheetSalaryMonth.month, DatabaseSheetSalaryMonth.records_count)
+        .filter_by(sheet_uuid=sheet_uuid)
+        .order_by(DatabaseSheetSalaryMonth.month)
+    )).all()
+    assert [records_count for _, records_count in salary_months] == [2, 1, 2]
+
+    assert await SheetRepository(session=session).get_data_version(sheet_uuid) == 1
+
+
 async def test_delete_exists(sheet_record_repository, database_sheet, session):
     record = Record(
         uuid=uuid4(),
@@ -197,4 +368,66 @@ async def test_delete_exists(sheet_record_repository, database_sheet, session):
 
 async def test_delete_not_exists(sheet_record_repository, database_sheet):
     with pytest.raises(Exception):
-        await sheet_record_repository.delete(database_sheet.uuid, uuid4())
\ No newline at end of file
+        await sheet_record_repository.delete(database_sheet.uuid, uuid4())
+
+
+async def test_add_and_delete_bump_data_version(sheet_record_repository, database_sheet, session):
+    sheet_repository = SheetRepository(session=session)
+    record = Record(
+        uuid=uuid4(),
+        group_size=2,
+        duration=timedelta(hours=1),
+        group_name="Test Group",
+        happened_at=datetime(2021, 1, 1, 12, 0, tzinfo=UTC),
+        additional_info=None
+    )
+    assert await sheet_repository.get_data_version(database_sheet.uuid) == 0
+
+    await sheet_record_repository.add(database_sheet.uuid, record)
+    assert await sheet_repository.get_data_version(database_sheet.uuid) == 1
+
+    await sheet_record_repository.delete(database_sheet.uuid, record.uuid)
+    assert await sheet_repository.get_data_version(database_sheet.uuid) == 2
+
+
+async def _explain_executed(session, action) -> list[str]:
+    executed = []
+    engine = session.bind.sync_engine
+    def before_cursor_execute(conn, cursor, statement, parameters, *args):
+        executed.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        await action()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    # a handful of test rows would always be scanned sequentially
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    connection = await session.connection()
+    plans = []
+    for statement, parameters in executed:
+        result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        plans.append("\n".join(row[0] for row in result))
+
+    return plans
+
+
+async def test_record_scans_use_index(sheet_record_repository, database_sheet, session):
+    filters = SheetRecordFilters(
+        sheet_uuid=database_sheet.uuid,
+        datetime_from=datetime(2021, 1, 1, tzinfo=UTC),
+        datetime_to=datetime(2021, 2, 1, tzinfo=UTC)
+    )
+
+    items_plan, = await _explain_executed(session, lambda: sheet_record_repository.get_paginated(
+        PaginatedRequest(filters=filters, page_params=PageParams(page=0, per_page=10))
+    ))
+    assert "ix_sheet_records_sheet_uuid_happened_at_uuid" in items_plan
+    assert "Sort" not in items_plan
+
+    salary_repository = SalaryRepository(session=session)
+    columns_plan, = await _explain_executed(session, lambda: salary_repository.get_record_columns(
+        filters.sheet_uuid, filters.datetime_from, filters.datetime_to
+    ))
+    assert "Index Only Scan using ix_sheet_records_sheet_uuid_happened_at_uuid" in columns_plan
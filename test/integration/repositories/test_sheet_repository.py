@@ -1,11 +1,14 @@
-from datetime import timedelta
+from datetime import timedelta, datetime, UTC
+from decimal import Decimal
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, event
 
 from salary_tracker.data.exceptions import DataException
-from salary_tracker.data.model import DatabaseUser, DatabaseSheet, DatabaseSheetDuration, DatabaseSheetGroupSize
+from salary_tracker.data.model import DatabaseUser, DatabaseSheet, DatabaseSheetDuration, DatabaseSheetGroupSize, \
+    DatabaseSheetRateTable, DatabaseSheetRate, DatabaseSheetRecord
+from salary_tracker.data.repositories.sheet.loading import SHEET_METADATA
 from salary_tracker.data.repositories.sheet.sheet_repository import SheetRepository
 from salary_tracker.domain.pagination import PaginatedRequest, PageParams
 from salary_tracker.domain.sheet.models import Sheet
@@ -60,6 +63,35 @@ async def test_get_by_uuid_not_exists(sheet_repository):
     assert result is None
 
 
+async def test_get_by_uuid_loads_metadata_only(sheet_repository, database_user, session):
+    uuid = uuid4()
+    session.add(DatabaseSheet(
+        uuid=uuid,
+        owner_user_uuid=database_user.uuid,
+        title="Test Sheet",
+        description="Test Description",
+        durations=[DatabaseSheetDuration(duration=timedelta(hours=1))],
+        group_sizes=[DatabaseSheetGroupSize(group_size=2)]
+    ))
+    await session.commit()
+    session.expunge_all()
+
+    statements = []
+    engine = session.bind.sync_engine
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        result = await sheet_repository.get_by_uuid(uuid)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert result.durations == {timedelta(hours=1)}
+    assert not [statement for statement in statements
+                if "sheet_records" in statement or "sheet_rate_tables" in statement]
+
+
 async def test_get_by_owner_paginated(sheet_repository, database_user, session):
     expected = [
         Sheet(
@@ -140,7 +172,7 @@ async def test_upsert_create(sheet_repository, database_user, session):
 
     result = await sheet_repository.upsert(sheet)
     db_result = (await session.execute(
-        select(DatabaseSheet).filter_by(uuid=sheet.uuid)
+        select(DatabaseSheet).filter_by(uuid=sheet.uuid).options(*SHEET_METADATA)
     )).scalar_one()
 
     assert result == sheet
@@ -174,7 +206,7 @@ async def test_upsert_update(sheet_repository, database_user, session):
 
     result = await sheet_repository.upsert(sheet)
     db_result = (await session.execute(
-        select(DatabaseSheet).filter_by(uuid=sheet.uuid)
+        select(DatabaseSheet).filter_by(uuid=sheet.uuid).options(*SHEET_METADATA)
     )).scalar_one()
 
     assert result == sheet
@@ -204,6 +236,54 @@ async def test_delete_exists(sheet_repository, session, database_user):
     assert result is None
 
 
+async def test_delete_cascades_without_loading(sheet_repository, session, database_user):
+    uuid = uuid4()
+    rate_table_uuid = uuid4()
+    session.add(DatabaseSheet(
+        uuid=uuid,
+        owner_user_uuid=database_user.uuid,
+        title="Test Sheet",
+        description="Test Description",
+        durations=[DatabaseSheetDuration(duration=timedelta(hours=1))],
+        group_sizes=[DatabaseSheetGroupSize(group_size=2)],
+        rate_tables=[DatabaseSheetRateTable(
+            uuid=rate_table_uuid,
+            valid_from=datetime.min.replace(tzinfo=UTC),
+            valid_to=datetime.max.replace(tzinfo=UTC),
+            rates=[DatabaseSheetRate(group_size=2, duration=timedelta(hours=1), rate=Decimal('10.00'))]
+        )],
+        records=[DatabaseSheetRecord(
+            uuid=uuid4(),
+            duration=timedelta(hours=1),
+            group_size=2,
+            group_name="Group",
+            happened_at=datetime(2021, 1, 1, tzinfo=UTC)
+        )]
+    ))
+    await session.commit()
+
+    statements = []
+    engine = session.bind.sync_engine
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        await sheet_repository.delete(uuid)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert not [statement for statement in statements if statement.lstrip().startswith("SELECT")]
+    for model, where in (
+        (DatabaseSheetDuration, DatabaseSheetDuration.sheet_uuid == uuid),
+        (DatabaseSheetGroupSize, DatabaseSheetGroupSize.sheet_uuid == uuid),
+        (DatabaseSheetRateTable, DatabaseSheetRateTable.sheet_uuid == uuid),
+        (DatabaseSheetRate, DatabaseSheetRate.rate_table_uuid == rate_table_uuid),
+        (DatabaseSheetRecord, DatabaseSheetRecord.sheet_uuid == uuid),
+    ):
+        assert (await session.execute(select(model).where(where))).first() is None
+
+
 async def test_delete_not_exists(sheet_repository):
     uuid = uuid4()
 
@@ -0,0 +1,12 @@
+from salary_tracker.presentation.dependencies.services import get_token_key_ring
+
+
+async def test_jwks_publishes_signing_key(client, settings):
+    response = await client.get("/api/v1/auth/jwks/")
+
+    assert response.status_code == 200
+    [key] = response.json()["keys"]
+    assert key["kid"] == get_token_key_ring(settings).signing_key().key_id
+    assert (key["kty"], key["alg"], key["use"]) == ("RSA", "RS256", "sig")
+    assert "d" not in key
+    assert response.headers["cache-control"] == "public, max-age=300"
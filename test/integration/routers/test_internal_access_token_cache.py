@@ -0,0 +1,43 @@
+from datetime import datetime, UTC, timedelta
+from uuid import uuid4
+
+import pytest
+from jose import jwt
+
+from salary_tracker.data.model import DatabaseUser
+from salary_tracker.presentation.dependencies.services import get_token_key_ring
+
+
+@pytest.fixture
+def settings(settings):
+    return settings.model_copy(update={"internal_endpoints_enabled": True})
+
+
+@pytest.fixture
+async def access_token(settings, session):
+    user_uuid = uuid4()
+    session.add(DatabaseUser(uuid=user_uuid, email="test@example.com", name="Test User"))
+    await session.commit()
+
+    token_key_ring = get_token_key_ring(settings)
+    claims = {
+        'sub': str(user_uuid),
+        'exp': datetime.now(tz=UTC) + timedelta(minutes=3),
+        'jti': str(uuid4()),
+        'aud': settings.access_token_audience,
+        'iss': settings.access_token_issuer
+    }
+    signing_key = token_key_ring.signing_key()
+    return jwt.encode(claims, signing_key.key, algorithm=signing_key.algorithm, headers={"kid": signing_key.key_id})
+
+
+async def test_access_token_verified_once(client, access_token):
+    before = (await client.get("/api/v1/internal/auth/access-token-cache/")).json()
+
+    for _ in range(3):
+        response = await client.get("/api/v1/auth/me/", headers={"Authorization": f"Bearer {access_token}"})
+        assert response.status_code == 200
+
+    after = (await client.get("/api/v1/internal/auth/access-token-cache/")).json()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 2
@@ -0,0 +1,22 @@
+import pytest
+from sqlalchemy import text
+
+
+@pytest.fixture
+def settings(settings):
+    return settings.model_copy(update={"internal_endpoints_enabled": True})
+
+
+async def test_database_pool_stats(client, database):
+    async with database.session() as session:
+        await session.execute(text("SELECT 1"))
+
+        response = await client.get("/api/v1/internal/database/pool/")
+
+    assert response.status_code == 200
+    stats = response.json()["primary"]
+    assert stats["checked_out"] == 1
+    assert stats["size"] == 5
+    assert stats["checkouts"] >= 2
+    assert stats["waiting"] == 0
+    assert response.json()["replicas"] == []
@@ -0,0 +1,60 @@
+import pytest
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel, computed_field
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from salary_tracker.presentation.dependencies.data import get_read_session
+from salary_tracker.presentation.routing import SessionReleasingRoute
+
+
+@pytest.fixture
+async def probe_app(app, database):
+    class PoolProbe(BaseModel):
+        @computed_field
+        @property
+        def checked_out(self) -> int:
+            # evaluated while the response is serialized
+            return database.pool_stats().primary.checked_out
+
+    router = APIRouter(route_class=SessionReleasingRoute)
+
+    @router.get("/probe/", response_model=PoolProbe)
+    async def probe(execute: bool, session: AsyncSession = Depends(get_read_session)):
+        if execute:
+            await session.execute(text("SELECT 1"))
+        return PoolProbe()
+
+    app.include_router(router)
+    return app
+
+
+async def test_connection_released_before_serialization(probe_app, client):
+    response = await client.get("/probe/", params={"execute": True})
+
+    assert response.status_code == 200
+    assert response.json()["checked_out"] == 0
+
+
+async def test_connection_checked_out_lazily(probe_app, client, database):
+    checkouts = database.pool_stats().primary.checkouts
+
+    response = await client.get("/probe/", params={"execute": False})
+
+    assert response.status_code == 200
+    assert database.pool_stats().primary.checkouts == checkouts
+
+
+async def test_endpoint_wrapped_once_when_router_included_again(app):
+    router = APIRouter(route_class=SessionReleasingRoute)
+
+    @router.get("/nested-probe/")
+    async def nested_probe():
+        return {}
+
+    parent_router = APIRouter()
+    parent_router.include_router(router)
+    app.include_router(parent_router)
+
+    endpoint = next(route.endpoint for route in app.routes if getattr(route, "path", None) == "/nested-probe/")
+    assert endpoint.__wrapped__ is nested_probe
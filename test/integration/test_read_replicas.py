@@ -0,0 +1,135 @@
+import pytest
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import text, make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from salary_tracker.data.database import Database
+from salary_tracker.data.model import Base
+from salary_tracker.presentation.dependencies.presentation import get_settings
+
+
+@pytest.fixture
+async def replica_database_url(settings):
+    # a second database on the same server stands in for a replica, it gets the schema but never any rows
+    database_url = make_url(settings.database_url.unicode_string())
+    replica_database_name = f"{database_url.database}_replica"
+    replica_database_url = database_url.set(database=replica_database_name).render_as_string(hide_password=False)
+
+    admin_engine = create_async_engine(database_url, isolation_level="AUTOCOMMIT")
+    async with admin_engine.connect() as connection:
+        await connection.execute(text(f"DROP DATABASE IF EXISTS {replica_database_name} WITH (FORCE)"))
+        await connection.execute(text(f"CREATE DATABASE {replica_database_name}"))
+
+    replica_database = Database(replica_database_url)
+    async with replica_database.connect() as connection:
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+        await connection.run_sync(Base.metadata.create_all)
+    await replica_database.close()
+
+    yield replica_database_url
+
+    async with admin_engine.connect() as connection:
+        await connection.execute(text(f"DROP DATABASE {replica_database_name} WITH (FORCE)"))
+    await admin_engine.dispose()
+
+
+@pytest.fixture
+async def database(settings, replica_database_url):
+    database = Database(database_url=settings.database_url.unicode_string(), replica_urls=[replica_database_url])
+    async with database.connect() as connection:
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gist"))
+        await connection.run_sync(Base.metadata.create_all)
+    yield database
+    async with database.connect() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+    await database.close()
+
+
+@pytest.fixture
+def settings(settings):
+    # cookie jars ignore a domain without a dot, like the localhost of the test settings
+    return settings.model_copy(update={"refresh_token_cookie_domain": "api.example.com"})
+
+
+@pytest.fixture
+async def client(app, settings):
+    # the cookies are set for the configured domain, the client only sends them back to a matching host
+    async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url=f"http://{settings.refresh_token_cookie_domain}",
+    ) as c:
+        yield c
+
+
+async def test_read_session_uses_read_only_replica(database, replica_database_url):
+    async with database.read_session() as session:
+        current_database = (await session.execute(text("SELECT current_database()"))).scalar()
+        assert replica_database_url.endswith(f"/{current_database}")
+
+        with pytest.raises(DBAPIError, match="read-only transaction"):
+            await session.execute(text("CREATE TABLE read_only_check (id int)"))
+
+    async with database.read_session(use_primary=True) as session:
+        current_database = (await session.execute(text("SELECT current_database()"))).scalar()
+        assert not replica_database_url.endswith(f"/{current_database}")
+
+
+async def test_pool_stats_per_engine(database):
+    async with database.read_session() as session:
+        await session.execute(text("SELECT 1"))
+
+        stats = database.pool_stats()
+        assert stats.primary.checked_out == 0
+        assert [replica.checked_out for replica in stats.replicas] == [1]
+
+
+async def test_reads_stay_on_primary_after_write(client, provide_logged_in_user):
+    async with provide_logged_in_user():
+        response = await client.post("/api/v1/sheets/", json={
+            "title": "Test Sheet",
+            "description": "",
+            "durations": ["PT1H"],
+            "group_sizes": [2],
+            "rates": [{"rate": "10.00", "group_size": 2, "duration": "PT1H"}]
+        })
+        assert response.status_code == 200
+        assert "primary_reads" in response.cookies
+
+        response = await client.get("/api/v1/sheets/", params={"per_page": 10})
+        assert [sheet["title"] for sheet in response.json()["items"]] == ["Test Sheet"]
+
+        # once the window is over reads go back to the replica, which in this test never catches up
+        client.cookies.clear()
+        response = await client.get("/api/v1/sheets/", params={"per_page": 10})
+        assert response.json()["items"] == []
+
+
+@pytest.fixture
+def cross_site_settings(settings):
+    return settings.model_copy(update={
+        "refresh_token_cookie_secure": True,
+        "refresh_token_cookie_same_site": "none"
+    })
+
+
+async def test_primary_reads_cookie_follows_cookie_settings(app, client, cross_site_settings, provide_logged_in_user):
+    app.dependency_overrides[get_settings] = lambda: cross_site_settings
+
+    async with provide_logged_in_user():
+        response = await client.post("/api/v1/sheets/", json={
+            "title": "Test Sheet",
+            "description": "",
+            "durations": ["PT1H"],
+            "group_sizes": [2],
+            "rates": [{"rate": "10.00", "group_size": 2, "duration": "PT1H"}]
+        })
+
+    assert response.status_code == 200
+    set_cookie = next(header for header in response.headers.get_list("set-cookie")
+                      if header.startswith("primary_reads="))
+    attributes = {attribute.strip().lower() for attribute in set_cookie.split(";")}
+    assert "secure" in attributes
+    assert "samesite=none" in attributes
+    assert "domain=api.example.com" in attributes
+    assert "httponly" in attributes
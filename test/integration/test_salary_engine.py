@@ -0,0 +1,23 @@
+import sys
+
+import pytest
+
+from salary_tracker.presentation.dependencies.services import get_salary_service_class
+from salary_tracker.presentation.main import create_app
+
+
+@pytest.fixture
+def vectorized_settings(settings):
+    get_salary_service_class.cache_clear()
+    yield settings.model_copy(update={"salary_engine": "vectorized"})
+    get_salary_service_class.cache_clear()
+
+
+def test_vectorized_engine_without_numpy_fails_at_startup(vectorized_settings, monkeypatch):
+    # a None entry makes the import fail as if numpy was not installed
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    monkeypatch.delitem(sys.modules, "salary_tracker.domain.sheet.impl.service.vectorized_salary_service",
+                        raising=False)
+
+    with pytest.raises(RuntimeError, match="requirements-vectorized.txt"):
+        create_app(vectorized_settings)
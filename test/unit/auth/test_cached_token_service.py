@@ -0,0 +1,43 @@
+from datetime import datetime, UTC, timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from salary_tracker.domain.auth.impl.cache.in_memory_access_token_cache import InMemoryAccessTokenCache
+from salary_tracker.domain.auth.impl.token.cached_token_service import CachedTokenService
+from salary_tracker.domain.auth.models import AccessToken
+from salary_tracker.domain.auth.services import ITokenService
+from salary_tracker.domain.exceptions import InvalidTokenDomainException
+
+
+@pytest.fixture
+def token_service():
+    return AsyncMock(spec=ITokenService)
+
+
+@pytest.fixture
+def cached_token_service(token_service):
+    return CachedTokenService(
+        token_service=token_service,
+        access_token_cache=InMemoryAccessTokenCache(max_size=10)
+    )
+
+
+async def test_validate_access_token_cached(cached_token_service, token_service):
+    access_token = AccessToken(user_uuid=uuid4(), token="token", expires_at=datetime.now(tz=UTC) + timedelta(minutes=3))
+    token_service.validate_access_token.return_value = access_token
+
+    assert await cached_token_service.validate_access_token("token") == access_token
+    assert await cached_token_service.validate_access_token("token") == access_token
+    token_service.validate_access_token.assert_awaited_once_with("token")
+
+
+async def test_validate_access_token_invalid_not_cached(cached_token_service, token_service):
+    token_service.validate_access_token.side_effect = InvalidTokenDomainException()
+
+    for _ in range(2):
+        with pytest.raises(InvalidTokenDomainException):
+            await cached_token_service.validate_access_token("token")
+
+    assert token_service.validate_access_token.await_count == 2
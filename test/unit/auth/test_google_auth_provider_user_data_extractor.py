@@ -0,0 +1,182 @@
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, UTC, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from google.auth import crypt, jwt
+
+from salary_tracker.domain.auth.impl.cache.http_certificate_cache import HttpCertificateCache
+from salary_tracker.domain.auth.impl.provider.google_auth_provider_user_data_extractor import \
+    GoogleAuthProviderUserDataExtractor
+from salary_tracker.domain.auth.models import AuthProvider
+
+_APP_CLIENT_ID = "test-client-id"
+_KEY_ID = "test-key"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CertificateServer:
+    # stands in for Google's certificate endpoint
+    def __init__(self, certificates: dict[str, str], max_age: int):
+        self.certificates = certificates
+        self.max_age = max_age
+        self.requests = 0
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                body = json.dumps(server.certificates).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", f"public, max-age={server.max_age}, must-revalidate, no-transform")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._http_server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._http_server.server_port}/oauth2/v1/certs"
+        self._thread = threading.Thread(target=self._http_server.serve_forever, args=(0.05,), daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._http_server.shutdown()
+        self._http_server.server_close()
+
+
+@pytest.fixture(scope="module")
+def private_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(scope="module")
+def certificate(private_key):
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "test")])
+    now = datetime.now(tz=UTC)
+    return x509.CertificateBuilder() \
+        .subject_name(name) \
+        .issuer_name(name) \
+        .public_key(private_key.public_key()) \
+        .serial_number(x509.random_serial_number()) \
+        .not_valid_before(now - timedelta(days=1)) \
+        .not_valid_after(now + timedelta(days=1)) \
+        .sign(private_key, hashes.SHA256()) \
+        .public_bytes(serialization.Encoding.PEM) \
+        .decode("utf-8")
+
+
+@pytest.fixture
+def certificate_server(certificate):
+    with _CertificateServer({_KEY_ID: certificate}, max_age=3600) as certificate_server:
+        yield certificate_server
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def certificate_cache(certificate_server, clock):
+    return HttpCertificateCache(url=certificate_server.url, refresh_margin=timedelta(minutes=5), clock=clock)
+
+
+def _id_token(private_key, **claims) -> str:
+    pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+    now = int(time.time())
+    payload = {
+        "iss": "https://accounts.google.com",
+        "aud": _APP_CLIENT_ID,
+        "sub": "1234567890",
+        "email": "user@example.com",
+        "name": "Test User",
+        "iat": now,
+        "exp": now + 3600,
+        **claims
+    }
+    return jwt.encode(crypt.RSASigner.from_string(pem, key_id=_KEY_ID), payload).decode("utf-8")
+
+
+async def _wait_for_certificates(certificate_cache, certificates: dict[str, str]) -> None:
+    for _ in range(100):
+        if await certificate_cache.get() == certificates:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("Timed out waiting for the certificates")
+
+
+async def test_certificates_cached_for_max_age(certificate_cache, certificate_server, clock):
+    first = await certificate_cache.get()
+    clock.now = 3600 - 301
+    second = await certificate_cache.get()
+
+    assert first == second == certificate_server.certificates
+    assert certificate_server.requests == 1
+
+    clock.now = 3600
+    await certificate_cache.get()
+    assert certificate_server.requests == 2
+
+
+async def test_certificates_refreshed_in_background(certificate_cache, certificate_server, clock):
+    certificates = await certificate_cache.get()
+    certificate_server.certificates = {"rotated": "certificate"}
+
+    # within the refresh margin the cached certificates are served while the new ones are fetched
+    clock.now = 3600 - 60
+    assert await certificate_cache.get() == certificates
+
+    await _wait_for_certificates(certificate_cache, {"rotated": "certificate"})
+    assert certificate_server.requests == 2
+
+
+async def test_concurrent_gets_fetch_once(certificate_cache, certificate_server):
+    await asyncio.gather(*[certificate_cache.get() for _ in range(10)])
+
+    assert certificate_server.requests == 1
+
+
+async def test_extract_from_token(certificate_cache, private_key):
+    extractor = GoogleAuthProviderUserDataExtractor(app_client_id=_APP_CLIENT_ID, certificate_cache=certificate_cache)
+
+    user_data = await extractor.extract_from_token(_id_token(private_key))
+
+    assert user_data.provider == AuthProvider.GOOGLE
+    assert (user_data.external_id, user_data.email, user_data.name) == ("1234567890", "user@example.com", "Test User")
+    assert user_data.avatar is None
+
+
+@pytest.mark.parametrize("claims", [
+    {"aud": "other-client-id"},
+    {"iss": "https://example.com"},
+    {"exp": int(time.time()) - 3600, "iat": int(time.time()) - 7200},
+])
+async def test_extract_from_token_invalid(certificate_cache, private_key, claims):
+    extractor = GoogleAuthProviderUserDataExtractor(app_client_id=_APP_CLIENT_ID, certificate_cache=certificate_cache)
+
+    assert await extractor.extract_from_token(_id_token(private_key, **claims)) is None
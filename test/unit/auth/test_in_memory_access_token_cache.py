@@ -0,0 +1,66 @@
+from datetime import datetime, UTC
+from uuid import uuid4
+
+import pytest
+
+from salary_tracker.domain.auth.impl.cache.in_memory_access_token_cache import InMemoryAccessTokenCache
+from salary_tracker.domain.auth.models import AccessToken
+
+_EXPIRES_AT = datetime(2021, 1, 1, 0, 5, tzinfo=UTC)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = _EXPIRES_AT.timestamp() - 300
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+def _access_token() -> AccessToken:
+    return AccessToken(user_uuid=uuid4(), token=f"token-{uuid4()}", expires_at=_EXPIRES_AT)
+
+
+async def test_get_counts_hits_and_misses(clock):
+    cache = InMemoryAccessTokenCache(max_size=10, clock=clock)
+    access_token = _access_token()
+
+    assert await cache.get(access_token.token) is None
+    await cache.set(access_token)
+    assert await cache.get(access_token.token) == access_token
+    assert await cache.get(access_token.token + "x") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 1)
+
+
+async def test_get_expires_with_token(clock):
+    cache = InMemoryAccessTokenCache(max_size=10, clock=clock)
+    access_token = _access_token()
+    await cache.set(access_token)
+
+    clock.now = _EXPIRES_AT.timestamp() - 1
+    assert await cache.get(access_token.token) is not None
+
+    clock.now = _EXPIRES_AT.timestamp()
+    assert await cache.get(access_token.token) is None
+    assert cache.stats().size == 0
+
+
+async def test_set_evicts_least_recently_used(clock):
+    cache = InMemoryAccessTokenCache(max_size=2, clock=clock)
+    first, second, third = _access_token(), _access_token(), _access_token()
+    await cache.set(first)
+    await cache.set(second)
+
+    await cache.get(first.token)
+    await cache.set(third)
+
+    assert await cache.get(second.token) is None
+    assert await cache.get(first.token) is not None
+    assert await cache.get(third.token) is not None
@@ -0,0 +1,97 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa, ed25519
+
+from salary_tracker.domain.auth.impl.token.token_key_ring import TokenKeyRing
+from salary_tracker.domain.auth.impl.token.token_service import TokenService
+from salary_tracker.domain.auth.models import TokenSettings
+from salary_tracker.domain.auth.repositories import IRefreshTokenRepository
+from salary_tracker.domain.exceptions import InvalidTokenDomainException
+from salary_tracker.domain.user.models import User
+from salary_tracker.domain.user.repositories import IUserRepository
+
+
+def _private_pem(key) -> str:
+    return key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    ).decode("utf-8")
+
+
+def _public_pem(key) -> str:
+    return key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode("utf-8")
+
+
+@pytest.fixture(scope="module")
+def rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(scope="module")
+def ec_key():
+    return ec.generate_private_key(ec.SECP256R1())
+
+
+def _token_service(token_key_ring: TokenKeyRing) -> TokenService:
+    user_repository = AsyncMock(IUserRepository)
+    user_repository.get_by_uuid.side_effect = lambda user_uuid: User(uuid=user_uuid, name="Test User",
+                                                                      email="email@example.com")
+    return TokenService(
+        token_settings=TokenSettings(
+            access_token_expiration_time=timedelta(minutes=3),
+            access_token_issuer="test_issuer",
+            access_token_audience="test_audience",
+            refresh_token_expiration_time=timedelta(days=365),
+        ),
+        token_key_ring=token_key_ring,
+        user_repository=user_repository,
+        refresh_token_repository=AsyncMock(IRefreshTokenRepository),
+    )
+
+
+@pytest.mark.parametrize("key_fixture, algorithm, kty", [
+    ("rsa_key", "RS256", "RSA"),
+    ("ec_key", "ES256", "EC"),
+])
+async def test_algorithm_follows_key(request, key_fixture, algorithm, kty):
+    token_key_ring = TokenKeyRing(private_key=_private_pem(request.getfixturevalue(key_fixture)))
+    token_service = _token_service(token_key_ring)
+    user_uuid = uuid4()
+
+    token_pair = await token_service.create_token_pair(user_uuid)
+    access_token = await token_service.validate_access_token(token_pair.access_token.token)
+
+    assert access_token.user_uuid == user_uuid
+    signing_key = token_key_ring.signing_key()
+    assert signing_key.algorithm == algorithm
+    [public_key] = token_key_ring.public_key_set().keys
+    assert (public_key.kid, public_key.alg, public_key.kty) == (signing_key.key_id, algorithm, kty)
+
+
+def test_unsupported_key():
+    with pytest.raises(ValueError):
+        TokenKeyRing(private_key=_private_pem(ed25519.Ed25519PrivateKey.generate()))
+
+
+async def test_rotation_accepts_retired_key(rsa_key, ec_key):
+    old_token_service = _token_service(TokenKeyRing(private_key=_private_pem(rsa_key)))
+    token_pair = await old_token_service.create_token_pair(uuid4())
+
+    rotated_key_ring = TokenKeyRing(private_key=_private_pem(ec_key), verification_keys=(_public_pem(rsa_key),))
+    rotated_token_service = _token_service(rotated_key_ring)
+
+    access_token = await rotated_token_service.validate_access_token(token_pair.access_token.token)
+    assert access_token.user_uuid == token_pair.user.uuid
+    assert len(rotated_key_ring.public_key_set().keys) == 2
+
+    retired_token_service = _token_service(TokenKeyRing(private_key=_private_pem(ec_key)))
+    with pytest.raises(InvalidTokenDomainException):
+        await retired_token_service.validate_access_token(token_pair.access_token.token)
@@ -5,6 +5,7 @@ from uuid import UUID
 import pytest
 from freezegun import freeze_time
 
+from salary_tracker.domain.auth.impl.token.token_key_ring import TokenKeyRing
 from salary_tracker.domain.auth.impl.token.token_service import TokenService
 from salary_tracker.domain.auth.models import TokenSettings, AccessToken
 from salary_tracker.domain.auth.repositories import IRefreshTokenRepository
@@ -46,9 +47,8 @@ ADl0uFyaocDR6NQ7QZgP3xI=
 
 
 @pytest.fixture
-def token_settings(private_key):
+def token_settings():
     return TokenSettings(
-        access_token_private_key=private_key,
         access_token_expiration_time=timedelta(minutes=3),
         access_token_issuer="test_issuer",
         access_token_audience="test_audience",
@@ -56,6 +56,11 @@ def token_settings(private_key):
     )
 
 
+@pytest.fixture
+def token_key_ring(private_key):
+    return TokenKeyRing(private_key=private_key)
+
+
 @pytest.fixture
 def refresh_token_repository():
     return AsyncMock(IRefreshTokenRepository)
@@ -67,9 +72,10 @@ def user_repository():
 
 
 @pytest.fixture
-def token_service(token_settings, user_repository, refresh_token_repository):
+def token_service(token_settings, token_key_ring, user_repository, refresh_token_repository):
     return TokenService(
         token_settings=token_settings,
+        token_key_ring=token_key_ring,
         user_repository=user_repository,
         refresh_token_repository=refresh_token_repository,
     )
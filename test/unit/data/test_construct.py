@@ -0,0 +1,38 @@
+from datetime import datetime, UTC, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from salary_tracker.data.construct import construct
+from salary_tracker.domain.sheet.models import RateTable, Rate, Record
+
+
+def test_construct_matches_validated_model():
+    values = dict(
+        uuid=uuid4(),
+        duration=timedelta(hours=1),
+        group_size=2,
+        group_name="Test Group",
+        happened_at=datetime(2021, 1, 1, tzinfo=UTC),
+        additional_info=None
+    )
+
+    record = construct(Record, **values)
+
+    assert record == Record(**values)
+    assert record.model_fields_set == set(values)
+    assert record.model_dump() == values
+
+
+def test_construct_rate_table_builds_lookup_lazily():
+    rates = (Rate(rate=Decimal('10.00'), group_size=2, duration=timedelta(hours=1)),)
+    values = dict(
+        uuid=uuid4(),
+        valid_from=datetime.min.replace(tzinfo=UTC),
+        valid_to=datetime.max.replace(tzinfo=UTC),
+        rates=rates
+    )
+
+    rate_table = construct(RateTable, **values)
+
+    assert rate_table.get_salary(2, timedelta(hours=1)) == Decimal('10.00')
+    assert rate_table == RateTable(**values)
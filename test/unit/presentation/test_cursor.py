@@ -0,0 +1,38 @@
+from datetime import datetime, UTC
+from uuid import uuid4
+
+import pytest
+
+from salary_tracker.domain.pagination import PageCursor
+from salary_tracker.presentation.cursor import CursorCodec
+from salary_tracker.usecase.exceptions import InvalidCursorException
+
+
+@pytest.fixture
+def cursor_codec():
+    return CursorCodec(secret="secret")
+
+
+@pytest.fixture
+def cursor():
+    return PageCursor(sort_key=[datetime(2021, 1, 1, tzinfo=UTC).isoformat(), str(uuid4())], before=True)
+
+
+def test_round_trip(cursor_codec, cursor):
+    assert cursor_codec.decode(cursor_codec.encode(cursor, "/records/"), "/records/") == cursor
+
+
+def test_other_scope_rejected(cursor_codec, cursor):
+    with pytest.raises(InvalidCursorException):
+        cursor_codec.decode(cursor_codec.encode(cursor, "/records/"), "/sheets/")
+
+
+def test_other_secret_rejected(cursor_codec, cursor):
+    with pytest.raises(InvalidCursorException):
+        CursorCodec(secret="other").decode(cursor_codec.encode(cursor, "/records/"), "/records/")
+
+
+@pytest.mark.parametrize("value", ["", "garbage", "a.b.c", "!!!.???"])
+def test_malformed_rejected(cursor_codec, value):
+    with pytest.raises(InvalidCursorException):
+        cursor_codec.decode(value, "/records/")
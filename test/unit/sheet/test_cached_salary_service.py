@@ -0,0 +1,73 @@
+from datetime import datetime, UTC, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from salary_tracker.domain.sheet.impl.cache.in_memory_salary_cache import InMemorySalaryCache
+from salary_tracker.domain.sheet.impl.service.cached_salary_service import CachedSalaryService
+from salary_tracker.domain.sheet.models import Salary
+from salary_tracker.domain.sheet.repositories import ISheetRepository
+from salary_tracker.domain.sheet.services import ISalaryService
+
+_DATETIME_FROM = datetime(2021, 1, 1, tzinfo=UTC)
+_DATETIME_TO = datetime(2021, 1, 31, tzinfo=UTC)
+
+
+@pytest.fixture
+def salary_service():
+    salary_service = AsyncMock(spec=ISalaryService)
+    salary_service.calculate_salary.return_value = Salary(
+        datetime_from=_DATETIME_FROM,
+        datetime_to=_DATETIME_TO,
+        salary=Decimal('10.00')
+    )
+    return salary_service
+
+
+@pytest.fixture
+def sheet_repository():
+    sheet_repository = AsyncMock(spec=ISheetRepository)
+    sheet_repository.get_data_version.return_value = 0
+    return sheet_repository
+
+
+@pytest.fixture
+def cached_salary_service(salary_service, sheet_repository):
+    return CachedSalaryService(
+        salary_service=salary_service,
+        sheet_repository=sheet_repository,
+        salary_cache=InMemorySalaryCache(max_size=10, ttl=timedelta(minutes=1))
+    )
+
+
+async def test_calculate_salary_cached(cached_salary_service, salary_service):
+    sheet_uuid = uuid4()
+    warsaw_offset = timezone(timedelta(hours=1))
+
+    first = await cached_salary_service.calculate_salary(sheet_uuid, _DATETIME_FROM, _DATETIME_TO)
+    second = await cached_salary_service.calculate_salary(sheet_uuid, _DATETIME_FROM.astimezone(warsaw_offset),
+                                                          _DATETIME_TO)
+
+    assert first.salary == second.salary == Decimal('10.00')
+    assert second.datetime_from.utcoffset() == timedelta(hours=1)
+    salary_service.calculate_salary.assert_awaited_once()
+
+
+async def test_calculate_salary_new_data_version(cached_salary_service, salary_service, sheet_repository):
+    sheet_uuid = uuid4()
+
+    await cached_salary_service.calculate_salary(sheet_uuid, _DATETIME_FROM, _DATETIME_TO)
+    sheet_repository.get_data_version.return_value = 1
+    await cached_salary_service.calculate_salary(sheet_uuid, _DATETIME_FROM, _DATETIME_TO)
+
+    assert salary_service.calculate_salary.await_count == 2
+
+
+async def test_calculate_salary_unknown_sheet_not_cached(cached_salary_service, salary_service, sheet_repository):
+    sheet_repository.get_data_version.return_value = None
+
+    await cached_salary_service.calculate_salary(uuid4(), _DATETIME_FROM, _DATETIME_TO)
+
+    salary_service.calculate_salary.assert_awaited_once()
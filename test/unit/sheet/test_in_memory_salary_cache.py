@@ -0,0 +1,74 @@
+from datetime import datetime, UTC, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from salary_tracker.domain.sheet.impl.cache.in_memory_salary_cache import InMemorySalaryCache
+from salary_tracker.domain.sheet.models import SalaryCacheKey, Salary
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+def _key(data_version: int = 0) -> SalaryCacheKey:
+    return SalaryCacheKey(
+        sheet_uuid=uuid4(),
+        datetime_from=datetime(2021, 1, 1, tzinfo=UTC),
+        datetime_to=datetime(2021, 1, 31, tzinfo=UTC),
+        data_version=data_version
+    )
+
+
+def _salary(key: SalaryCacheKey) -> Salary:
+    return Salary(datetime_from=key.datetime_from, datetime_to=key.datetime_to, salary=Decimal('10.00'))
+
+
+async def test_get_counts_hits_and_misses(clock):
+    cache = InMemorySalaryCache(max_size=10, ttl=timedelta(minutes=1), clock=clock)
+    key = _key()
+
+    assert await cache.get(key) is None
+    await cache.set(key, _salary(key))
+    assert await cache.get(key) == _salary(key)
+    assert await cache.get(key.model_copy(update=dict(data_version=1))) is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 1)
+
+
+async def test_get_expired(clock):
+    cache = InMemorySalaryCache(max_size=10, ttl=timedelta(minutes=1), clock=clock)
+    key = _key()
+    await cache.set(key, _salary(key))
+
+    clock.now = 59
+    assert await cache.get(key) is not None
+
+    clock.now = 60
+    assert await cache.get(key) is None
+    assert cache.stats().size == 0
+
+
+async def test_set_evicts_least_recently_used(clock):
+    cache = InMemorySalaryCache(max_size=2, ttl=timedelta(minutes=1), clock=clock)
+    first_key, second_key, third_key = _key(), _key(), _key()
+    await cache.set(first_key, _salary(first_key))
+    await cache.set(second_key, _salary(second_key))
+
+    await cache.get(first_key)
+    await cache.set(third_key, _salary(third_key))
+
+    assert await cache.get(second_key) is None
+    assert await cache.get(first_key) is not None
+    assert await cache.get(third_key) is not None
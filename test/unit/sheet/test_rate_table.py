@@ -0,0 +1,53 @@
+from datetime import datetime, UTC, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from salary_tracker.domain.exceptions import DomainException
+from salary_tracker.domain.sheet.models import RateTable, Rate
+
+
+@pytest.fixture
+def rate_table():
+    return RateTable(
+        uuid=uuid4(),
+        valid_from=datetime(2021, 1, 1, tzinfo=UTC),
+        valid_to=datetime(2022, 1, 1, tzinfo=UTC),
+        rates=[
+            Rate(rate=Decimal('10.00'), group_size=2, duration=timedelta(hours=1)),
+            Rate(rate=Decimal('25.50'), group_size=5, duration=timedelta(hours=1)),
+            Rate(rate=Decimal('30.00'), group_size=2, duration=timedelta(hours=4)),
+        ]
+    )
+
+
+@pytest.mark.parametrize("group_size, duration, expected", [
+    (2, timedelta(hours=1), Decimal('10.00')),
+    (5, timedelta(hours=1), Decimal('25.50')),
+    (2, timedelta(hours=4), Decimal('30.00')),
+])
+def test_get_salary(rate_table, group_size, duration, expected):
+    assert rate_table.get_salary(group_size, duration) == expected
+
+
+def test_get_salary_rate_not_found(rate_table):
+    with pytest.raises(DomainException):
+        rate_table.get_salary(5, timedelta(hours=4))
+
+
+def test_rates_lookup_not_serialized(rate_table):
+    assert set(rate_table.model_dump().keys()) == {"uuid", "valid_from", "valid_to", "rates"}
+
+
+def test_get_salary_after_rates_change(rate_table):
+    assert rate_table.get_salary(2, timedelta(hours=1)) == Decimal('10.00')
+
+    copied = rate_table.model_copy(update=dict(rates=(
+        Rate(rate=Decimal('12.00'), group_size=2, duration=timedelta(hours=1)),
+    )))
+    assert copied.get_salary(2, timedelta(hours=1)) == Decimal('12.00')
+    assert rate_table.get_salary(2, timedelta(hours=1)) == Decimal('10.00')
+
+    rate_table.rates = (Rate(rate=Decimal('15.00'), group_size=2, duration=timedelta(hours=1)),)
+    assert rate_table.get_salary(2, timedelta(hours=1)) == Decimal('15.00')
@@ -0,0 +1,84 @@
+from datetime import datetime, UTC, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from salary_tracker.domain.sheet.models import RateTable, Rate
+from salary_tracker.domain.sheet.repositories import IRateTableRepository
+from salary_tracker.domain.sheet.timeline import RateTableTimeline
+
+
+def _rate_table(valid_from: datetime, valid_to: datetime) -> RateTable:
+    return RateTable(
+        uuid=uuid4(),
+        valid_from=valid_from,
+        valid_to=valid_to,
+        rates=[Rate(rate=Decimal('10.00'), group_size=2, duration=timedelta(hours=1))]
+    )
+
+
+@pytest.fixture
+def rate_tables():
+    # the gap between 2021-02-01 and 2021-03-01 is not covered by any rate table
+    return [
+        _rate_table(datetime(2021, 3, 1, tzinfo=UTC), datetime.max.replace(tzinfo=UTC)),
+        _rate_table(datetime.min.replace(tzinfo=UTC), datetime(2021, 1, 1, tzinfo=UTC)),
+        _rate_table(datetime(2021, 1, 1, microsecond=1, tzinfo=UTC), datetime(2021, 2, 1, tzinfo=UTC)),
+    ]
+
+
+@pytest.fixture
+def timeline(rate_tables):
+    return RateTableTimeline(rate_tables)
+
+
+@pytest.mark.parametrize("datetime_point, expected_index", [
+    (datetime(2020, 6, 1, tzinfo=UTC), 1),
+    (datetime(2021, 1, 1, tzinfo=UTC), 1),
+    (datetime(2021, 1, 1, microsecond=1, tzinfo=UTC), 2),
+    (datetime(2021, 2, 1, tzinfo=UTC), 2),
+    (datetime(2021, 2, 15, tzinfo=UTC), None),
+    (datetime(2021, 3, 1, tzinfo=UTC), 0),
+    (datetime(2030, 1, 1, tzinfo=UTC), 0),
+])
+def test_resolve(timeline, rate_tables, datetime_point, expected_index):
+    expected = rate_tables[expected_index] if expected_index is not None else None
+
+    assert timeline.resolve(datetime_point) == expected
+
+
+def test_rate_tables_ordered(timeline, rate_tables):
+    assert timeline.rate_tables == [rate_tables[1], rate_tables[2], rate_tables[0]]
+
+
+def test_resolve_empty():
+    assert RateTableTimeline([]).resolve(datetime(2021, 1, 1, tzinfo=UTC)) is None
+
+
+def test_resolve_many(timeline, rate_tables):
+    datetime_points = [
+        datetime(2030, 1, 1, tzinfo=UTC),
+        datetime(2020, 6, 1, tzinfo=UTC),
+        datetime(2021, 2, 15, tzinfo=UTC),
+        datetime(2021, 1, 10, tzinfo=UTC),
+        datetime(2020, 6, 1, tzinfo=UTC),
+    ]
+
+    result = timeline.resolve_many(datetime_points)
+
+    assert result == [rate_tables[0], rate_tables[1], None, rate_tables[2], rate_tables[1]]
+    assert result == [timeline.resolve(datetime_point) for datetime_point in datetime_points]
+
+
+async def test_load():
+    rate_table = _rate_table(datetime.min.replace(tzinfo=UTC), datetime.max.replace(tzinfo=UTC))
+    rate_table_repository = AsyncMock(IRateTableRepository)
+    rate_table_repository.get_for_sheet.return_value = [rate_table]
+    sheet_uuid = uuid4()
+
+    timeline = await RateTableTimeline.load(rate_table_repository, sheet_uuid)
+
+    rate_table_repository.get_for_sheet.assert_awaited_once_with(sheet_uuid)
+    assert timeline.resolve(datetime(2021, 1, 1, tzinfo=UTC)) == rate_table
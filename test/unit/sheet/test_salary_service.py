@@ -0,0 +1,85 @@
+from datetime import datetime, UTC, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, call
+from uuid import uuid4
+
+import pytest
+
+from salary_tracker.domain.exceptions import RateNotFoundDomainException
+from salary_tracker.domain.sheet.impl.service.salary_service import SalaryService
+from salary_tracker.domain.sheet.models import SalaryCalculation, SalarySummary
+from salary_tracker.domain.sheet.repositories import ISheetRepository, ISalaryRepository
+
+
+@pytest.fixture
+def salary_repository():
+    salary_repository = AsyncMock(spec=ISalaryRepository)
+    salary_repository.get_salary.return_value = SalaryCalculation(salary=Decimal('1.00'), unpriced_record_uuids=[])
+    salary_repository.get_salary_summary.return_value = SalarySummary(salary=Decimal('100.00'),
+                                                                      unpriced_records_count=0)
+    return salary_repository
+
+
+@pytest.fixture
+def salary_service(salary_repository):
+    return SalaryService(sheet_repository=AsyncMock(spec=ISheetRepository), salary_repository=salary_repository)
+
+
+async def test_calculate_salary_reads_full_months_from_summary(salary_service, salary_repository):
+    sheet_uuid = uuid4()
+
+    result = await salary_service.calculate_salary(
+        sheet_uuid,
+        datetime(2021, 1, 15, tzinfo=UTC),
+        datetime(2021, 12, 15, tzinfo=UTC)
+    )
+
+    assert result.salary == Decimal('102.00')
+    salary_repository.get_salary_summary.assert_awaited_once_with(
+        sheet_uuid,
+        datetime(2021, 2, 1, tzinfo=UTC),
+        datetime(2021, 12, 1, tzinfo=UTC)
+    )
+    assert salary_repository.get_salary.await_args_list == [
+        call(sheet_uuid, datetime(2021, 1, 15, tzinfo=UTC), datetime(2021, 2, 1, tzinfo=UTC) - timedelta(microseconds=1)),
+        call(sheet_uuid, datetime(2021, 12, 1, tzinfo=UTC), datetime(2021, 12, 15, tzinfo=UTC)),
+    ]
+
+
+async def test_calculate_salary_whole_months_skip_scan(salary_service, salary_repository):
+    result = await salary_service.calculate_salary(
+        uuid4(),
+        datetime(2021, 1, 1, tzinfo=UTC),
+        datetime(2022, 1, 1, tzinfo=UTC) - timedelta(microseconds=1)
+    )
+
+    assert result.salary == Decimal('100.00')
+    salary_repository.get_salary.assert_not_awaited()
+
+
+async def test_calculate_salary_within_month_scans_records(salary_service, salary_repository):
+    result = await salary_service.calculate_salary(
+        uuid4(),
+        datetime(2021, 1, 2, tzinfo=UTC),
+        datetime(2021, 1, 30, tzinfo=UTC)
+    )
+
+    assert result.salary == Decimal('1.00')
+    salary_repository.get_salary_summary.assert_not_awaited()
+
+
+async def test_calculate_salary_unpriced_records_in_summary(salary_service, salary_repository):
+    unpriced_record_uuid = uuid4()
+    salary_repository.get_salary_summary.return_value = SalarySummary(salary=Decimal('100.00'),
+                                                                      unpriced_records_count=1)
+    salary_repository.get_salary.return_value = SalaryCalculation(salary=Decimal('100.00'),
+                                                                  unpriced_record_uuids=[unpriced_record_uuid])
+
+    with pytest.raises(RateNotFoundDomainException) as exc_info:
+        await salary_service.calculate_salary(
+            uuid4(),
+            datetime(2021, 1, 1, tzinfo=UTC),
+            datetime(2021, 12, 31, tzinfo=UTC)
+        )
+
+    assert exc_info.value.record_uuids == [unpriced_record_uuid]
@@ -0,0 +1,67 @@
+from datetime import timedelta, datetime, UTC
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from salary_tracker.domain.exceptions import ModelValidationDomainException
+from salary_tracker.domain.sheet.impl.service.sheet_record_service import SheetRecordService
+from salary_tracker.domain.sheet.models import Sheet, NewRecordData
+from salary_tracker.domain.sheet.repositories import ISheetRecordRepository, ISheetRepository
+
+
+@pytest.fixture
+def sheet():
+    return Sheet(
+        uuid=uuid4(),
+        owner_user_uuid=uuid4(),
+        title="Test Sheet",
+        description="Test Description",
+        durations={timedelta(hours=1)},
+        group_sizes={2, 5}
+    )
+
+
+@pytest.fixture
+def sheet_repository(sheet):
+    sheet_repository = AsyncMock(spec=ISheetRepository)
+    sheet_repository.get_by_uuid.return_value = sheet
+    return sheet_repository
+
+
+@pytest.fixture
+def sheet_record_repository():
+    sheet_record_repository = AsyncMock(spec=ISheetRecordRepository)
+    sheet_record_repository.add_many.side_effect = lambda sheet_uuid, records: records
+    return sheet_record_repository
+
+
+@pytest.fixture
+def sheet_record_service(sheet_record_repository, sheet_repository):
+    return SheetRecordService(sheet_record_repository=sheet_record_repository, sheet_repository=sheet_repository)
+
+
+def _new_record_data(group_size: int) -> NewRecordData:
+    return NewRecordData(
+        duration=timedelta(hours=1),
+        group_size=group_size,
+        group_name="Test Group",
+        happened_at=datetime(2021, 1, 1, tzinfo=UTC),
+        additional_info=None
+    )
+
+
+async def test_create_many(sheet_record_service, sheet_record_repository, sheet_repository, sheet):
+    records = await sheet_record_service.create_many(sheet.uuid, [_new_record_data(2), _new_record_data(5)])
+
+    assert [record.group_size for record in records] == [2, 5]
+    assert len({record.uuid for record in records}) == 2
+    sheet_repository.get_by_uuid.assert_awaited_once_with(sheet.uuid)
+    sheet_record_repository.add_many.assert_awaited_once_with(sheet.uuid, records)
+
+
+async def test_create_many_rejects_whole_batch(sheet_record_service, sheet_record_repository, sheet):
+    with pytest.raises(ModelValidationDomainException, match="Record 1: .*Group size 3"):
+        await sheet_record_service.create_many(sheet.uuid, [_new_record_data(2), _new_record_data(3)])
+
+    sheet_record_repository.add_many.assert_not_awaited()
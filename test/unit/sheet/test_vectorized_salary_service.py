@@ -0,0 +1,129 @@
+import random
+from datetime import datetime, UTC, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+# the vectorized engine is optional, see requirements-vectorized.txt
+pytest.importorskip("numpy")
+
+from salary_tracker.domain.exceptions import DomainException
+from salary_tracker.domain.sheet.impl.service.vectorized_salary_service import price_record_columns, \
+    VectorizedSalaryService
+from salary_tracker.domain.sheet.models import RateTable, Rate, RecordColumns, SalarySummary
+from salary_tracker.domain.sheet.repositories import ISheetRepository, ISalaryRepository, IRateTableRepository
+from salary_tracker.domain.sheet.timeline import RateTableTimeline
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _rate_table(valid_from: datetime, valid_to: datetime, rates: dict[tuple[int, timedelta], str]) -> RateTable:
+    return RateTable(
+        uuid=uuid4(),
+        valid_from=valid_from,
+        valid_to=valid_to,
+        rates=[
+            Rate(rate=Decimal(rate), group_size=group_size, duration=duration)
+            for (group_size, duration), rate in rates.items()
+        ]
+    )
+
+
+def _microseconds(value: timedelta) -> int:
+    return value // timedelta(microseconds=1)
+
+
+def test_price_record_columns_matches_rate_tables():
+    rate_tables = [
+        _rate_table(datetime(2021, 2, 1, tzinfo=UTC), datetime.max.replace(tzinfo=UTC), {
+            (2, timedelta(hours=1)): '15.55',
+            (5, timedelta(hours=4)): '99.99',
+        }),
+        # the gap between 2021-01-15 and 2021-02-01 is not covered by any rate table
+        _rate_table(datetime.min.replace(tzinfo=UTC), datetime(2021, 1, 15, tzinfo=UTC), {
+            (2, timedelta(hours=1)): '10.01',
+            (3, timedelta(hours=1)): '12.00',
+        }),
+    ]
+    timeline = RateTableTimeline(rate_tables)
+
+    random.seed(7)
+    happened_at, group_sizes, durations = [], [], []
+    expected_salary, expected_unpriced = Decimal(0), 0
+    for _ in range(2000):
+        record_happened_at = datetime(2020, 12, 1, tzinfo=UTC) + timedelta(minutes=random.randrange(60 * 24 * 120))
+        group_size = random.choice([2, 3, 5, 7])
+        duration = random.choice([timedelta(hours=1), timedelta(hours=4)])
+
+        happened_at.append(_microseconds(record_happened_at - _EPOCH))
+        group_sizes.append(group_size)
+        durations.append(_microseconds(duration))
+
+        rate_table = timeline.resolve(record_happened_at)
+        try:
+            expected_salary += rate_table.get_salary(group_size, duration)
+        except (AttributeError, DomainException):
+            expected_unpriced += 1
+
+    result = price_record_columns(timeline, RecordColumns(
+        happened_at=happened_at,
+        group_sizes=group_sizes,
+        durations=durations
+    ))
+
+    assert expected_unpriced > 0
+    assert result.salary == expected_salary
+    assert result.unpriced_records_count == expected_unpriced
+
+
+def test_price_record_columns_inclusive_bounds():
+    valid_to = datetime(2021, 1, 15, tzinfo=UTC)
+    rate_tables = [_rate_table(datetime(2021, 1, 1, tzinfo=UTC), valid_to, {(2, timedelta(hours=1)): '10.00'})]
+
+    result = price_record_columns(RateTableTimeline(rate_tables), RecordColumns(
+        happened_at=[_microseconds(valid_to - _EPOCH), _microseconds(valid_to - _EPOCH) + 1],
+        group_sizes=[2, 2],
+        durations=[_microseconds(timedelta(hours=1))] * 2
+    ))
+
+    assert result.salary == Decimal('10.00')
+    assert result.unpriced_records_count == 1
+
+
+def test_price_record_columns_no_records():
+    result = price_record_columns(RateTableTimeline([]), RecordColumns(happened_at=[], group_sizes=[], durations=[]))
+
+    assert result.salary == Decimal(0)
+    assert result.unpriced_records_count == 0
+
+
+async def test_calculate_salary_loads_rate_tables_once():
+    sheet_repository = AsyncMock(spec=ISheetRepository)
+    sheet_repository.get_by_uuid.return_value = MagicMock()
+    salary_repository = AsyncMock(spec=ISalaryRepository)
+    salary_repository.get_salary_summary.return_value = SalarySummary(salary=Decimal('5.00'), unpriced_records_count=0)
+    salary_repository.get_record_columns.return_value = RecordColumns(
+        happened_at=[_microseconds(datetime(2021, 1, 20, tzinfo=UTC) - _EPOCH)],
+        group_sizes=[2],
+        durations=[_microseconds(timedelta(hours=1))]
+    )
+    rate_table_repository = AsyncMock(spec=IRateTableRepository)
+    rate_table_repository.get_for_sheet.return_value = [_rate_table(
+        datetime.min.replace(tzinfo=UTC), datetime.max.replace(tzinfo=UTC), {(2, timedelta(hours=1)): '10.00'}
+    )]
+    salary_service = VectorizedSalaryService(
+        sheet_repository=sheet_repository,
+        salary_repository=salary_repository,
+        rate_table_repository=rate_table_repository
+    )
+
+    # a full February between two partial months
+    result = await salary_service.calculate_salary(
+        uuid4(), datetime(2021, 1, 15, tzinfo=UTC), datetime(2021, 3, 15, tzinfo=UTC)
+    )
+
+    assert result.salary == Decimal('25.00')
+    assert salary_repository.get_record_columns.await_count == 2
+    rate_table_repository.get_for_sheet.assert_awaited_once()